@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark how many bus events per second adaptive_lighting keeps up with.
+
+Starts a bare Home Assistant core with adaptive_lighting's manager listening,
+registers switches that each control a slice of the lights, and then fires
+state changes and service call events for --entities entities, most of which
+are not lights. The rate is the number of events fired divided by the time
+until the bus is idle again, with and without the manager listening.
+
+Usage: python benchmarks/bench_adaptive_lighting_events.py [--entities 500]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR / "config"))
+
+DEFAULT_ENTITIES = 500
+DEFAULT_EVENTS = 20000
+LIGHT_RATIO = 0.2
+LIGHTS_PER_SWITCH = 10
+OTHER_DOMAINS = ("sensor", "binary_sensor", "switch")
+
+
+def entity_ids(count: int):
+    """Get the benchmark's light and other entity IDs."""
+    lights = [f"light.bench_{i}" for i in range(int(count * LIGHT_RATIO))]
+    others = [
+        f"{OTHER_DOMAINS[i % len(OTHER_DOMAINS)]}.bench_{i}"
+        for i in range(count - len(lights))
+    ]
+    return lights, others
+
+
+async def fire_events(hass, lights, others, events: int) -> float:
+    """Fire state changes and service calls, and get events per second."""
+    from homeassistant.const import EVENT_CALL_SERVICE
+
+    entities = lights + others
+    start = time.perf_counter()
+    for i in range(events):
+        entity_id = entities[i % len(entities)]
+        domain = entity_id.split(".", 1)[0]
+        if i % 10 == 0:
+            # Mostly service calls for entities we don't control
+            hass.bus.async_fire(
+                EVENT_CALL_SERVICE,
+                {
+                    "domain": domain,
+                    "service": "turn_on",
+                    "service_data": {"entity_id": entity_id},
+                },
+            )
+        elif domain == "light":
+            # Lights stay on, turning them off and on would wait for
+            # TURNING_OFF_DELAY in AdaptiveLightingManager.just_turned_off
+            hass.states.async_set(entity_id, "on", {"brightness": i % 255})
+        else:
+            hass.states.async_set(entity_id, str(i))
+        if i % 1000 == 999:
+            await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    return events / (time.perf_counter() - start)
+
+
+async def run(entities: int, events: int):
+    """Measure the event rate with and without the manager listening."""
+    from custom_components.adaptive_lighting.const import (
+        ATTR_ADAPTIVE_LIGHTING_MANAGER,
+        DOMAIN,
+    )
+    from custom_components.adaptive_lighting.switch import AdaptiveLightingManager
+    from homeassistant.core import HomeAssistant
+
+    lights, others = entity_ids(entities)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            baseline = await fire_events(hass, lights, others, events)
+
+            manager = AdaptiveLightingManager(hass)
+            hass.data[DOMAIN] = {ATTR_ADAPTIVE_LIGHTING_MANAGER: manager}
+            manager.lights.update(lights)
+            for index in range(0, len(lights), LIGHTS_PER_SWITCH):
+                # Switches that are off, so no light gets adapted
+                switch = SimpleNamespace(name=f"bench_{index}", is_on=False)
+                manager.set_switch_lights(
+                    switch, lights[index : index + LIGHTS_PER_SWITCH]
+                )
+            listening = await fire_events(hass, lights, others, events)
+            manager.disable()
+        finally:
+            await hass.async_stop(force=True)
+
+    print(f"{len(lights)} lights and {len(others)} other entities, {events} events:")
+    print(f"  {'bus only':28} {baseline:10.0f} events/s")
+    print(f"  {'with adaptive_lighting':28} {listening:10.0f} events/s")
+
+
+def main():
+    """Run the event benchmark from command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=DEFAULT_ENTITIES)
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("homeassistant") is None:
+        print("❌ This benchmark needs homeassistant installed")
+        return 1
+    asyncio.run(run(args.entities, args.events))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Benchmark reading enphase_envoy's sensor values from Envoy payloads.
+
+Serves the payloads in benchmarks/fixtures/enphase_envoy, those of a metered
+three-phase Envoy with batteries, to a real EnvoyReader through an in-memory
+httpx transport. After model detection each poll replaces the responses with
+new ones, as a fetch does, and times how the coordinator gets the sensor
+values from them:
+
+  accessors  awaiting an accessor per sensor, as the coordinator used to
+  extract    one EnvoyReader.extract pass with the compiled extraction plan
+
+Both ways must give the coordinator the same data, which is checked before
+timing. The json decodes per poll are counted too. Pass --reader with an older
+envoy_reader.py, e.g. from 'git show', to time its accessors.
+
+Usage: python benchmarks/bench_envoy_extraction.py [--polls 2000]
+"""
+
+import argparse
+import ast
+import asyncio
+import importlib.util
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+COMPONENT_DIR = REPO_DIR / "config/custom_components/enphase_envoy"
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures/enphase_envoy"
+
+DEFAULT_POLLS = 2000
+
+# Envoy paths and the fixture served for them, other paths get a 404
+ROUTES = {
+    "/info": "info.xml",
+    "/info.xml": "info.xml",
+    "/production.json": "production.json",
+    "/api/v1/production": "production_v1.json",
+    "/api/v1/production/inverters": "inverters.json",
+    "/ivp/meters": "meters.json",
+    "/ivp/meters/reports": "meters_reports.json",
+    "/ivp/meters/readings": "meters_readings.json",
+    "/ivp/ensemble/inventory": "ensemble_inventory.json",
+    "/home.json": "home.json",
+}
+
+# Battery totals are calculated by the sensors from the batteries
+NOT_FETCHED_KEYS = ("current_battery_capacity", "total_battery_percentage")
+
+# Marks a value missing from one way's data when comparing them
+MISSING = object()
+
+
+def load_reader_module(path: Path):
+    """Load envoy_reader.py without the integration's package."""
+    spec = importlib.util.spec_from_file_location("envoy_reader", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def sensor_keys():
+    """Get the keys of SENSORS and PHASE_SENSORS without importing homeassistant."""
+    tree = ast.parse((COMPONENT_DIR / "const.py").read_text())
+    keys = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or not isinstance(
+            node.targets[0], ast.Name
+        ):
+            continue
+        name = node.targets[0].id
+        if name in ("SENSORS", "PHASE_SENSORS"):
+            keys[name] = [
+                keyword.value.value
+                for call in node.value.elts
+                for keyword in call.keywords
+                if keyword.arg == "key"
+            ]
+    return keys["SENSORS"], keys["PHASE_SENSORS"]
+
+
+def extracted_keys(sensors, phase_sensors):
+    """Get the keys read with EnvoyReader.extract, like the coordinator."""
+    return (
+        [
+            key
+            for key in sensors
+            if key not in ("inverters", "batteries") + NOT_FETCHED_KEYS
+        ]
+        + phase_sensors
+        + ["grid_status", "inverters_production", "battery_storage", "envoy_info"]
+    )
+
+
+def batteries_by_serial(battery_data) -> dict:
+    """Key the batteries by serial number, as the coordinator stores them."""
+    if not isinstance(battery_data, list) or not battery_data:
+        return {}
+    return {"batteries": {item["serial_num"]: item for item in battery_data}}
+
+
+async def read_with_accessors(reader, sensors, phase_sensors):
+    """Get the values by awaiting an accessor per sensor."""
+    data = {}
+    for key in sensors:
+        if key == "inverters":
+            data["inverters_production"] = await reader.inverters_production()
+        elif key == "batteries":
+            data.update(batteries_by_serial(await reader.battery_storage()))
+        elif key not in NOT_FETCHED_KEYS:
+            data[key] = await getattr(reader, key)()
+    for key in phase_sensors:
+        data[key] = await getattr(reader, key[:-3])(key[-2:].lower())
+    data["grid_status"] = await reader.grid_status()
+    data["envoy_info"] = await reader.envoy_info()
+    return data
+
+
+async def read_with_extract(reader, keys):
+    """Get the values in one pass over the extraction plan."""
+    data = reader.extract(keys)
+    data.update(batteries_by_serial(data.pop("battery_storage")))
+    return data
+
+
+def refresh_responses(httpx, reader) -> None:
+    """Replace the reader's responses with new ones, as a poll does."""
+    for attr, value in vars(reader).items():
+        if attr.startswith("endpoint_") and isinstance(value, httpx.Response):
+            response = httpx.Response(
+                value.status_code,
+                content=value.content,
+                headers=value.headers,
+                request=value.request,
+            )
+            setattr(reader, attr, response)
+
+
+def percentiles(samples: list) -> dict:
+    """Get the mean, median and 95th percentile in microseconds."""
+    samples = sorted(samples)
+    return {
+        "mean_us": round(statistics.fmean(samples) * 1e6, 1),
+        "p50_us": round(samples[len(samples) // 2] * 1e6, 1),
+        "p95_us": round(samples[int(len(samples) * 0.95)] * 1e6, 1),
+    }
+
+
+async def run(reader_path: Path, polls: int) -> dict:
+    """Detect the model from the fixtures and time each way of reading values."""
+    import httpx
+
+    envoy_reader = load_reader_module(reader_path)
+
+    def serve(request):
+        fixture = ROUTES.get(request.url.path)
+        if fixture is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=(FIXTURES_DIR / fixture).read_bytes())
+
+    class FixtureClient(httpx.AsyncClient):
+        """Client that serves the fixtures, whoever creates it."""
+
+        def __init__(self, **kwargs):
+            super().__init__(**{**kwargs, "transport": httpx.MockTransport(serve)})
+
+    decodes = [0]
+    response_json = httpx.Response.json
+
+    def counting_json(self, **kwargs):
+        decodes[0] += 1
+        return response_json(self, **kwargs)
+
+    sensors, phase_sensors = sensor_keys()
+    keys = extracted_keys(sensors, phase_sensors)
+    ways = {
+        "accessors": lambda reader: read_with_accessors(reader, sensors, phase_sensors)
+    }
+    if hasattr(envoy_reader.EnvoyReader, "extract"):
+        ways["extract"] = lambda reader: read_with_extract(reader, keys)
+
+    result = {"reader": str(reader_path), "polls": polls, "sensors": len(keys)}
+    # Each reader creates its own clients: older readers open and close a
+    # client per request, so they cannot share one
+    with (
+        patch.object(httpx, "AsyncClient", FixtureClient),
+        patch.object(httpx.Response, "json", counting_json),
+    ):
+        readers = {}
+        values = {}
+        for name, read in ways.items():
+            reader = envoy_reader.EnvoyReader(
+                "envoy.local", password="123456", inverters=True
+            )
+            await reader.getData()
+            readers[name] = reader
+            values[name] = await read(reader)
+
+        # Timing is only meaningful if every way gets the coordinator the same data
+        expected = values["accessors"]
+        for name, data in values.items():
+            differing = sorted(
+                key
+                for key in expected.keys() | data.keys()
+                if expected.get(key, MISSING) != data.get(key, MISSING)
+            )
+            if differing:
+                raise ValueError(
+                    f"{name} values differ from accessors for: {', '.join(differing)}"
+                )
+
+        for name, read in ways.items():
+            reader = readers[name]
+            timings = []
+            decodes[0] = 0
+            for _ in range(polls):
+                refresh_responses(httpx, reader)
+                start = time.perf_counter()
+                await read(reader)
+                timings.append(time.perf_counter() - start)
+            result[name] = {
+                **percentiles(timings),
+                "json_decodes_per_poll": round(decodes[0] / polls, 1),
+            }
+            result["model"] = reader.endpoint_type
+            if hasattr(reader, "close"):
+                await reader.close()
+    return result
+
+
+def print_report(result: dict) -> None:
+    """Print the measurements."""
+    print(
+        f"{result['sensors']} values from model {result['model']}"
+        f" payloads, {result['polls']} polls:",
+    )
+    for name in ("accessors", "extract"):
+        if name not in result:
+            continue
+        stats = result[name]
+        print(
+            f"  {name:10} mean {stats['mean_us']:9.1f} us"
+            f"  p50 {stats['p50_us']:9.1f} us  p95 {stats['p95_us']:9.1f} us"
+            f"  {stats['json_decodes_per_poll']:5.1f} json decodes",
+        )
+
+
+def main():
+    """Run the extraction benchmark from command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=DEFAULT_POLLS)
+    parser.add_argument(
+        "--reader",
+        type=Path,
+        default=COMPONENT_DIR / "envoy_reader.py",
+        help="envoy_reader.py to benchmark",
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON instead")
+    args = parser.parse_args()
+
+    missing = [
+        name
+        for name in ("httpx", "jwt", "xmltodict", "envoy_utils")
+        if importlib.util.find_spec(name) is None
+    ]
+    if missing:
+        print(f"❌ This benchmark needs {', '.join(missing)} installed")
+        return 1
+    try:
+        result = asyncio.run(run(args.reader, args.polls))
+    except ValueError as err:
+        print(f"❌ {err}")
+        return 1
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
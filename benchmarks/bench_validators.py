@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Benchmark the validators on synthetic configs of increasing size.
+
+Generates configs with 100, 1k and 10k automations (see synthetic_config.py)
+and times each validator in tools/ on them, plus the parse, extract and lookup
+stages of reference validation on their own. Each timing is the best of
+--rounds runs on a fresh validator. Results are written as JSON, keyed by
+commit, so runs can be compared with --compare to spot regressions.
+
+Usage: python benchmarks/bench_validators.py [--sizes 100 1000] [--rounds N]
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from benchmarks.synthetic_config import generate_config, yaml_files  # noqa: E402
+from tools.ha_config_validator import HAConfigValidator  # noqa: E402
+from tools.ha_official_validator import HAOfficialValidator  # noqa: E402
+from tools.reference_validator import ReferenceValidator  # noqa: E402
+from tools.registry_index import RegistryIndex  # noqa: E402
+from tools.yaml_cache import YAMLCache  # noqa: E402
+from tools.yaml_loader import LIBYAML_AVAILABLE, HAYamlLoader  # noqa: E402
+from tools.yaml_validator import YAMLValidator  # noqa: E402
+
+DEFAULT_SIZES = (100, 1000, 10000)
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def best_of(rounds: int, setup: Callable[[], Any], run: Callable[[Any], Any]):
+    """Get the best wall time of run(setup()) over rounds, and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(rounds):
+        state = setup()
+        start = time.perf_counter()
+        result = run(state)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark_size(config_dir: Path, rounds: int) -> Dict[str, Any]:
+    """Time every validator and stage on one generated config."""
+    timings: Dict[str, float] = {}
+    passed: Dict[str, bool] = {}
+    config = str(config_dir)
+    storage_dir = config_dir / ".storage"
+
+    # Includes the !include_dir_* trees, which the validators don't discover
+    all_files = yaml_files(config_dir)
+
+    def record(name: str, seconds: float, ok: Optional[bool] = None):
+        timings[name] = round(seconds, 6)
+        if ok is not None:
+            passed[name] = bool(ok)
+
+    # Whole validators, cold: every file parsed from scratch
+    seconds, ok = best_of(
+        rounds, lambda: YAMLValidator(config), lambda v: v.validate_all(files=all_files)
+    )
+    record("yaml_validator", seconds, ok)
+
+    seconds, ok = best_of(
+        rounds,
+        lambda: ReferenceValidator(config),
+        lambda v: v.validate_all(files=all_files),
+    )
+    record("reference_validator", seconds, ok)
+
+    # Warm: parse trees and references come from the on-disk cache
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ReferenceValidator(config, cache=YAMLCache(Path(cache_dir))).validate_all(
+            files=all_files
+        )
+        seconds, ok = best_of(
+            rounds,
+            lambda: ReferenceValidator(config, cache=YAMLCache(Path(cache_dir))),
+            lambda v: v.validate_all(files=all_files),
+        )
+        record("reference_validator_cached", seconds, ok)
+
+    seconds, ok = best_of(
+        rounds, lambda: HAConfigValidator(config), lambda v: v.run_basic_validation()
+    )
+    record("ha_config_validator_basic", seconds, ok)
+
+    if importlib.util.find_spec("homeassistant") is not None:
+        seconds, ok = best_of(
+            1, lambda: HAOfficialValidator(config), lambda v: v.validate_all()
+        )
+        record("ha_official_validator", seconds, ok)
+
+    # Stages of reference validation
+    seconds, index = best_of(
+        rounds, lambda: None, lambda _: RegistryIndex.load(storage_dir)
+    )
+    record("stage_registry_load", seconds)
+
+    files = [path for path in all_files if path.name != "secrets.yaml"]
+
+    def parse(_state):
+        trees = {}
+        for path in files:
+            with open(path, "r", encoding="utf-8") as f:
+                trees[path] = yaml.load(f, Loader=HAYamlLoader)
+        return trees
+
+    seconds, trees = best_of(rounds, lambda: None, parse)
+    record("stage_parse", seconds)
+
+    def extract(validator):
+        return {path: validator.collect_references(t) for path, t in trees.items()}
+
+    seconds, refs = best_of(rounds, lambda: ReferenceValidator(config), extract)
+    record("stage_extract", seconds)
+
+    def lookup(validator):
+        return all(
+            validator.check_file_references(path, file_refs)
+            for path, file_refs in refs.items()
+        )
+
+    seconds, ok = best_of(
+        rounds, lambda: ReferenceValidator(config, registry_index=index), lookup
+    )
+    record("stage_lookup", seconds, ok)
+
+    return {
+        "yaml_files": len(files),
+        "yaml_bytes": sum(path.stat().st_size for path in files),
+        "references": sum(
+            len(file_refs.entities) + len(file_refs.entity_registry_ids)
+            for file_refs in refs.values()
+        ),
+        "timings": timings,
+        "passed": passed,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Get the current commit, if running from a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_DIR,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def print_comparison(results: Dict[str, Any], baseline: Dict[str, Any]):
+    """Print how each timing changed relative to a baseline results file."""
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'}:")
+    for size, current in results["sizes"].items():
+        previous = baseline.get("sizes", {}).get(size)
+        if previous is None:
+            continue
+        print(f"  {size} automations:")
+        for name, seconds in current["timings"].items():
+            before = previous["timings"].get(name)
+            if not before:
+                continue
+            change = (seconds - before) / before * 100
+            print(
+                f"    {name:28} {before * 1000:9.1f} ms -> "
+                f"{seconds * 1000:9.1f} ms ({change:+.0f}%)"
+            )
+
+
+def main():
+    """Run the validator benchmarks from command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Numbers of automations to generate",
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Results file (default: benchmarks/results/<commit>.json)",
+    )
+    parser.add_argument("--compare", type=Path, help="Earlier results file")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    results: Dict[str, Any] = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "libyaml": LIBYAML_AVAILABLE,
+        "rounds": args.rounds,
+        "sizes": {},
+    }
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_dir = generate_config(Path(temp_dir) / "config", size)
+            result = benchmark_size(config_dir, args.rounds)
+        results["sizes"][str(size)] = result
+
+        print(
+            f"{size} automations ({result['yaml_files']} files, "
+            f"{result['yaml_bytes'] / 1024:.0f} KiB):"
+        )
+        for name, seconds in result["timings"].items():
+            status = ""
+            if name in result["passed"]:
+                status = "" if result["passed"][name] else "  (failed)"
+            print(f"  {name:28} {seconds * 1000:9.1f} ms{status}")
+
+    output = args.output or RESULTS_DIR / f"{commit or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(results, json.load(f))
+
+    failed: List[str] = [
+        f"{size}: {name}"
+        for size, result in results["sizes"].items()
+        for name, ok in result["passed"].items()
+        if not ok
+    ]
+    if failed:
+        print(f"\n❌ Validators failed on the synthetic config: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark the libyaml-backed HA loader against the pure-Python loader.
+
+Parses every YAML file in the config directory with both loaders, checks the
+trees are identical and reports the speedup.
+
+Usage: python benchmarks/bench_yaml_loader.py [config_dir] [--rounds N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.yaml_loader import (  # noqa: E402
+    LIBYAML_AVAILABLE,
+    HAYamlLoader,
+    PureHAYamlLoader,
+)
+
+
+def load_documents(config_dir: Path) -> Dict[Path, str]:
+    """Read every parseable YAML file below the config directory."""
+    documents = {}
+    for pattern in ("*.yaml", "*.yml"):
+        for path in sorted(config_dir.rglob(pattern)):
+            text = path.read_text(encoding="utf-8")
+            try:
+                yaml.load(text, Loader=PureHAYamlLoader)
+            except yaml.YAMLError:
+                continue
+            documents[path] = text
+    return documents
+
+
+def time_loader(documents: Dict[Path, str], loader, rounds: int) -> float:
+    """Get the best wall time over rounds for parsing all documents."""
+    timings: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in documents.values():
+            yaml.load(text, Loader=loader)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Run the loader benchmark from command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("config_dir", nargs="?", default="config")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    if not LIBYAML_AVAILABLE:
+        print("PyYAML was built without libyaml; nothing to compare.")
+        return 1
+
+    documents = load_documents(Path(args.config_dir))
+    total_bytes = sum(len(text.encode("utf-8")) for text in documents.values())
+
+    for path, text in documents.items():
+        fast = yaml.load(text, Loader=HAYamlLoader)
+        if fast != yaml.load(text, Loader=PureHAYamlLoader):
+            print(f"❌ Parsed trees differ for {path}")
+            return 1
+
+    pure_time = time_loader(documents, PureHAYamlLoader, args.rounds)
+    fast_time = time_loader(documents, HAYamlLoader, args.rounds)
+
+    print(f"Files: {len(documents)} ({total_bytes / 1024:.1f} KiB)")
+    print(f"Pure-Python SafeLoader: {pure_time * 1000:.1f} ms")
+    print(f"libyaml CSafeLoader:    {fast_time * 1000:.1f} ms")
+    print(f"Speedup: {pure_time / fast_time:.1f}x (identical trees)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
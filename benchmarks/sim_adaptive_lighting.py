@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""Simulate a day of adaptive_lighting without a running Home Assistant.
+
+Drives the real AdaptiveLightingManager, AdaptiveSwitch, SunLightSettings and
+prepare_adaptation_data against an in-memory state machine, event bus and
+service registry. A synthetic day of 'light.turn_on', 'light.turn_off' and
+manual brightness changes is replayed for --lights lights split over
+--switches switches, on a clock that jumps --step seconds per interval tick.
+
+Reports the service calls made, the CPU time of each interval tick and the
+latency from firing an event until the manager's listeners handled it. Run it
+before and after a scaling change to compare.
+
+Usage: python benchmarks/sim_adaptive_lighting.py [--lights 100] [--switches 10]
+"""
+
+import argparse
+import asyncio
+import datetime
+import importlib.util
+import inspect
+import json
+import random
+import statistics
+import sys
+import time
+import zoneinfo
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR / "config"))
+
+DEFAULT_LIGHTS = 100
+DEFAULT_SWITCHES = 10
+DEFAULT_STEP = 90  # seconds, adaptive_lighting's default interval
+DEFAULT_EVENTS_PER_LIGHT = 8  # per simulated day
+MANUAL_CHANGE_RATIO = 0.3  # of the events for lights that are on
+COLOR_LIGHT_RATIO = 0.5
+TOGGLE_RATIO = 0.1  # of the events that turn a light on
+
+# 'transition' would start real-time timers that keep the accelerated interval
+# ticks from adapting, so the simulated switches adapt instantly
+SWITCH_CONFIG = {
+    "transition": 0,
+    "initial_transition": 0,
+    "send_split_delay": 0,
+    "instrumentation": True,
+}
+
+# Origins of adaptive_lighting's contexts that are reported separately
+CONTEXT_ORIGINS = ("interval", "intercept", "skipped", "turn_on")
+
+
+class SimClock:
+    """Simulated UTC time that only moves when advanced."""
+
+    def __init__(self, start: datetime.datetime) -> None:
+        """Start the clock at 'start'."""
+        self.now = start
+
+    def utcnow(self) -> datetime.datetime:
+        """Get the simulated time."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self.now += datetime.timedelta(seconds=seconds)
+
+
+class SimEvent:
+    """Event with the attributes the manager reads."""
+
+    def __init__(self, event_type, data, context, time_fired) -> None:
+        """Initialize the event."""
+        self.event_type = event_type
+        self.data = data
+        self.context = context
+        self.time_fired = time_fired
+
+
+class SimBus:
+    """Event bus that runs listeners as tasks and times how long they take."""
+
+    def __init__(self, hass) -> None:
+        """Initialize without listeners."""
+        self.hass = hass
+        self.listeners: dict[str, list[tuple]] = {}
+        self.latencies: list[float] = []
+        self.fired = Counter()
+
+    def async_listen(self, event_type, listener, event_filter=None):
+        """Listen to 'event_type', if 'event_filter' passes."""
+        entry = (listener, event_filter)
+        self.listeners.setdefault(event_type, []).append(entry)
+        return lambda: self.listeners[event_type].remove(entry)
+
+    def async_fire(self, event_type, event_data=None, origin=None, context=None):
+        """Fire an event and schedule the listeners it passes."""
+        from homeassistant.core import Context
+
+        self.fired[event_type] += 1
+        event = SimEvent(
+            event_type,
+            event_data or {},
+            context or Context(),
+            self.hass.clock.utcnow(),
+        )
+        fired = time.perf_counter()
+        for listener, event_filter in self.listeners.get(event_type, ()):
+            if event_filter is not None and not event_filter(event.data):
+                continue
+            if inspect.iscoroutinefunction(listener):
+                self.hass.async_create_task(self._run(listener, event, fired))
+            else:
+                listener(event)
+
+    async def _run(self, listener, event, fired: float) -> None:
+        await listener(event)
+        self.latencies.append(time.perf_counter() - fired)
+
+
+class SimStates:
+    """State machine that fires 'state_changed' events."""
+
+    def __init__(self, hass) -> None:
+        """Initialize without states."""
+        self.hass = hass
+        self.states = {}
+
+    def get(self, entity_id):
+        """Get the state of 'entity_id' or None."""
+        return self.states.get(entity_id)
+
+    def is_state(self, entity_id, state) -> bool:
+        """Check the state of 'entity_id'."""
+        current = self.states.get(entity_id)
+        return current is not None and current.state == state
+
+    def async_all(self, domain_filter=None):
+        """Get all states, optionally of one domain."""
+        return [
+            state
+            for state in self.states.values()
+            if domain_filter is None or state.domain == domain_filter
+        ]
+
+    def async_set(self, entity_id, new_state, attributes=None, context=None):
+        """Set a state and fire 'state_changed'."""
+        from homeassistant.const import EVENT_STATE_CHANGED
+        from homeassistant.core import State
+
+        old_state = self.states.get(entity_id)
+        state = State(entity_id, new_state, attributes, context=context)
+        self.states[entity_id] = state
+        self.hass.bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
+            context=context,
+        )
+
+
+class SimServiceCall:
+    """Service call as passed to handlers and the manager's interceptor."""
+
+    def __init__(self, domain, service, data, context) -> None:
+        """Initialize the call."""
+        self.domain = domain
+        self.service = service
+        self.data = data
+        self.context = context
+
+
+class SimServices:
+    """Service registry that fires 'call_service' events and counts calls.
+
+    The registered services are kept in '_services' like in Home Assistant,
+    because the manager's interceptor replaces handlers there.
+    """
+
+    def __init__(self, hass) -> None:
+        """Initialize without services."""
+        self.hass = hass
+        self._services = {}
+        self.calls = Counter()
+
+    def async_register(self, domain, service, service_func, schema=None):
+        """Register 'service_func' as 'domain.service'."""
+        job = SimpleNamespace(target=service_func)
+        self._services.setdefault(domain, {})[service] = SimpleNamespace(
+            job=job,
+            schema=schema,
+        )
+
+    async def async_call(
+        self,
+        domain,
+        service,
+        service_data=None,
+        blocking=False,
+        context=None,
+    ):
+        """Call a service, and wait for it only if 'blocking'."""
+        from custom_components.adaptive_lighting.switch import is_our_context
+        from homeassistant.const import EVENT_CALL_SERVICE
+        from homeassistant.core import Context
+
+        context = context or Context()
+        service_data = dict(service_data or {})
+        origin = next(
+            (o for o in CONTEXT_ORIGINS if is_our_context(context, o)),
+            "adaptive_lighting" if is_our_context(context) else "user",
+        )
+        self.calls[f"{domain}.{service} ({origin})"] += 1
+        self.hass.bus.async_fire(
+            EVENT_CALL_SERVICE,
+            {"domain": domain, "service": service, "service_data": service_data},
+            context=context,
+        )
+        # Like the light's schema, pass the entities and the other parameters
+        params = dict(service_data)
+        entity_ids = params.pop("entity_id", [])
+        data = {
+            "entity_id": [entity_ids] if isinstance(entity_ids, str) else entity_ids,
+            "params": params,
+        }
+        call = SimServiceCall(domain, service, data, context)
+        coro = self._services[domain][service].job.target(call)
+        if blocking:
+            await coro
+        else:
+            self.hass.async_create_task(coro)
+
+
+class SimHass:
+    """The parts of HomeAssistant that adaptive_lighting uses."""
+
+    def __init__(self, clock, latitude, longitude, time_zone) -> None:
+        """Initialize an empty instance at the location."""
+        self.clock = clock
+        self.loop = asyncio.get_running_loop()
+        self.is_running = False
+        self.data = {}
+        self.config = SimpleNamespace(
+            latitude=latitude,
+            longitude=longitude,
+            elevation=0,
+            time_zone=time_zone,
+            units=None,
+        )
+        self.bus = SimBus(self)
+        self.states = SimStates(self)
+        self.services = SimServices(self)
+        self.tasks: set[asyncio.Task] = set()
+
+    def async_create_task(self, coro, *args, **kwargs):
+        """Run 'coro' as a task that async_block_till_done waits for."""
+        task = self.loop.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    async def async_block_till_done(self, manager=None) -> None:
+        """Wait until the scheduled tasks and adaptations are done."""
+        while True:
+            pending = set(self.tasks)
+            if manager is not None:
+                pending.update(t for t in manager.adaptation_tasks if not t.done())
+            if not pending:
+                return
+            await asyncio.wait(pending)
+
+
+def light_attributes(index: int, brightness: int | None = None):
+    """Get the attributes of a color temperature or a color light."""
+    attributes = {
+        "supported_features": 32,  # LightEntityFeature.TRANSITION
+        "min_color_temp_kelvin": 2000,
+        "max_color_temp_kelvin": 6535,
+    }
+    if index % round(1 / COLOR_LIGHT_RATIO) == 0:
+        attributes["supported_color_modes"] = ["color_temp", "xy"]
+    else:
+        attributes["supported_color_modes"] = ["color_temp"]
+    if brightness is not None:
+        attributes["brightness"] = brightness
+    return attributes
+
+
+def turned_on_attributes(attributes, params):
+    """Get a light's attributes after 'light.turn_on' with 'params'."""
+    attributes = dict(attributes)
+    if "brightness_pct" in params:
+        attributes["brightness"] = round(255 * params["brightness_pct"] / 100)
+    for key in ("brightness", "color_temp_kelvin", "rgb_color", "xy_color"):
+        if key in params:
+            attributes[key] = params[key]
+    attributes.setdefault("brightness", 255)
+    return attributes
+
+
+def register_light_services(hass) -> None:
+    """Register 'light' services that update the simulated light states."""
+
+    def turn_on(entity_id, params, context):
+        state = hass.states.get(entity_id)
+        attributes = turned_on_attributes(state.attributes, params)
+        hass.states.async_set(entity_id, "on", attributes, context=context)
+
+    def turn_off(entity_id, context):
+        attributes = dict(hass.states.get(entity_id).attributes)
+        attributes.pop("brightness", None)
+        hass.states.async_set(entity_id, "off", attributes, context=context)
+
+    async def handle_turn_on(call):
+        for entity_id in call.data["entity_id"]:
+            turn_on(entity_id, call.data["params"], call.context)
+
+    async def handle_turn_off(call):
+        for entity_id in call.data["entity_id"]:
+            turn_off(entity_id, call.context)
+
+    async def handle_toggle(call):
+        for entity_id in call.data["entity_id"]:
+            if hass.states.is_state(entity_id, "on"):
+                turn_off(entity_id, call.context)
+            else:
+                turn_on(entity_id, call.data["params"], call.context)
+
+    hass.services.async_register("light", "turn_on", handle_turn_on)
+    hass.services.async_register("light", "turn_off", handle_turn_off)
+    hass.services.async_register("light", "toggle", handle_toggle)
+
+
+def create_switches(hass, manager, lights: list[str], switches: int):
+    """Create switches that are on and each control a slice of the lights."""
+    from custom_components.adaptive_lighting.switch import AdaptiveSwitch
+
+    per_switch = -(-len(lights) // switches)
+    created = []
+    for index in range(switches):
+        config_entry = SimpleNamespace(
+            data={
+                "name": f"sim_{index}",
+                "lights": lights[index * per_switch : (index + 1) * per_switch],
+                **SWITCH_CONFIG,
+            },
+            options={},
+        )
+        switch = AdaptiveSwitch(
+            hass,
+            config_entry,
+            manager,
+            sleep_mode_switch=SimpleNamespace(is_on=False),
+            adapt_color_switch=SimpleNamespace(is_on=True),
+            adapt_brightness_switch=SimpleNamespace(is_on=True),
+        )
+        switch.entity_id = f"switch.adaptive_lighting_sim_{index}"
+        # There is no entity platform to write the switch's state to
+        switch.async_write_ha_state = lambda: None
+        switch._state = True  # pylint: disable=protected-access
+        created.append(switch)
+    return created
+
+
+async def user_event(hass, rng: random.Random, light: str) -> None:
+    """Turn 'light' on or off, or change its brightness like a user would."""
+    if not hass.states.is_state(light, "on"):
+        service = "toggle" if rng.random() < TOGGLE_RATIO else "turn_on"
+        await hass.services.async_call("light", service, {"entity_id": light})
+    elif rng.random() < MANUAL_CHANGE_RATIO:
+        await hass.services.async_call(
+            "light",
+            "turn_on",
+            {"entity_id": light, "brightness": rng.randint(1, 255)},
+        )
+    else:
+        await hass.services.async_call("light", "turn_off", {"entity_id": light})
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """Get the mean, median, 95th percentile and maximum in milliseconds."""
+    if not values:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(values)
+    return {
+        "mean_ms": round(1000 * statistics.fmean(ordered), 3),
+        "p50_ms": round(1000 * ordered[len(ordered) // 2], 3),
+        "p95_ms": round(1000 * ordered[int(len(ordered) * 0.95)], 3),
+        "max_ms": round(1000 * ordered[-1], 3),
+    }
+
+
+async def simulate(args) -> dict:
+    """Replay a synthetic day and get the measurements."""
+    from custom_components.adaptive_lighting.const import (
+        ATTR_ADAPTIVE_LIGHTING_MANAGER,
+        DOMAIN,
+    )
+    from custom_components.adaptive_lighting.switch import AdaptiveLightingManager
+    from homeassistant.util import dt as dt_util
+
+    midnight = datetime.datetime.combine(
+        args.date,
+        datetime.time(),
+        zoneinfo.ZoneInfo(args.time_zone),
+    )
+    clock = SimClock(midnight.astimezone(datetime.UTC))
+    with patch.object(dt_util, "utcnow", clock.utcnow):
+        hass = SimHass(clock, args.latitude, args.longitude, args.time_zone)
+        lights = [f"light.sim_{i}" for i in range(args.lights)]
+        for index, light in enumerate(lights):
+            hass.states.async_set(light, "off", light_attributes(index))
+        register_light_services(hass)
+
+        manager = AdaptiveLightingManager(hass)
+        hass.data[DOMAIN] = {ATTR_ADAPTIVE_LIGHTING_MANAGER: manager}
+        switches = create_switches(hass, manager, lights, args.switches)
+        await hass.async_block_till_done(manager)
+        hass.bus.latencies.clear()
+
+        rng = random.Random(args.seed)
+        event_probability = args.events_per_light * args.step / 86400
+        ticks = int(args.hours * 3600 // args.step)
+        tick_cpu = []
+        user_events = 0
+        wall_start = time.perf_counter()
+        for _ in range(ticks):
+            clock.advance(args.step)
+            for light in lights:
+                if rng.random() < event_probability:
+                    user_events += 1
+                    await user_event(hass, rng, light)
+            await hass.async_block_till_done(manager)
+
+            cpu_start = time.process_time()
+            for switch in switches:
+                # pylint: disable=protected-access
+                await switch._async_update_at_interval_action()
+            await hass.async_block_till_done(manager)
+            tick_cpu.append(time.process_time() - cpu_start)
+        wall_seconds = time.perf_counter() - wall_start
+
+        snapshot = manager.instrumentation_snapshot()
+        manager.disable()
+        for timer in list(manager.transition_timers.values()):
+            timer.cancel()
+
+    counters = Counter()
+    for name, group in snapshot["groups"].items():
+        if name != "manager":
+            counters.update(group["counters"])
+    return {
+        "lights": args.lights,
+        "switches": args.switches,
+        "simulated_hours": args.hours,
+        "ticks": ticks,
+        "user_events": user_events,
+        "wall_seconds": round(wall_seconds, 3),
+        "speedup": round(args.hours * 3600 / wall_seconds),
+        "service_calls": dict(sorted(hass.services.calls.items())),
+        "events_fired": dict(hass.bus.fired),
+        "tick_cpu": percentiles(tick_cpu),
+        "event_latency": percentiles(hass.bus.latencies),
+        "switch_counters": dict(sorted(counters.items())),
+    }
+
+
+def print_report(result: dict) -> None:
+    """Print the measurements."""
+    print(
+        f"{result['lights']} lights, {result['switches']} switches,"
+        f" {result['simulated_hours']} h in {result['ticks']} ticks"
+        f" with {result['user_events']} user events:"
+        f" {result['wall_seconds']:.1f} s ({result['speedup']}x real time)",
+    )
+    print("  service calls:")
+    for name, count in result["service_calls"].items():
+        print(f"    {name:38} {count:8}")
+    print("  events fired:")
+    for name, count in result["events_fired"].items():
+        print(f"    {name:38} {count:8}")
+    print("  switch counters:")
+    for name, count in result["switch_counters"].items():
+        print(f"    {name:38} {count:8}")
+    for key, label in (("tick_cpu", "CPU per tick"), ("event_latency", "event")):
+        stats = result[key]
+        print(
+            f"  {label:14} mean {stats['mean_ms']:8.3f} ms"
+            f"  p50 {stats['p50_ms']:8.3f} ms  p95 {stats['p95_ms']:8.3f} ms"
+            f"  max {stats['max_ms']:8.3f} ms",
+        )
+
+
+def main():
+    """Run the simulation from command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lights", type=int, default=DEFAULT_LIGHTS)
+    parser.add_argument("--switches", type=int, default=DEFAULT_SWITCHES)
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument(
+        "--step",
+        type=float,
+        default=DEFAULT_STEP,
+        help="simulated seconds between interval ticks",
+    )
+    parser.add_argument(
+        "--events-per-light",
+        type=float,
+        default=DEFAULT_EVENTS_PER_LIGHT,
+        help="user events per light per simulated day",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--date",
+        type=datetime.date.fromisoformat,
+        default=datetime.date(2024, 6, 21),
+    )
+    parser.add_argument("--latitude", type=float, default=52.37)
+    parser.add_argument("--longitude", type=float, default=4.89)
+    parser.add_argument("--time-zone", default="Europe/Amsterdam")
+    parser.add_argument("--json", action="store_true", help="print JSON instead")
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("homeassistant") is None:
+        print("❌ This simulation needs homeassistant installed")
+        return 1
+    result = asyncio.run(simulate(args))
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Generate a synthetic Home Assistant config directory for benchmarks.
+
+The config scales with the number of automations and has matching entity,
+device and area registries, so every reference in it is valid. Half the
+automations live in automations.yaml and half in an !include_dir_merge_list
+tree; scripts and sensors use !include_dir_merge_named and !include_dir_list.
+Conditions and messages use the template forms the validators scan for.
+Output is deterministic for a given size and seed.
+
+The validators only discover top-level YAML files, so pass them yaml_files()
+to also cover the included trees.
+
+Usage: python benchmarks/synthetic_config.py OUTPUT_DIR [--automations N]
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+DOMAINS = ("light", "switch", "sensor", "binary_sensor", "climate", "cover")
+AREA_COUNT = 20
+ENTITIES_PER_AUTOMATION = 3
+AUTOMATIONS_PER_FILE = 100
+
+# Registry files are mostly deleted entries on long-lived installs
+DELETED_ENTITY_RATIO = 0.5
+
+# Directories pulled in by the !include_dir_* tags of configuration.yaml
+INCLUDE_DIRS = ("automations", "scripts", "sensors")
+
+
+class SyntheticConfig:
+    """Registries and YAML documents for a synthetic config."""
+
+    def __init__(self, automations: int, seed: int = 0):
+        """Build the config in memory."""
+        self.automations = automations
+        self.rng = random.Random(seed)
+
+        self.areas = [
+            {"id": f"area_{i}", "name": f"Area {i}"} for i in range(AREA_COUNT)
+        ]
+        self.devices = [
+            {
+                "id": self._hex_id(),
+                "name": f"Device {i}",
+                "area_id": self.rng.choice(self.areas)["id"],
+                "disabled_by": None,
+            }
+            for i in range(max(10, automations // 5))
+        ]
+
+        self.entities: List[Dict[str, Any]] = []
+        self.by_domain: Dict[str, List[Dict[str, Any]]] = {d: [] for d in DOMAINS}
+        for i in range(automations * ENTITIES_PER_AUTOMATION):
+            domain = DOMAINS[i % len(DOMAINS)]
+            entity = {
+                "entity_id": f"{domain}.synthetic_{i}",
+                "id": self._hex_id(),
+                "platform": "synthetic",
+                "unique_id": f"synthetic_{i}",
+                "device_id": self.rng.choice(self.devices)["id"],
+                "area_id": None,
+                "disabled_by": None,
+                "hidden_by": None,
+                "original_name": f"Synthetic {i}",
+                "capabilities": None,
+                "options": {},
+            }
+            self.entities.append(entity)
+            self.by_domain[domain].append(entity)
+
+        self.deleted_entities = [
+            dict(entity, entity_id=f"{entity['entity_id']}_old", id=self._hex_id())
+            for entity in self.entities[
+                : int(len(self.entities) * DELETED_ENTITY_RATIO)
+            ]
+        ]
+
+    def _hex_id(self) -> str:
+        """Get a registry-style 32 character hex ID."""
+        return f"{self.rng.getrandbits(128):032x}"
+
+    def _entity(self, domain: str) -> Dict[str, Any]:
+        """Get a random registry entity of a domain."""
+        return self.rng.choice(self.by_domain[domain])
+
+    def _entity_id(self, domain: str) -> str:
+        """Get a random entity ID of a domain."""
+        return self._entity(domain)["entity_id"]
+
+    def automation(self, index: int) -> Dict[str, Any]:
+        """Build one automation using every kind of reference."""
+        motion = self._entity_id("binary_sensor")
+        battery = self._entity("sensor")
+        area = self.rng.choice(self.areas)
+        return {
+            "id": f"synthetic_{index}",
+            "alias": f"Synthetic automation {index}",
+            "description": "Generated for benchmarks",
+            "mode": "single",
+            "triggers": [
+                {"trigger": "state", "entity_id": motion, "to": "on"},
+                {
+                    "trigger": "device",
+                    "device_id": battery["device_id"],
+                    "entity_id": battery["id"],
+                    "domain": "sensor",
+                    "type": "battery_level",
+                    "below": 20,
+                },
+            ],
+            "conditions": [
+                {
+                    "condition": "template",
+                    "value_template": (
+                        f"{{{{ is_state('{motion}', 'on') and "
+                        f"states('{self._entity_id('sensor')}') | float(0) > 20 "
+                        f"and states.{self._entity_id('switch')}.state == 'off' }}}}"
+                    ),
+                }
+            ],
+            "actions": [
+                {
+                    "action": "light.turn_on",
+                    "target": {
+                        "entity_id": [self._entity_id("light"), "all"],
+                        "area_id": area["id"],
+                    },
+                    "data": {"brightness_pct": self.rng.randint(1, 100)},
+                },
+                {
+                    "action": "notify.notify",
+                    "data": {
+                        "message": (
+                            f"{{{{ state_attr('{self._entity_id('climate')}', "
+                            f"'temperature') }}}} "
+                            f"{{{{ expand(area_entities('{area['name']}')) "
+                            f"| count }}}} "
+                            f"{{{{ states['{self._entity_id('cover')}'].state }}}}"
+                        )
+                    },
+                },
+            ],
+        }
+
+    def script(self, index: int) -> Dict[str, Any]:
+        """Build one script."""
+        return {
+            "alias": f"Synthetic script {index}",
+            "sequence": [
+                {
+                    "action": "switch.toggle",
+                    "target": {"entity_id": self._entity_id("switch")},
+                },
+                {"delay": {"seconds": 1}},
+                {
+                    "condition": "template",
+                    "value_template": (
+                        f"{{{{ is_state_attr('{self._entity_id('climate')}', "
+                        f"'hvac_action', 'heating') }}}}"
+                    ),
+                },
+            ],
+        }
+
+    def write(self, config_dir: Path):
+        """Write the config directory, including .storage registries."""
+        storage_dir = config_dir / ".storage"
+        storage_dir.mkdir(parents=True, exist_ok=True)
+
+        _write_json(
+            storage_dir / "core.entity_registry",
+            {"entities": self.entities, "deleted_entities": self.deleted_entities},
+        )
+        _write_json(
+            storage_dir / "core.device_registry",
+            {"devices": self.devices, "deleted_devices": []},
+        )
+        _write_json(storage_dir / "core.area_registry", {"areas": self.areas})
+
+        (config_dir / "configuration.yaml").write_text(
+            "homeassistant:\n"
+            "  name: Synthetic\n"
+            "  unit_system: metric\n"
+            "automation: !include automations.yaml\n"
+            "automation split: !include_dir_merge_list automations/\n"
+            "script: !include scripts.yaml\n"
+            "script split: !include_dir_merge_named scripts/\n"
+            "sensor: !include_dir_list sensors/\n"
+            "template:\n"
+            "  - sensor:\n"
+            "      - name: Synthetic average\n"
+            "        unique_id: synthetic_average\n"
+            "        state: >-\n"
+            f"          {{{{ states('{self._entity_id('sensor')}') }}}}\n",
+            encoding="utf-8",
+        )
+        (config_dir / "secrets.yaml").write_text(
+            "api_password: synthetic\n", encoding="utf-8"
+        )
+
+        automations = [self.automation(i) for i in range(self.automations)]
+        half = len(automations) // 2
+        _write_yaml(config_dir / "automations.yaml", automations[:half])
+        for start in range(half, len(automations), AUTOMATIONS_PER_FILE):
+            _write_yaml(
+                config_dir / "automations" / f"synthetic_{start}.yaml",
+                automations[start : start + AUTOMATIONS_PER_FILE],
+            )
+
+        scripts = {
+            f"synthetic_{i}": self.script(i)
+            for i in range(2 * max(1, self.automations // 10))
+        }
+        names = list(scripts)
+        half = len(names) // 2
+        _write_yaml(
+            config_dir / "scripts.yaml", {name: scripts[name] for name in names[:half]}
+        )
+        for start in range(half, len(names), AUTOMATIONS_PER_FILE):
+            chunk = names[start : start + AUTOMATIONS_PER_FILE]
+            _write_yaml(
+                config_dir / "scripts" / f"synthetic_{start}.yaml",
+                {name: scripts[name] for name in chunk},
+            )
+
+        for i in range(max(1, self.automations // 100)):
+            _write_yaml(
+                config_dir / "sensors" / f"statistics_{i}.yaml",
+                {
+                    "platform": "statistics",
+                    "name": f"Synthetic statistics {i}",
+                    "entity_id": self._entity_id("sensor"),
+                    "state_characteristic": "mean",
+                    "max_age": {"hours": 24},
+                },
+            )
+
+
+def generate_config(config_dir: Path, automations: int, seed: int = 0) -> Path:
+    """Write a synthetic config with the given number of automations."""
+    SyntheticConfig(automations, seed).write(Path(config_dir))
+    return Path(config_dir)
+
+
+def yaml_files(config_dir: Path) -> List[Path]:
+    """Get the top-level YAML files and those of the included trees."""
+    config_dir = Path(config_dir)
+    files = list(config_dir.glob("*.yaml"))
+    for name in INCLUDE_DIRS:
+        files.extend((config_dir / name).glob("*.yaml"))
+    return sorted(files)
+
+
+def _write_json(path: Path, data: Dict[str, Any]):
+    """Write a .storage file in Home Assistant's layout."""
+    document = {
+        "version": 1,
+        "minor_version": 1,
+        "key": path.name,
+        "data": data,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+
+
+def _write_yaml(path: Path, data: Any):
+    """Write a YAML document, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+
+
+def main():
+    """Write a synthetic config from command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output_dir", help="Config directory to create")
+    parser.add_argument("--automations", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config_dir = generate_config(Path(args.output_dir), args.automations, args.seed)
+    print(f"Wrote {args.automations} automations to {config_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
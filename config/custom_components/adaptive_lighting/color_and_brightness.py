@@ -6,17 +6,26 @@ import colorsys
 import datetime
 import logging
 import math
-from dataclasses import dataclass
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
 from datetime import timedelta
-from functools import cached_property, partial
-from typing import TYPE_CHECKING, Any, Literal, cast
+from functools import cached_property, lru_cache, partial
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 from homeassistant.util.color import (
     color_RGB_to_xy,
     color_temperature_to_rgb,
     color_xy_to_hs,
+    color_xy_to_RGB,
 )
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, day curves are then built in plain Python
+    np = None
+
 if TYPE_CHECKING:
     import astral
 
@@ -37,6 +46,34 @@ utcnow.__doc__ = "Get now in UTC time."
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sun events only change with the date, so they are cached per day for each set
+# of sun settings; a few days per setting are live at any time
+_DAY_CACHE_SIZE = 128
+_day_cache: OrderedDict[tuple, Any] = OrderedDict()
+
+# Color temperatures are rounded to multiples of 5 K and sleep colors are fixed,
+# so the color conversions only ever see a few thousand distinct inputs
+_COLOR_CACHE_SIZE = 4096
+
+# Around midnight UTC lookups alternate between two days (e.g. "now" and a
+# transition's end), so the current and the next day curve are kept
+_DAY_CURVES_SIZE = 2
+
+_T = TypeVar("_T")
+
+
+def _cached_per_day(key: tuple, compute: Callable[[], _T]) -> _T:
+    """Get a value from the per-day cache, computing and storing it on a miss."""
+    try:
+        value = _day_cache[key]
+    except KeyError:
+        value = _day_cache[key] = compute()
+        if len(_day_cache) > _DAY_CACHE_SIZE:
+            _day_cache.popitem(last=False)
+    else:
+        _day_cache.move_to_end(key)
+    return value
+
 
 @dataclass(frozen=True)
 class SunEvents:
@@ -104,14 +141,7 @@ class SunEvents:
         sunrise: datetime.datetime | None = None,
     ) -> tuple[datetime.datetime, datetime.datetime]:
         """Return the (adjusted) noon and midnight times for the given datetime."""
-        if (
-            self.sunrise_time is None
-            and self.sunset_time is None
-            and self.min_sunrise_time is None
-            and self.max_sunrise_time is None
-            and self.min_sunset_time is None
-            and self.max_sunset_time is None
-        ):
+        if self._uses_astral_noon:
             solar_noon = self.astral_location.noon(dt, local=False)
             solar_midnight = self.astral_location.midnight(dt, local=False)
             return solar_noon, solar_midnight
@@ -158,42 +188,124 @@ class SunEvents:
             _LOGGER.error(msg)
             raise ValueError(msg)
 
-    def prev_and_next_events(self, dt: datetime.datetime) -> list[tuple[str, float]]:
-        """Get the previous and next sun event."""
+    @cached_property
+    def _uses_astral_noon(self) -> bool:
+        """Whether noon and midnight come from astral, not from sunrise and sunset."""
+        return (
+            self.sunrise_time is None
+            and self.sunset_time is None
+            and self.min_sunrise_time is None
+            and self.max_sunrise_time is None
+            and self.min_sunset_time is None
+            and self.max_sunset_time is None
+        )
+
+    @cached_property
+    def _cache_key(self) -> tuple:
+        """Return the settings the sun events depend on, besides the date."""
+        return (
+            self.astral_location.latitude,
+            self.astral_location.longitude,
+            self.sunrise_time,
+            self.min_sunrise_time,
+            self.max_sunrise_time,
+            self.sunset_time,
+            self.min_sunset_time,
+            self.max_sunset_time,
+            self.sunrise_offset,
+            self.sunset_offset,
+            self.timezone,
+        )
+
+    def _astral_sun_events(self, dt: datetime.datetime) -> list[tuple[str, float]]:
+        """Get the four sun event's timestamps at 'dt', reusing the day's solves.
+
+        astral's noon() counts the time of day of 'dt' into its Julian day, so
+        only the sunrise, sunset and midnight solves hold for the whole day.
+        """
+
+        def solve() -> tuple[float, float, float]:
+            return (
+                self.sunrise(dt).timestamp(),
+                self.sunset(dt).timestamp(),
+                self.astral_location.midnight(dt, local=False).timestamp(),
+            )
+
+        sunrise_ts, sunset_ts, midnight_ts = _cached_per_day(
+            (self._cache_key, dt.date(), dt.tzinfo), solve
+        )
         events = [
-            event
-            for days in [-1, 0, 1]
-            for event in self.sun_events(dt + timedelta(days=days))
+            (SUN_EVENT_SUNRISE, sunrise_ts),
+            (SUN_EVENT_SUNSET, sunset_ts),
+            (SUN_EVENT_NOON, self.astral_location.noon(dt, local=False).timestamp()),
+            (SUN_EVENT_MIDNIGHT, midnight_ts),
         ]
-        events = sorted(events, key=lambda x: x[1])
-        i_now = bisect.bisect([ts for _, ts in events], dt.timestamp())
-        return events[i_now - 1 : i_now + 1]
+        self._validate_sun_event_order(events)
+        return events
+
+    def _events_around(
+        self, dt: datetime.datetime
+    ) -> tuple[tuple[float, ...], tuple[tuple[str, float], ...]]:
+        """Get the sorted sun events of the day before, of and after 'dt'."""
+        if self._uses_astral_noon:
+            events = sorted(
+                (
+                    event
+                    for days in [-1, 0, 1]
+                    for event in self._astral_sun_events(dt + timedelta(days=days))
+                ),
+                key=lambda x: x[1],
+            )
+            return tuple(ts for _, ts in events), tuple(events)
+
+        def solve() -> tuple[tuple[float, ...], tuple[tuple[str, float], ...]]:
+            events = sorted(
+                (
+                    event
+                    for days in [-1, 0, 1]
+                    for event in self.sun_events(dt + timedelta(days=days))
+                ),
+                key=lambda x: x[1],
+            )
+            return tuple(ts for _, ts in events), tuple(events)
+
+        # With set sunrise or sunset times every event only depends on the date
+        return _cached_per_day((self._cache_key, dt.date(), dt.tzinfo), solve)
+
+    def prev_and_next_events(self, dt: datetime.datetime) -> list[tuple[str, float]]:
+        """Get the previous and next sun event."""
+        timestamps, events = self._events_around(dt)
+        i_now = bisect.bisect(timestamps, dt.timestamp())
+        return list(events[i_now - 1 : i_now + 1])
 
     def sun_position(self, dt: datetime.datetime) -> float:
         """Calculate the position of the sun, between [-1, 1]."""
-        target_ts = dt.timestamp()
-        (_, prev_ts), (next_event, next_ts) = self.prev_and_next_events(dt)
-        h, x = (
-            (prev_ts, next_ts)
-            if next_event in (SUN_EVENT_SUNSET, SUN_EVENT_SUNRISE)
-            else (next_ts, prev_ts)
-        )
-        # k = -1 between sunset and sunrise (sun below horizon)
-        # k = 1 between sunrise and sunset (sun above horizon)
-        k = 1 if next_event in (SUN_EVENT_SUNSET, SUN_EVENT_NOON) else -1
-        return k * (1 - ((target_ts - h) / (h - x)) ** 2)
+        prev_event, next_event = self.prev_and_next_events(dt)
+        return sun_position_between(dt.timestamp(), prev_event, next_event)
 
     def closest_event(self, dt: datetime.datetime) -> tuple[str, float]:
         """Get the closest sunset or sunrise event."""
-        (prev_event, prev_ts), (next_event, next_ts) = self.prev_and_next_events(dt)
-        if SUN_EVENT_SUNRISE in (prev_event, next_event):
-            ts_event = prev_ts if prev_event == SUN_EVENT_SUNRISE else next_ts
-            return SUN_EVENT_SUNRISE, ts_event
-        if SUN_EVENT_SUNSET in (prev_event, next_event):
-            ts_event = prev_ts if prev_event == SUN_EVENT_SUNSET else next_ts
-            return SUN_EVENT_SUNSET, ts_event
-        msg = "No sunrise or sunset event found."
-        raise ValueError(msg)
+        prev_event, next_event = self.prev_and_next_events(dt)
+        return closest_event_between(prev_event, next_event)
+
+
+@dataclass(frozen=True)
+class DayCurve:
+    """Sun position and brightness sampled over a UTC day at a fixed resolution."""
+
+    start_ts: float
+    resolution: float
+    sun_positions: array
+    brightness_pcts: array
+
+    def interpolate(self, ts: float) -> tuple[float, float]:
+        """Linearly interpolate the sun position and brightness at 'ts'."""
+        x = (ts - self.start_ts) / self.resolution
+        i = min(int(x), len(self.sun_positions) - 2)
+        frac = x - i
+        p0, p1 = self.sun_positions[i], self.sun_positions[i + 1]
+        b0, b1 = self.brightness_pcts[i], self.brightness_pcts[i + 1]
+        return p0 + frac * (p1 - p0), b0 + frac * (b1 - b0)
 
 
 @dataclass(frozen=True)
@@ -223,6 +335,31 @@ class SunLightSettings:
     sunrise_offset: datetime.timedelta = datetime.timedelta()
     sunset_offset: datetime.timedelta = datetime.timedelta()
     timezone: datetime.tzinfo = UTC
+    day_curve_resolution: datetime.timedelta | None = None
+    _day_curves: OrderedDict[float, DayCurve] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @cached_property
+    def curve_key(self) -> tuple:
+        """Return a hashable key of every setting that shapes the curve.
+
+        Equal for switches that only differ in name, so they can share settings.
+        """
+        values: list[Any] = []
+        for settings_field in fields(self):
+            if not settings_field.compare or settings_field.name == "name":
+                continue
+            value = getattr(self, settings_field.name)
+            if settings_field.name == "astral_location":
+                value = (value.latitude, value.longitude)
+            elif isinstance(value, list):
+                value = tuple(value)
+            values.append(value)
+        return tuple(values)
 
     @cached_property
     def sun(self) -> SunEvents:
@@ -243,7 +380,9 @@ class SunLightSettings:
 
     def _brightness_pct_default(self, dt: datetime.datetime) -> float:
         """Calculate the brightness percentage using the default method."""
-        sun_position = self.sun.sun_position(dt)
+        return self._brightness_pct_at_position(self.sun.sun_position(dt))
+
+    def _brightness_pct_at_position(self, sun_position: float) -> float:
         if sun_position > 0:
             return self.max_brightness
         delta_brightness = self.max_brightness - self.min_brightness
@@ -251,11 +390,22 @@ class SunLightSettings:
 
     def _brightness_pct_tanh(self, dt: datetime.datetime) -> float:
         event, ts_event = self.sun.closest_event(dt)
+        return self._brightness_pct_tanh_at(event, dt.timestamp() - ts_event)
+
+    def _tanh_coefficients(self, event: str) -> tuple[float, float]:
+        """Get the 'a' and 'b' of the tanh brightness curve around 'event'."""
+        dark = self.brightness_mode_time_dark.total_seconds()
+        light = self.brightness_mode_time_light.total_seconds()
+        if event == SUN_EVENT_SUNRISE:
+            return find_a_b(x1=-dark, x2=+light, y1=0.05, y2=0.95)
+        return find_a_b(x1=-light, x2=+dark, y1=0.95, y2=0.05)
+
+    def _brightness_pct_tanh_at(self, event: str, dt_event: float) -> float:
         dark = self.brightness_mode_time_dark.total_seconds()
         light = self.brightness_mode_time_light.total_seconds()
         if event == SUN_EVENT_SUNRISE:
             brightness = scaled_tanh(
-                dt.timestamp() - ts_event,
+                dt_event,
                 x1=-dark,
                 x2=+light,
                 y1=0.05,  # be at 5% of range at x1
@@ -265,7 +415,7 @@ class SunLightSettings:
             )
         elif event == SUN_EVENT_SUNSET:
             brightness = scaled_tanh(
-                dt.timestamp() - ts_event,
+                dt_event,
                 x1=-light,  # shifted timestamp for the start of sunset
                 x2=+dark,  # shifted timestamp for the end of sunset
                 y1=0.95,  # be at 95% of range at the start of sunset
@@ -277,13 +427,16 @@ class SunLightSettings:
 
     def _brightness_pct_linear(self, dt: datetime.datetime) -> float:
         event, ts_event = self.sun.closest_event(dt)
+        return self._brightness_pct_linear_at(event, dt.timestamp() - ts_event)
+
+    def _brightness_pct_linear_at(self, event: str, dt_event: float) -> float:
         # at ts_event - dt_start, brightness == start_brightness
         # at ts_event + dt_end, brightness == end_brightness
         dark = self.brightness_mode_time_dark.total_seconds()
         light = self.brightness_mode_time_light.total_seconds()
         if event == SUN_EVENT_SUNRISE:
             brightness = lerp(
-                dt.timestamp() - ts_event,
+                dt_event,
                 x1=-dark,
                 x2=+light,
                 y1=self.min_brightness,
@@ -291,7 +444,7 @@ class SunLightSettings:
             )
         elif event == SUN_EVENT_SUNSET:
             brightness = lerp(
-                dt.timestamp() - ts_event,
+                dt_event,
                 x1=-light,
                 x2=+dark,
                 y1=self.max_brightness,
@@ -334,10 +487,19 @@ class SunLightSettings:
     ) -> dict[str, Any]:
         """Calculate the brightness and color."""
         sun_position = self.sun.sun_position(dt)
+        brightness_pct = self.brightness_pct(dt, is_sleep)
+        return self._brightness_and_color_at(sun_position, brightness_pct, is_sleep)
+
+    def _brightness_and_color_at(
+        self,
+        sun_position: float,
+        brightness_pct: float,
+        is_sleep: bool,
+    ) -> dict[str, Any]:
+        """Calculate the color for a sun position, given the brightness."""
         rgb_color: tuple[float, float, float]
         # Variable `force_rgb_color` is needed for RGB color after sunset (if enabled)
         force_rgb_color = False
-        brightness_pct = self.brightness_pct(dt, is_sleep)
         if is_sleep:
             color_temp_kelvin = self.sleep_color_temp
             rgb_color = self.sleep_rgb_color
@@ -350,7 +512,7 @@ class SunLightSettings:
             # https://github.com/basnijholt/adaptive-lighting/issues/624
             # This will result in a perceptible jump in color at sunset and sunrise
             # because the `color_temperature_to_rgb` function is not 100% accurate.
-            min_color_rgb = color_temperature_to_rgb(self.min_color_temp)
+            min_color_rgb = cached_color_temperature_to_rgb(self.min_color_temp)
             rgb_color = lerp_color_hsv(
                 min_color_rgb,
                 self.sleep_rgb_color,
@@ -360,11 +522,10 @@ class SunLightSettings:
             force_rgb_color = True
         else:
             color_temp_kelvin = self.color_temp_kelvin(sun_position)
-            rgb_color = color_temperature_to_rgb(color_temp_kelvin)
+            rgb_color = cached_color_temperature_to_rgb(color_temp_kelvin)
         # backwards compatibility for versions < 1.3.1 - see #403
         color_temp_mired: float = math.floor(1000000 / color_temp_kelvin)
-        xy_color: tuple[float, float] = color_RGB_to_xy(*rgb_color)
-        hs_color: tuple[float, float] = color_xy_to_hs(*xy_color)
+        xy_color, hs_color = cached_color_RGB_to_xy_and_hs(*rgb_color)
         return {
             "brightness_pct": brightness_pct,
             "color_temp_kelvin": color_temp_kelvin,
@@ -383,10 +544,164 @@ class SunLightSettings:
     ) -> dict[str, float | int | tuple[float, float] | tuple[float, float, float]]:
         """Get all light settings.
 
-        Calculating all values takes <0.5ms.
+        Calculating all values takes <0.5ms. With a `day_curve_resolution` the sun
+        position and brightness are interpolated from the day's curve instead.
         """
         dt = utcnow() + timedelta(seconds=transition or 0)
-        return self.brightness_and_color(dt, is_sleep)
+        return self.settings_at(dt, is_sleep)
+
+    def settings_at(
+        self,
+        dt: datetime.datetime,
+        is_sleep: bool,
+    ) -> dict[str, float | int | tuple[float, float] | tuple[float, float, float]]:
+        """Get all light settings at 'dt'."""
+        if not self.day_curve_resolution:
+            return self.brightness_and_color(dt, is_sleep)
+        sun_position, brightness_pct = self.day_curve(dt).interpolate(dt.timestamp())
+        if is_sleep:
+            brightness_pct = self.sleep_brightness
+        return self._brightness_and_color_at(sun_position, brightness_pct, is_sleep)
+
+    def day_curve(self, dt: datetime.datetime) -> DayCurve:
+        """Get the sampled sun position and brightness for the UTC day of 'dt'."""
+        start = dt.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        start_ts = start.timestamp()
+        curve = self._day_curves.get(start_ts)
+        if curve is None:
+            curve = self._day_curves[start_ts] = self._build_day_curve(start)
+            if len(self._day_curves) > _DAY_CURVES_SIZE:
+                self._day_curves.popitem(last=False)
+        else:
+            self._day_curves.move_to_end(start_ts)
+        return curve
+
+    def _build_day_curve(self, start: datetime.datetime) -> DayCurve:
+        """Sample the sun position and brightness from 'start' for a day.
+
+        The sun events of the surrounding days are solved once and every sample
+        is placed between them, with NumPy if it is installed.
+        """
+        assert self.day_curve_resolution
+        resolution = self.day_curve_resolution.total_seconds()
+        events: list[tuple[str, float]] = []
+        for event in sorted(
+            (
+                event
+                for days in [-1, 0, 1, 2]
+                for event in self.sun.sun_events(start + timedelta(days=days, hours=12))
+            ),
+            key=lambda x: x[1],
+        ):
+            # With set sun times the midnights of two days can be seconds apart;
+            # keep the first so every sample lies between two different events
+            if not events or events[-1][0] != event[0]:
+                events.append(event)
+        n_samples = math.ceil(timedelta(days=1).total_seconds() / resolution) + 1
+        start_ts = start.timestamp()
+        if np is not None:
+            sun_positions, brightness_pcts = self._sample_day_curve_numpy(
+                events,
+                start_ts + resolution * np.arange(n_samples),
+            )
+        else:
+            sun_positions, brightness_pcts = self._sample_day_curve(
+                events,
+                [start_ts + resolution * i for i in range(n_samples)],
+            )
+        return DayCurve(
+            start_ts=start_ts,
+            resolution=resolution,
+            sun_positions=array("d", sun_positions),
+            brightness_pcts=array("d", brightness_pcts),
+        )
+
+    def _sample_day_curve(
+        self,
+        events: list[tuple[str, float]],
+        timestamps: list[float],
+    ) -> tuple[list[float], list[float]]:
+        """Get the sun position and brightness at each timestamp, one by one."""
+        event_timestamps = [ts for _, ts in events]
+        sun_positions = []
+        brightness_pcts = []
+        for ts in timestamps:
+            i_now = bisect.bisect(event_timestamps, ts)
+            prev_event, next_event = events[i_now - 1], events[i_now]
+            sun_position = sun_position_between(ts, prev_event, next_event)
+            if self.brightness_mode == "default":
+                brightness_pct = self._brightness_pct_at_position(sun_position)
+            else:
+                event, ts_event = closest_event_between(prev_event, next_event)
+                brightness_pct = (
+                    self._brightness_pct_linear_at(event, ts - ts_event)
+                    if self.brightness_mode == "linear"
+                    else self._brightness_pct_tanh_at(event, ts - ts_event)
+                )
+            sun_positions.append(sun_position)
+            brightness_pcts.append(brightness_pct)
+        return sun_positions, brightness_pcts
+
+    def _sample_day_curve_numpy(
+        self,
+        events: list[tuple[str, float]],
+        timestamps: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the sun position and brightness at each timestamp, vectorized."""
+        names = np.array([name for name, _ in events])
+        event_timestamps = np.array([ts for _, ts in events])
+        i_now = np.searchsorted(event_timestamps, timestamps, side="right")
+        prev_name, next_name = names[i_now - 1], names[i_now]
+        prev_ts, next_ts = event_timestamps[i_now - 1], event_timestamps[i_now]
+
+        # Same as sun_position_between
+        to_horizon = (next_name == SUN_EVENT_SUNSET) | (next_name == SUN_EVENT_SUNRISE)
+        h = np.where(to_horizon, prev_ts, next_ts)
+        x = np.where(to_horizon, next_ts, prev_ts)
+        above = (next_name == SUN_EVENT_SUNSET) | (next_name == SUN_EVENT_NOON)
+        k = np.where(above, 1.0, -1.0)
+        sun_positions = k * (1 - ((timestamps - h) / (h - x)) ** 2)
+
+        if self.brightness_mode == "default":
+            delta_brightness = self.max_brightness - self.min_brightness
+            brightness_pcts = np.where(
+                sun_positions > 0,
+                float(self.max_brightness),
+                (delta_brightness * (1 + sun_positions)) + self.min_brightness,
+            )
+            return sun_positions, brightness_pcts
+
+        # Same as closest_event_between; consecutive events always include
+        # a sunrise or a sunset
+        sunrise = (prev_name == SUN_EVENT_SUNRISE) | (next_name == SUN_EVENT_SUNRISE)
+        prev_is_event = np.where(
+            sunrise,
+            prev_name == SUN_EVENT_SUNRISE,
+            prev_name == SUN_EVENT_SUNSET,
+        )
+        dt_event = timestamps - np.where(prev_is_event, prev_ts, next_ts)
+        dark = self.brightness_mode_time_dark.total_seconds()
+        light = self.brightness_mode_time_light.total_seconds()
+        if self.brightness_mode == "linear":
+            brightness_pcts = np.where(
+                sunrise,
+                lerp(dt_event, -dark, light, self.min_brightness, self.max_brightness),
+                lerp(dt_event, -light, dark, self.max_brightness, self.min_brightness),
+            )
+        else:
+            a_rise, b_rise = self._tanh_coefficients(SUN_EVENT_SUNRISE)
+            a_set, b_set = self._tanh_coefficients(SUN_EVENT_SUNSET)
+            a = np.where(sunrise, a_rise, a_set)
+            b = np.where(sunrise, b_rise, b_set)
+            delta_brightness = self.max_brightness - self.min_brightness
+            brightness_pcts = self.min_brightness + delta_brightness * 0.5 * (
+                np.tanh(a * (dt_event - b)) + 1
+            )
+        return sun_positions, np.clip(
+            brightness_pcts,
+            self.min_brightness,
+            self.max_brightness,
+        )
 
 
 def find_a_b(x1: float, x2: float, y1: float, y2: float) -> tuple[float, float]:
@@ -516,3 +831,62 @@ def lerp(x, x1, x2, y1, y2):
 def clamp(value: float, minimum: float, maximum: float) -> float:
     """Clamp value between minimum and maximum."""
     return max(minimum, min(value, maximum))
+
+
+def sun_position_between(
+    target_ts: float,
+    prev_event: tuple[str, float],
+    next_event: tuple[str, float],
+) -> float:
+    """Calculate the position of the sun at 'target_ts' between two sun events."""
+    (_, prev_ts), (next_name, next_ts) = prev_event, next_event
+    h, x = (
+        (prev_ts, next_ts)
+        if next_name in (SUN_EVENT_SUNSET, SUN_EVENT_SUNRISE)
+        else (next_ts, prev_ts)
+    )
+    # k = -1 between sunset and sunrise (sun below horizon)
+    # k = 1 between sunrise and sunset (sun above horizon)
+    k = 1 if next_name in (SUN_EVENT_SUNSET, SUN_EVENT_NOON) else -1
+    return k * (1 - ((target_ts - h) / (h - x)) ** 2)
+
+
+def closest_event_between(
+    prev_event: tuple[str, float],
+    next_event: tuple[str, float],
+) -> tuple[str, float]:
+    """Get the closest sunset or sunrise event out of two consecutive sun events."""
+    (prev_name, prev_ts), (next_name, next_ts) = prev_event, next_event
+    if SUN_EVENT_SUNRISE in (prev_name, next_name):
+        ts_event = prev_ts if prev_name == SUN_EVENT_SUNRISE else next_ts
+        return SUN_EVENT_SUNRISE, ts_event
+    if SUN_EVENT_SUNSET in (prev_name, next_name):
+        ts_event = prev_ts if prev_name == SUN_EVENT_SUNSET else next_ts
+        return SUN_EVENT_SUNSET, ts_event
+    msg = "No sunrise or sunset event found."
+    raise ValueError(msg)
+
+
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
+def cached_color_temperature_to_rgb(
+    color_temp_kelvin: float,
+) -> tuple[float, float, float]:
+    """Convert a color temperature to RGB, memoized."""
+    return color_temperature_to_rgb(color_temp_kelvin)
+
+
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
+def cached_color_RGB_to_xy_and_hs(  # noqa: N802
+    r: float,
+    g: float,
+    b: float,
+) -> tuple[tuple[float, float], tuple[float, float]]:
+    """Convert an RGB color to XY and, from that, to HS, memoized."""
+    xy_color = color_RGB_to_xy(r, g, b)
+    return xy_color, color_xy_to_hs(*xy_color)
+
+
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
+def cached_color_xy_to_RGB(x: float, y: float) -> tuple[int, int, int]:  # noqa: N802
+    """Convert an XY color to RGB, memoized."""
+    return color_xy_to_RGB(x, y)
@@ -34,6 +34,26 @@ DOCS[CONF_DETECT_NON_HA_CHANGES] = (
     "Disable this feature if you encounter such issues."
 )
 
+CONF_REFRESH_CONCURRENCY, DEFAULT_REFRESH_CONCURRENCY = "refresh_concurrency", 1
+DOCS[CONF_REFRESH_CONCURRENCY] = (
+    "Number of lights whose state `detect_non_ha_changes` updates at the same "
+    "time on each `interval`. 1 updates them one after another. 🕵️"
+)
+
+CONF_REFRESH_TIMEOUT, DEFAULT_REFRESH_TIMEOUT = "refresh_timeout", 0
+DOCS[CONF_REFRESH_TIMEOUT] = (
+    "Give up updating a light's state for `detect_non_ha_changes` after this many "
+    "seconds, and skip checking it for changes that `interval`. Set to 0 to "
+    "disable. ⏲️"
+)
+
+CONF_STATE_FRESHNESS, DEFAULT_STATE_FRESHNESS = "state_freshness", 0
+DOCS[CONF_STATE_FRESHNESS] = (
+    "Don't update a light's state for `detect_non_ha_changes` if it was reported "
+    "within this many seconds, and check the reported state instead. Set to 0 to "
+    "always update. 🕵️"
+)
+
 CONF_INCLUDE_CONFIG_IN_ATTRIBUTES, DEFAULT_INCLUDE_CONFIG_IN_ATTRIBUTES = (
     "include_config_in_attributes",
     False,
@@ -43,6 +63,13 @@ DOCS[CONF_INCLUDE_CONFIG_IN_ATTRIBUTES] = (
     "Home Assistant when set to `true`. 📝"
 )
 
+CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION = "instrumentation", False
+DOCS[CONF_INSTRUMENTATION] = (
+    "Collect timings and counts of settings calculations, state change handling "
+    "and `light.turn_on` calls for diagnostics and the `dump_instrumentation` "
+    "service. Adds a little overhead. 📊"
+)
+
 CONF_INITIAL_TRANSITION, DEFAULT_INITIAL_TRANSITION = "initial_transition", 1
 DOCS[CONF_INITIAL_TRANSITION] = (
     "Duration of the first transition when lights turn "
@@ -183,6 +210,14 @@ DOCS[CONF_BRIGHTNESS_MODE_TIME_LIGHT] = (
     "the brightness after/before sunrise/sunset. 📈📉."
 )
 
+CONF_DAY_CURVE_RESOLUTION, DEFAULT_DAY_CURVE_RESOLUTION = "day_curve_resolution", 0
+DOCS[CONF_DAY_CURVE_RESOLUTION] = (
+    "Sample the brightness and color curve once a day at this resolution in "
+    "seconds (e.g. 10) and interpolate from it, instead of solving the sun's "
+    "position for every adaptation. Helps with many switches and short "
+    "`interval`s. Set to 0 to disable. 📈"
+)
+
 CONF_TAKE_OVER_CONTROL, DEFAULT_TAKE_OVER_CONTROL = "take_over_control", True
 DOCS[CONF_TAKE_OVER_CONTROL] = (
     "Disable Adaptive Lighting if another source calls `light.turn_on` while lights "
@@ -214,6 +249,14 @@ DOCS[CONF_SEND_SPLIT_DELAY] = (
     "simultaneous brightness and color setting. ⏲️"
 )
 
+CONF_MAX_CALLS_PER_SECOND, DEFAULT_MAX_CALLS_PER_SECOND = "max_calls_per_second", 0
+DOCS[CONF_MAX_CALLS_PER_SECOND] = (
+    "Budget of `light.turn_on` calls per second for `interval` adaptations, "
+    "shared by all switches (the lowest value set on any switch applies). "
+    "Spreads the calls over the interval so Zigbee or Z-Wave networks are not "
+    "flooded. Set to 0 to disable. 🐢"
+)
+
 CONF_AUTORESET_CONTROL, DEFAULT_AUTORESET_CONTROL = "autoreset_control_seconds", 0
 DOCS[CONF_AUTORESET_CONTROL] = (
     "Automatically reset the manual control after a number of seconds. "
@@ -267,6 +310,9 @@ SERVICE_APPLY = "apply"
 CONF_TURN_ON_LIGHTS = "turn_on_lights"
 DOCS[CONF_TURN_ON_LIGHTS] = "Whether to turn on lights that are currently off. 🔆"
 SERVICE_CHANGE_SWITCH_SETTINGS = "change_switch_settings"
+SERVICE_DUMP_INSTRUMENTATION = "dump_instrumentation"
+CONF_RESET = "reset"
+DOCS[CONF_RESET] = "Whether to clear the measurements after dumping them. 🧹"
 CONF_USE_DEFAULTS = "use_defaults"
 DOCS[CONF_USE_DEFAULTS] = (
     "Sets the default values not specified in this service call. Options: "
@@ -347,8 +393,16 @@ VALIDATION_TUPLES = [
     ),
     (CONF_BRIGHTNESS_MODE_TIME_DARK, DEFAULT_BRIGHTNESS_MODE_TIME_DARK, int),
     (CONF_BRIGHTNESS_MODE_TIME_LIGHT, DEFAULT_BRIGHTNESS_MODE_TIME_LIGHT, int),
+    (
+        CONF_DAY_CURVE_RESOLUTION,
+        DEFAULT_DAY_CURVE_RESOLUTION,
+        int_between(0, 60 * 60),
+    ),
     (CONF_TAKE_OVER_CONTROL, DEFAULT_TAKE_OVER_CONTROL, bool),
     (CONF_DETECT_NON_HA_CHANGES, DEFAULT_DETECT_NON_HA_CHANGES, bool),
+    (CONF_REFRESH_CONCURRENCY, DEFAULT_REFRESH_CONCURRENCY, int_between(1, 100)),
+    (CONF_REFRESH_TIMEOUT, DEFAULT_REFRESH_TIMEOUT, cv.positive_float),
+    (CONF_STATE_FRESHNESS, DEFAULT_STATE_FRESHNESS, cv.positive_float),
     (
         CONF_AUTORESET_CONTROL,
         DEFAULT_AUTORESET_CONTROL,
@@ -358,6 +412,7 @@ VALIDATION_TUPLES = [
     (CONF_ADAPT_ONLY_ON_BARE_TURN_ON, DEFAULT_ADAPT_ONLY_ON_BARE_TURN_ON, bool),
     (CONF_SEPARATE_TURN_ON_COMMANDS, DEFAULT_SEPARATE_TURN_ON_COMMANDS, bool),
     (CONF_SEND_SPLIT_DELAY, DEFAULT_SEND_SPLIT_DELAY, int_between(0, 10000)),
+    (CONF_MAX_CALLS_PER_SECOND, DEFAULT_MAX_CALLS_PER_SECOND, cv.positive_float),
     (CONF_ADAPT_DELAY, DEFAULT_ADAPT_DELAY, cv.positive_float),
     (
         CONF_SKIP_REDUNDANT_COMMANDS,
@@ -367,6 +422,7 @@ VALIDATION_TUPLES = [
     (CONF_INTERCEPT, DEFAULT_INTERCEPT, bool),
     (CONF_MULTI_LIGHT_INTERCEPT, DEFAULT_MULTI_LIGHT_INTERCEPT, bool),
     (CONF_INCLUDE_CONFIG_IN_ATTRIBUTES, DEFAULT_INCLUDE_CONFIG_IN_ATTRIBUTES, bool),
+    (CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION, bool),
 ]
 
 
@@ -392,6 +448,7 @@ EXTRA_VALIDATION = {
     CONF_MAX_SUNSET_TIME: (cv.time, str),
     CONF_BRIGHTNESS_MODE_TIME_LIGHT: (cv.time_period, timedelta_as_int),
     CONF_BRIGHTNESS_MODE_TIME_DARK: (cv.time_period, timedelta_as_int),
+    CONF_DAY_CURVE_RESOLUTION: (cv.time_period, timedelta_as_int),
 }
 
 
@@ -446,3 +503,7 @@ SET_MANUAL_CONTROL_SCHEMA = vol.Schema(
         vol.Optional(CONF_MANUAL_CONTROL, default=True): cv.boolean,
     },
 )
+
+DUMP_INSTRUMENTATION_SCHEMA = vol.Schema(
+    {vol.Optional(CONF_RESET, default=False): cv.boolean},
+)
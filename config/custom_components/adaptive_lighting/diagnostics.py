@@ -0,0 +1,41 @@
+"""Diagnostics support for Adaptive Lighting."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+
+from .const import ATTR_ADAPTIVE_LIGHTING_MANAGER, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+) -> dict[str, Any]:
+    """Return the switch's configuration, state and instrumentation."""
+    data = hass.data.get(DOMAIN, {})
+    diagnostics: dict[str, Any] = {
+        "data": dict(config_entry.data),
+        "options": dict(config_entry.options),
+    }
+    switch = data.get(config_entry.entry_id, {}).get(SWITCH_DOMAIN)
+    if switch is not None:
+        diagnostics["switch"] = {
+            "is_on": switch.is_on,
+            "lights": switch.lights,
+            "manual_control": [
+                light
+                for light in switch.lights
+                if switch.manager.manual_control.get(light)
+            ],
+            # pylint: disable=protected-access
+            "last_interval_timing": switch._last_interval_timing,
+        }
+    manager = data.get(ATTR_ADAPTIVE_LIGHTING_MANAGER)
+    if manager is not None:
+        diagnostics["instrumentation"] = manager.instrumentation_snapshot()
+    return diagnostics
@@ -0,0 +1,132 @@
+"""Opt-in timings and counters of Adaptive Lighting's hot paths."""
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from typing import Any
+
+# Upper bounds in seconds of the histogram buckets, the last bucket is unbounded
+HISTOGRAM_BOUNDS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Group of the measurements that do not belong to a single switch
+MANAGER_GROUP = "manager"
+
+
+class Histogram:
+    """Distribution of durations over fixed buckets."""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a duration."""
+        self.buckets[bisect.bisect_left(HISTOGRAM_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram with only its non-empty buckets."""
+        labels = [f"<={bound}s" for bound in HISTOGRAM_BOUNDS] + [
+            f">{HISTOGRAM_BOUNDS[-1]}s",
+        ]
+        return {
+            "count": self.count,
+            "mean_seconds": self.total / self.count if self.count else 0.0,
+            "max_seconds": self.max,
+            "buckets": {
+                label: n for label, n in zip(labels, self.buckets, strict=True) if n
+            },
+        }
+
+
+class Instrumentation:
+    """Histograms and counters, grouped by switch name.
+
+    Switches opt in with set_enabled. Measurements of a switch are only
+    recorded while it is enabled, and those of the manager (MANAGER_GROUP)
+    while any switch is.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without any switch enabled."""
+        self.enabled_switches: set[str] = set()
+        self.histograms: dict[str, dict[str, Histogram]] = {}
+        self.counters: dict[str, Counter[str]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether any switch collects measurements."""
+        return bool(self.enabled_switches)
+
+    def set_enabled(self, switch_name: str, enabled: bool) -> None:
+        """Start or stop collecting measurements for a switch."""
+        if enabled:
+            self.enabled_switches.add(switch_name)
+        else:
+            self.enabled_switches.discard(switch_name)
+
+    def _is_recording(self, group: str) -> bool:
+        if group == MANAGER_GROUP:
+            return self.enabled
+        return group in self.enabled_switches
+
+    def record_time(self, group: str, name: str, seconds: float) -> None:
+        """Add a duration to the 'name' histogram of 'group'."""
+        if not self._is_recording(group):
+            return
+        histograms = self.histograms.setdefault(group, {})
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = Histogram()
+        histogram.record(seconds)
+
+    def count(self, group: str, name: str, n: int = 1) -> None:
+        """Increase the 'name' counter of 'group'."""
+        if self._is_recording(group):
+            self.counters.setdefault(group, Counter())[name] += n
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all measurements, JSON serializable."""
+        groups = sorted(set(self.histograms) | set(self.counters))
+        return {
+            "enabled_switches": sorted(self.enabled_switches),
+            "groups": {
+                group: {
+                    "counters": dict(self.counters.get(group, {})),
+                    "histograms": {
+                        name: histogram.as_dict()
+                        for name, histogram in self.histograms.get(group, {}).items()
+                    },
+                }
+                for group in groups
+            },
+        }
+
+    def reset(self) -> None:
+        """Forget all measurements."""
+        self.histograms.clear()
+        self.counters.clear()
@@ -1,12 +1,16 @@
 """Switch for the Adaptive Lighting integration."""
+
 from __future__ import annotations
 
 import asyncio
 import datetime
 import logging
+import math
 import zoneinfo
+from collections.abc import Iterator, MutableMapping
 from copy import deepcopy
 from datetime import timedelta
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
 
 import homeassistant.helpers.config_validation as cv
@@ -65,7 +69,9 @@ from homeassistant.core import (
     Event,
     HomeAssistant,
     ServiceCall,
+    ServiceResponse,
     State,
+    SupportsResponse,
     callback,
 )
 from homeassistant.helpers import entity_platform, entity_registry
@@ -78,10 +84,6 @@ from homeassistant.helpers.sun import get_astral_location
 from homeassistant.helpers.template import area_entities
 from homeassistant.loader import bind_hass
 from homeassistant.util import slugify
-from homeassistant.util.color import (
-    color_temperature_to_rgb,
-    color_xy_to_RGB,
-)
 
 from .adaptation_utils import (
     BRIGHTNESS_ATTRS,
@@ -90,7 +92,11 @@ from .adaptation_utils import (
     ServiceData,
     prepare_adaptation_data,
 )
-from .color_and_brightness import SunLightSettings
+from .color_and_brightness import (
+    SunLightSettings,
+    cached_color_temperature_to_rgb,
+    cached_color_xy_to_RGB,
+)
 from .const import (
     ADAPT_BRIGHTNESS_SWITCH,
     ADAPT_COLOR_SWITCH,
@@ -104,14 +110,17 @@ from .const import (
     CONF_BRIGHTNESS_MODE,
     CONF_BRIGHTNESS_MODE_TIME_DARK,
     CONF_BRIGHTNESS_MODE_TIME_LIGHT,
+    CONF_DAY_CURVE_RESOLUTION,
     CONF_DETECT_NON_HA_CHANGES,
     CONF_INCLUDE_CONFIG_IN_ATTRIBUTES,
     CONF_INITIAL_TRANSITION,
+    CONF_INSTRUMENTATION,
     CONF_INTERCEPT,
     CONF_INTERVAL,
     CONF_LIGHTS,
     CONF_MANUAL_CONTROL,
     CONF_MAX_BRIGHTNESS,
+    CONF_MAX_CALLS_PER_SECOND,
     CONF_MAX_COLOR_TEMP,
     CONF_MAX_SUNRISE_TIME,
     CONF_MAX_SUNSET_TIME,
@@ -122,6 +131,9 @@ from .const import (
     CONF_MULTI_LIGHT_INTERCEPT,
     CONF_ONLY_ONCE,
     CONF_PREFER_RGB_COLOR,
+    CONF_REFRESH_CONCURRENCY,
+    CONF_REFRESH_TIMEOUT,
+    CONF_RESET,
     CONF_SEND_SPLIT_DELAY,
     CONF_SEPARATE_TURN_ON_COMMANDS,
     CONF_SKIP_REDUNDANT_COMMANDS,
@@ -130,6 +142,7 @@ from .const import (
     CONF_SLEEP_RGB_COLOR,
     CONF_SLEEP_RGB_OR_COLOR_TEMP,
     CONF_SLEEP_TRANSITION,
+    CONF_STATE_FRESHNESS,
     CONF_SUNRISE_OFFSET,
     CONF_SUNRISE_TIME,
     CONF_SUNSET_OFFSET,
@@ -139,6 +152,7 @@ from .const import (
     CONF_TURN_ON_LIGHTS,
     CONF_USE_DEFAULTS,
     DOMAIN,
+    DUMP_INSTRUMENTATION_SCHEMA,
     EXTRA_VALIDATION,
     ICON_BRIGHTNESS,
     ICON_COLOR_TEMP,
@@ -146,6 +160,7 @@ from .const import (
     ICON_SLEEP,
     SERVICE_APPLY,
     SERVICE_CHANGE_SWITCH_SETTINGS,
+    SERVICE_DUMP_INSTRUMENTATION,
     SERVICE_SET_MANUAL_CONTROL,
     SET_MANUAL_CONTROL_SCHEMA,
     SLEEP_MODE_SWITCH,
@@ -162,6 +177,7 @@ from .helpers import (
     remove_vowels,
     short_hash,
 )
+from .instrumentation import MANAGER_GROUP, Instrumentation
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine, Iterable
@@ -181,11 +197,19 @@ _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=10)
 
+# Switches with identical settings share the light settings computed for the
+# same bucket of this size, see AdaptiveLightingManager.get_settings
+SETTINGS_TIME_BUCKET = timedelta(seconds=5)
+
 # Consider it a significant change when attribute changes more than
 BRIGHTNESS_CHANGE = 25  # ≈10% of total range
 COLOR_TEMP_CHANGE = 100  # ≈3% of total range (2000-6500)
 RGB_REDMEAN_CHANGE = 80  # ≈10% of total range
 
+# Keep at most this many 'state_changed' states per light in
+# AdaptiveLightingManager.our_last_state_on_change
+MAX_TRACKED_STATES = 8
+
 
 # Keep a short domain version for the context instances (which can only be 36 chars)
 _DOMAIN_SHORT = "al"
@@ -240,22 +264,11 @@ def _switches_with_lights(
     expand_light_groups: bool = True,
 ) -> list[AdaptiveSwitch]:
     """Get all switches that control at least one of the lights passed."""
-    config_entries = hass.config_entries.async_entries(DOMAIN)
-    data = hass.data[DOMAIN]
-    switches = []
+    manager = hass.data[DOMAIN][ATTR_ADAPTIVE_LIGHTING_MANAGER]
     all_check_lights = (
         _expand_light_groups(hass, lights) if expand_light_groups else set(lights)
     )
-    for config in config_entries:
-        entry = data.get(config.entry_id)
-        if entry is None:  # entry might be disabled and therefore missing
-            continue
-        switch = data[config.entry_id][SWITCH_DOMAIN]
-        switch._expand_light_groups()
-        # Check if any of the lights are in the switch's lights
-        if set(switch.lights) & set(all_check_lights):
-            switches.append(switch)
-    return switches
+    return manager.switches_with_lights(all_check_lights)
 
 
 class NoSwitchFoundError(ValueError):
@@ -359,6 +372,8 @@ async def handle_change_switch_settings(
     # deep copy the defaults so we don't modify the original dicts
     switch._set_changeable_settings(data=data, defaults=deepcopy(defaults))
     switch._update_time_interval_listener()
+    # Picks up changed light groups and 'autoreset_control_seconds'
+    switch._expand_light_groups()
 
     _LOGGER.debug(
         "Called 'adaptive_lighting.change_switch_settings' service with '%s'",
@@ -547,6 +562,25 @@ async def async_setup_entry(  # noqa: PLR0915
         schema=SET_MANUAL_CONTROL_SCHEMA,
     )
 
+    @callback
+    def handle_dump_instrumentation(service_call: ServiceCall) -> ServiceResponse:
+        """Return and log what switches with `instrumentation` enabled measured."""
+        manager = hass.data[DOMAIN][ATTR_ADAPTIVE_LIGHTING_MANAGER]
+        snapshot = manager.instrumentation_snapshot()
+        _LOGGER.info("Adaptive Lighting instrumentation: %s", snapshot)
+        if service_call.data[CONF_RESET]:
+            manager.instrumentation.reset()
+        return snapshot
+
+    # Register `dump_instrumentation` service
+    hass.services.async_register(
+        domain=DOMAIN,
+        service=SERVICE_DUMP_INSTRUMENTATION,
+        service_func=handle_dump_instrumentation,
+        schema=DUMP_INSTRUMENTATION_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     args = {vol.Optional(CONF_USE_DEFAULTS, default="current"): cv.string}
     # Modifying these after init isn't possible
     skip = (CONF_INTERVAL, CONF_NAME, CONF_LIGHTS)
@@ -627,21 +661,56 @@ def _expand_light_groups(
     return sorted(all_lights)
 
 
+def _event_data(event_or_data: Event | dict[str, Any]) -> dict[str, Any]:
+    """Get the data of an event passed to a bus event filter.
+
+    Since HA 2024.4 filters get the event's data instead of the event.
+    """
+    return getattr(event_or_data, "data", event_or_data)
+
+
 def _is_light_group(state: State) -> bool:
     return "entity_id" in state.attributes
 
 
 @bind_hass
-def _supported_features(hass: HomeAssistant, light: str) -> set[str]:
+def _supported_features(
+    hass: HomeAssistant,
+    light: str,
+    profiles: MutableMapping[str, tuple[int, Any, frozenset[str]]] | None = None,
+) -> frozenset[str]:
+    """Get the capability profile of a light.
+
+    With 'profiles', the manager's capability_profiles, the profile is only
+    derived again when the light's capabilities changed.
+    """
     state = hass.states.get(light)
     assert state is not None
     supported_features = state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
     assert isinstance(supported_features, int)
+    supported_color_modes = state.attributes.get(ATTR_SUPPORTED_COLOR_MODES, set())
+
+    cached = profiles.get(light) if profiles is not None else None
+    if (
+        cached is not None
+        and cached[0] == supported_features
+        and cached[1] == supported_color_modes
+    ):
+        return cached[2]
+    supported = _capability_profile(supported_features, supported_color_modes)
+    if profiles is not None:
+        profiles[light] = (supported_features, supported_color_modes, supported)
+    return supported
+
+
+def _capability_profile(
+    supported_features: int,
+    supported_color_modes: Iterable[str],
+) -> frozenset[str]:
     supported = {
         key for key, value in _SUPPORT_OPTS.items() if supported_features & value
     }
 
-    supported_color_modes = state.attributes.get(ATTR_SUPPORTED_COLOR_MODES, set())
     color_modes = {
         COLOR_MODE_RGB,
         COLOR_MODE_RGBW,
@@ -664,7 +733,18 @@ def _supported_features(hass: HomeAssistant, light: str) -> set[str]:
     if COLOR_MODE_BRIGHTNESS in supported_color_modes:
         supported.add("brightness")
 
-    return supported
+    return frozenset(supported)
+
+
+def _service_data_key(service_data: ServiceData) -> tuple:
+    """Get a hashable key of the service data, without the entity_id."""
+    return tuple(
+        sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in service_data.items()
+            if key != ATTR_ENTITY_ID
+        ),
+    )
 
 
 # All comparisons should be done with RGB since
@@ -675,9 +755,9 @@ def _convert_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
 
     rgb = None
     if (color := attributes.get(ATTR_COLOR_TEMP_KELVIN)) is not None:
-        rgb = color_temperature_to_rgb(color)
+        rgb = cached_color_temperature_to_rgb(color)
     elif (color := attributes.get(ATTR_XY_COLOR)) is not None:
-        rgb = color_xy_to_RGB(*color)
+        rgb = cached_color_xy_to_RGB(*color)
 
     if rgb is not None:
         attributes[ATTR_RGB_COLOR] = rgb
@@ -780,6 +860,9 @@ def _attributes_have_changed(
 class AdaptiveSwitch(SwitchEntity, RestoreEntity):
     """Representation of a Adaptive Lighting switch."""
 
+    # Changes on every tick and is only useful live, so keep it out of history
+    _unrecorded_attributes = frozenset({"last_interval_timing"})
+
     def __init__(
         self,
         hass,
@@ -803,6 +886,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         self._name = data[CONF_NAME]
         self._interval: timedelta = data[CONF_INTERVAL]
         self.lights: list[str] = data[CONF_LIGHTS]
+        self.manager.set_switch_lights(self, self.lights)
 
         # backup data for use in change_switch_settings "configuration" CONF_USE_DEFAULTS
         self._config_backup = deepcopy(data)
@@ -818,6 +902,13 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         # Set in self._update_attrs_and_maybe_adapt_lights
         self._settings: dict[str, Any] = {}
 
+        # Seconds spent in the stages of the last finished 'interval' update,
+        # shown from the state written by the next update
+        self._last_interval_timing: dict[str, float] = {}
+
+        # Light that 'interval' updates start adapting at, see _adapt_lights
+        self._interval_rotation: int = 0
+
         # Set and unset tracker in async_turn_on and async_turn_off
         self.remove_listeners: list[CALLBACK_TYPE] = []
         self.remove_interval: CALLBACK_TYPE = lambda: None
@@ -867,6 +958,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         self._transition = data[CONF_TRANSITION]
         self._adapt_delay = data[CONF_ADAPT_DELAY]
         self._send_split_delay = data[CONF_SEND_SPLIT_DELAY]
+        self._max_calls_per_second = data[CONF_MAX_CALLS_PER_SECOND]
         self._take_over_control = data[CONF_TAKE_OVER_CONTROL]
         if not data[CONF_TAKE_OVER_CONTROL] and (
             data[CONF_DETECT_NON_HA_CHANGES] or data[CONF_ADAPT_ONLY_ON_BARE_TURN_ON]
@@ -879,6 +971,13 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             )
             self._take_over_control = True
         self._detect_non_ha_changes = data[CONF_DETECT_NON_HA_CHANGES]
+        self._refresh_concurrency = data[CONF_REFRESH_CONCURRENCY]
+        self.manager.instrumentation.set_enabled(
+            self._name,
+            data[CONF_INSTRUMENTATION],
+        )
+        self._refresh_timeout = data[CONF_REFRESH_TIMEOUT]
+        self._state_freshness = data[CONF_STATE_FRESHNESS]
         self._adapt_only_on_bare_turn_on = data[CONF_ADAPT_ONLY_ON_BARE_TURN_ON]
         self._auto_reset_manual_control_time = data[CONF_AUTORESET_CONTROL]
         self._skip_redundant_commands = data[CONF_SKIP_REDUNDANT_COMMANDS]
@@ -919,6 +1018,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             brightness_mode_time_dark=data[CONF_BRIGHTNESS_MODE_TIME_DARK],
             brightness_mode_time_light=data[CONF_BRIGHTNESS_MODE_TIME_LIGHT],
             timezone=zoneinfo.ZoneInfo(self.hass.config.time_zone),
+            day_curve_resolution=data[CONF_DAY_CURVE_RESOLUTION] or None,
         )
         _LOGGER.debug(
             "%s: Set switch settings for lights '%s'. now using data: '%s'",
@@ -962,6 +1062,8 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
     async def async_will_remove_from_hass(self):
         """Remove the listeners upon removing the component."""
         self._remove_listeners()
+        self.manager.remove_switch(self)
+        self.manager.instrumentation.set_enabled(self._name, False)
 
     def _expand_light_groups(self) -> None:
         all_lights = _expand_light_groups(self.hass, self.lights)
@@ -971,6 +1073,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             self._auto_reset_manual_control_time,
         )
         self.lights = list(all_lights)
+        self.manager.set_switch_lights(self, self.lights)
 
     async def _setup_listeners(self, _=None) -> None:
         _LOGGER.debug("%s: Called '_setup_listeners'", self._name)
@@ -1028,10 +1131,11 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             + timedelta(seconds=processing_overhead_time)
         )
 
-        self.remove_interval = async_track_time_interval(
-            self.hass,
-            action=self._async_update_at_interval_action,
-            interval=adaptation_interval,
+        # Switches with the same (rounded up) interval are updated on one tick
+        self.remove_interval = self.manager.interval_scheduler.subscribe(
+            adaptation_interval,
+            self._async_update_at_interval_action,
+            self._max_calls_per_second,
         )
 
     def _call_on_remove_callbacks(self) -> None:
@@ -1042,6 +1146,8 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         # is not called in `add_to_platform_abort`.
         # See https://github.com/basnijholt/adaptive-lighting/issues/658
         self._remove_listeners()
+        self.manager.remove_switch(self)
+        self.manager.instrumentation.set_enabled(self._name, False)
         try:
             # HACK: this is a private method in `Entity` which can change
             super()._call_on_remove_callbacks()
@@ -1079,6 +1185,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             light for light in self.lights if self.manager.manual_control.get(light)
         ]
         extra_state_attributes.update(self._settings)
+        extra_state_attributes["last_interval_timing"] = self._last_interval_timing
         timers = self.manager.auto_reset_manual_control_timers
         extra_state_attributes["autoreset_time_remaining"] = {
             light: time
@@ -1129,11 +1236,20 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
 
     async def _async_update_at_interval_action(self, now=None) -> None:  # noqa: ARG002
         """Update the attributes and maybe adapt the lights."""
+        start = self.hass.loop.time()
+        timing = {"refresh_seconds": 0.0, "adapt_seconds": 0.0}
         await self._update_attrs_and_maybe_adapt_lights(
             context=self.create_context("interval"),
             transition=self._transition,
             force=False,
+            timing=timing,
         )
+        timing["total_seconds"] = self.hass.loop.time() - start
+        # The state is written before the lights are adapted, so the timing is
+        # shown by the next write instead of writing the state a second time
+        self._last_interval_timing = {
+            key: round(seconds, 3) for key, seconds in timing.items()
+        }
 
     async def prepare_adaptation_data(
         self,
@@ -1165,14 +1281,19 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             return None
 
         # The switch might be off and not have _settings set.
-        self._settings = self._sun_light_settings.get_settings(
+        self._settings = self.manager.get_settings(
+            self._sun_light_settings,
             self.sleep_mode_switch.is_on,
             transition,
         )
 
         # Build service data.
         service_data: dict[str, Any] = {ATTR_ENTITY_ID: light}
-        features = _supported_features(self.hass, light)
+        features = _supported_features(
+            self.hass,
+            light,
+            self.manager.capability_profiles,
+        )
 
         # Check transition == 0 to fix #378
         use_transition = "transition" in features and transition > 0
@@ -1276,6 +1397,11 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
 
             if not service_data:
                 # All service datas processed
+                if is_first_call:
+                    self.manager.instrumentation.count(
+                        self._name,
+                        "skipped_calls_redundant",
+                    )
                 break
 
             if (
@@ -1290,8 +1416,13 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
                     self._name,
                     data.entity_id,
                 )
+                self.manager.instrumentation.count(self._name, "skipped_calls_off")
                 return
 
+            # Turning the light off cancels this task, which releases the slot
+            if is_our_context(data.context, "interval"):
+                await self.manager.interval_scheduler.wait_for_call_slot()
+
             _LOGGER.debug(
                 "%s: Scheduling 'light.turn_on' with the following 'service_data': %s"
                 " with context.id='%s'",
@@ -1301,12 +1432,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             )
             light = service_data[ATTR_ENTITY_ID]
             self.manager.last_service_data[light] = service_data
-            await self.hass.services.async_call(
-                LIGHT_DOMAIN,
-                SERVICE_TURN_ON,
-                service_data,
-                context=data.context,
-            )
+            await self._call_light_turn_on(service_data, data.context)
 
     async def execute_cancellable_adaptation_calls(
         self,
@@ -1325,8 +1451,8 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             data,
         )
         # Execute adaptation calls within a task
+        task = asyncio.ensure_future(self._execute_adaptation_calls(data))
         try:
-            task = asyncio.ensure_future(self._execute_adaptation_calls(data))
             if data.which in ("both", "brightness"):
                 self.manager.adaptation_tasks_brightness[data.entity_id] = task
             if data.which in ("both", "color"):
@@ -1339,6 +1465,8 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
                 data.entity_id,
                 data,
             )
+        finally:
+            self.manager.discard_adaptation_task(data.entity_id, task)
 
     async def _update_attrs_and_maybe_adapt_lights(  # noqa: PLR0912
         self,
@@ -1347,8 +1475,16 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         lights: list[str] | None = None,
         transition: int | None = None,
         force: bool = False,
+        timing: dict[str, float] | None = None,
     ) -> None:
+        """Update the switch's attributes and adapt the lights that need it.
+
+        If 'timing' is passed, the seconds spent updating light states for
+        `detect_non_ha_changes` and adapting lights are stored in it.
+        """
         assert context is not None
+        if timing is None:
+            timing = {}
         _LOGGER.debug(
             "%s: '_update_attrs_and_maybe_adapt_lights' called with context.id='%s'"
             " lights: '%s', transition: '%s', force: '%s'",
@@ -1360,7 +1496,8 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         )
         assert self.is_on
         self._settings.update(
-            self._sun_light_settings.get_settings(
+            self.manager.get_settings(
+                self._sun_light_settings,
                 self.sleep_mode_switch.is_on,
                 transition,
             ),
@@ -1415,7 +1552,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         adapt_color = self.adapt_color_switch.is_on
         assert isinstance(adapt_brightness, bool)
         assert isinstance(adapt_color, bool)
-        tasks = []
+        candidate_lights = []
         for light in filtered_lights:
             manually_controlled = (
                 self._take_over_control
@@ -1435,41 +1572,235 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
                     context.id,
                 )
                 continue
+            candidate_lights.append(light)
 
+        detect_changes = (
+            self._take_over_control and self._detect_non_ha_changes and not force
+        )
+        not_refreshed: set[str] = set()
+        if detect_changes:
+            start = self.hass.loop.time()
+            # Note: This updates the states of the lights
+            # so they might suddenly be off.
+            not_refreshed = await self.manager.refresh_light_states(
+                candidate_lights,
+                concurrency=self._refresh_concurrency,
+                timeout=self._refresh_timeout,
+                freshness=self._state_freshness,
+            )
+            timing["refresh_seconds"] = self.hass.loop.time() - start
+
+        lights_to_adapt = []
+        for light in candidate_lights:
             significant_change = (
-                self._take_over_control
-                and self._detect_non_ha_changes
-                and not force
-                # Note: This call updates the state of the light
-                # so it might suddenly be off.
+                detect_changes
+                and light not in not_refreshed
                 and await self.manager.significant_change(
                     self,
                     light,
                     adapt_brightness,
                     adapt_color,
                     context,
+                    refresh=False,
                 )
             )
             if significant_change:
                 _fire_manual_control_event(self, light, context)
                 continue
 
-            _LOGGER.debug(
-                "%s: Calling _adapt_light from _update_attrs_and_maybe_adapt_lights:"
-                " '%s' with transition %s and context.id=%s",
-                self._name,
+            lights_to_adapt.append(light)
+
+        if lights_to_adapt:
+            start = self.hass.loop.time()
+            await self._adapt_lights(lights_to_adapt, context, transition, force)
+            timing["adapt_seconds"] = self.hass.loop.time() - start
+
+    async def _adapt_lights(
+        self,
+        lights: list[str],
+        context: Context,
+        transition: int | None,
+        force: bool,
+    ) -> None:
+        """Adapt lights, with one 'light.turn_on' per group of identical data.
+
+        Lights whose service data only differs in the entity_id are adapted with
+        a single multi-entity call, and lights whose data is entirely redundant
+        with their state are skipped. Split commands are still sent per light,
+        because their calls are spaced out by transitions.
+
+        'interval' updates start at the next light on every tick. Call slots are
+        reserved in order and the next tick cancels what is still waiting, so
+        with a fixed order a tight budget would starve the same last lights.
+        """
+        if lights and is_our_context(context, "interval"):
+            offset = self._interval_rotation % len(lights)
+            lights = lights[offset:] + lights[:offset]
+            self._interval_rotation += 1
+
+        if self._separate_turn_on_commands:
+            tasks = []
+            for light in lights:
+                _LOGGER.debug(
+                    "%s: Calling _adapt_light from _adapt_lights:"
+                    " '%s' with transition %s and context.id=%s",
+                    self._name,
+                    light,
+                    transition,
+                    context.id,
+                )
+                coro = self._adapt_light(light, context, transition, force=force)
+                tasks.append(self.hass.async_create_task(coro))
+            await asyncio.gather(*tasks)
+            return
+
+        batches: dict[tuple, list[tuple[AdaptationData, ServiceData]]] = {}
+        for light in lights:
+            if (lock := self.manager.turn_off_locks.get(light)) and lock.locked():
+                _LOGGER.debug("%s: '%s' is locked", self._name, light)
+                continue
+            data = await self.prepare_adaptation_data(
                 light,
                 transition,
-                context.id,
+                force=force,
+                context=context,
             )
-            coro = self._adapt_light(light, context, transition, force=force)
-            task = self.hass.async_create_task(
-                coro,
+            if data is None:
+                continue  # nothing to adapt
+            # Without split commands there is one call, filtered by state if enabled
+            service_data = await data.next_service_call_data()
+            if not service_data:
+                _LOGGER.debug(
+                    "%s: Skipping adaptation of %s because it is already adapted",
+                    self._name,
+                    light,
+                )
+                self.manager.instrumentation.count(
+                    self._name,
+                    "skipped_calls_redundant",
+                )
+                continue
+            key = _service_data_key(service_data)
+            batches.setdefault(key, []).append((data, service_data))
+
+        tasks = [
+            self.hass.async_create_task(
+                self.execute_cancellable_batched_adaptation_call(batch),
             )
-            tasks.append(task)
+            for batch in batches.values()
+        ]
         if tasks:
             await asyncio.gather(*tasks)
 
+    async def _execute_batched_adaptation_call(
+        self,
+        batch: list[tuple[AdaptationData, ServiceData]],
+        call: _BatchedCall,
+    ) -> None:
+        """Call 'light.turn_on' once for lights that get identical service data.
+
+        Lights dropped from 'call' are left out, up to the moment of sending.
+        """
+        lights = []
+        for data, service_data in batch:
+            if data.entity_id not in call.pending:
+                continue
+            if (
+                not data.force
+                and not is_on(self.hass, data.entity_id)
+                # if proactively adapting, we are sure that it came from a `light.turn_on`
+                and not self.manager.is_proactively_adapting(data.context.id)
+            ):
+                # Do a last-minute check if the entity is still on.
+                _LOGGER.debug(
+                    "%s: Skipping adaptation of %s because it is now off",
+                    self._name,
+                    data.entity_id,
+                )
+                self.manager.instrumentation.count(self._name, "skipped_calls_off")
+                continue
+            lights.append(data.entity_id)
+        if not lights:
+            return
+
+        data, service_data = batch[0]
+        if is_our_context(data.context, "interval"):
+            await self.manager.interval_scheduler.wait_for_call_slot(len(lights))
+            lights = [light for light in lights if light in call.pending]
+        for light in lights:
+            self.manager.last_service_data[light] = service_data
+        service_data = {
+            **service_data,
+            ATTR_ENTITY_ID: lights if len(lights) > 1 else lights[0],
+        }
+        _LOGGER.debug(
+            "%s: Scheduling 'light.turn_on' with the following 'service_data': %s"
+            " with context.id='%s'",
+            self._name,
+            service_data,
+            data.context.id,
+        )
+        await self._call_light_turn_on(service_data, data.context, len(lights))
+
+    async def _call_light_turn_on(
+        self,
+        service_data: ServiceData,
+        context: Context,
+        lights: int = 1,
+    ) -> None:
+        """Call 'light.turn_on' for adaptation, measured by instrumentation."""
+        start = self.hass.loop.time()
+        await self.hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            service_data,
+            context=context,
+        )
+        instrumentation = self.manager.instrumentation
+        instrumentation.record_time(
+            self._name,
+            "service_call",
+            self.hass.loop.time() - start,
+        )
+        instrumentation.count(self._name, "service_calls")
+        instrumentation.count(self._name, "adapted_lights", lights)
+
+    async def execute_cancellable_batched_adaptation_call(
+        self,
+        batch: list[tuple[AdaptationData, ServiceData]],
+    ):
+        """Executes a cancellable 'light.turn_on' call for a batch of lights.
+
+        Cancelling the adaptation of a light in the batch only drops that light
+        from the call; the call itself is cancelled once all lights are dropped.
+        """
+        for data, _ in batch:
+            self.manager.cancel_ongoing_adaptation_calls(
+                data.entity_id,
+                which=data.which,
+            )
+        call = _BatchedCall(data.entity_id for data, _ in batch)
+        call.task = asyncio.ensure_future(
+            self._execute_batched_adaptation_call(batch, call),
+        )
+        handles = [_BatchedCallHandle(call, data.entity_id) for data, _ in batch]
+        try:
+            for (data, _), handle in zip(batch, handles):
+                if data.which in ("both", "brightness"):
+                    self.manager.adaptation_tasks_brightness[data.entity_id] = handle
+                if data.which in ("both", "color"):
+                    self.manager.adaptation_tasks_color[data.entity_id] = handle
+            await call.task
+        except asyncio.CancelledError:
+            _LOGGER.debug(
+                "%s: Ongoing adaptation of %s cancelled",
+                self._name,
+                [data.entity_id for data, _ in batch],
+            )
+        finally:
+            for handle in handles:
+                self.manager.discard_adaptation_task(handle.light, handle)
+
     async def _respond_to_off_to_on_event(self, entity_id: str, event: Event) -> None:
         assert not self.manager.is_proactively_adapting(event.context.id)
         from_turn_on = self.manager._off_to_on_state_event_is_from_turn_on(
@@ -1617,49 +1948,112 @@ class AdaptiveLightingManager:
         self.hass = hass
         self.lights: set[str] = set()
 
+        # Everything tracked per light, the dicts below are views on these records
+        self.light_records: dict[str, _LightRecord] = {}
         # Tracks 'light.turn_off' service calls
-        self.turn_off_event: dict[str, Event] = {}
+        self.turn_off_event: MutableMapping[str, Event] = _LightRecordView(
+            self.light_records,
+            "turn_off_event",
+        )
         # Tracks 'light.turn_on' service calls
-        self.turn_on_event: dict[str, Event] = {}
+        self.turn_on_event: MutableMapping[str, Event] = _LightRecordView(
+            self.light_records,
+            "turn_on_event",
+        )
         # Tracks 'light.toggle' service calls
-        self.toggle_event: dict[str, Event] = {}
+        self.toggle_event: MutableMapping[str, Event] = _LightRecordView(
+            self.light_records,
+            "toggle_event",
+        )
         # Tracks 'on' → 'off' state changes
-        self.on_to_off_event: dict[str, Event] = {}
+        self.on_to_off_event: MutableMapping[str, Event] = _LightRecordView(
+            self.light_records,
+            "on_to_off_event",
+        )
         # Tracks 'off' → 'on' state changes
-        self.off_to_on_event: dict[str, Event] = {}
+        self.off_to_on_event: MutableMapping[str, Event] = _LightRecordView(
+            self.light_records,
+            "off_to_on_event",
+        )
         # Keep 'asyncio.sleep' tasks that can be cancelled by 'light.turn_on' events
-        self.sleep_tasks: dict[str, asyncio.Task] = {}
+        self.sleep_tasks: MutableMapping[str, asyncio.Task] = _LightRecordView(
+            self.light_records,
+            "sleep_task",
+        )
         # Locks that prevent light adjusting when waiting for a light to 'turn_off'
-        self.turn_off_locks: dict[str, asyncio.Lock] = {}
+        self.turn_off_locks: MutableMapping[str, asyncio.Lock] = _LightRecordView(
+            self.light_records,
+            "turn_off_lock",
+        )
         # Tracks which lights are manually controlled
         self.manual_control: dict[str, bool] = {}
-        # Track 'state_changed' events of self.lights resulting from this integration
-        self.our_last_state_on_change: dict[str, list[State]] = {}
+        # Track 'state_changed' events of self.lights resulting from this integration,
+        # at most MAX_TRACKED_STATES per light
+        self.our_last_state_on_change: MutableMapping[
+            str,
+            list[State],
+        ] = _LightRecordView(self.light_records, "our_last_states")
         # Track last 'service_data' to 'light.turn_on' resulting from this integration
-        self.last_service_data: dict[str, dict[str, Any]] = {}
-        # Track ongoing split adaptations to be able to cancel them
-        self.adaptation_tasks_brightness: dict[str, asyncio.Task] = {}
-        self.adaptation_tasks_color: dict[str, asyncio.Task] = {}
+        self.last_service_data: MutableMapping[
+            str,
+            dict[str, Any],
+        ] = _LightRecordView(self.light_records, "last_service_data")
+        # Track ongoing split adaptations and lights in pending batched calls
+        # to be able to cancel them
+        self.adaptation_tasks_brightness: dict[
+            str,
+            asyncio.Future | _BatchedCallHandle,
+        ] = {}
+        self.adaptation_tasks_color: dict[
+            str,
+            asyncio.Future | _BatchedCallHandle,
+        ] = {}
 
         # Track auto reset of manual_control
         self.auto_reset_manual_control_timers: dict[str, _AsyncSingleShotTimer] = {}
         self.auto_reset_manual_control_times: dict[str, float] = {}
 
         # Track light transitions
-        self.transition_timers: dict[str, _AsyncSingleShotTimer] = {}
+        self.transition_timers: MutableMapping[
+            str,
+            _AsyncSingleShotTimer,
+        ] = _LightRecordView(self.light_records, "transition_timer")
+
+        # Capability profile of each light with the (supported_features,
+        # supported_color_modes) it was derived from, see _supported_features
+        self.capability_profiles: MutableMapping[
+            str,
+            tuple[int, Any, frozenset[str]],
+        ] = _LightRecordView(self.light_records, "capability_profile")
 
         # Track _execute_cancellable_adaptation_calls tasks
         self.adaptation_tasks = set()
 
-        # Setup listeners and its callbacks to remove them later
+        # Light settings per (SunLightSettings.curve_key, time bucket, sleep)
+        self.settings_memo: dict[tuple, dict[str, Any]] = {}
+
+        # Shared interval ticks and the budget of 'light.turn_on' calls they make
+        self.interval_scheduler = _IntervalScheduler(hass)
+
+        # Timings and counters of switches with `instrumentation` enabled
+        self.instrumentation = Instrumentation()
+
+        # Switches controlling each light, kept up to date by the switches
+        # through set_switch_lights and remove_switch
+        self.switches_by_light: dict[str, list[AdaptiveSwitch]] = {}
+
+        # Setup listeners and its callbacks to remove them later. The filters
+        # run on the bus, so events for other entities never schedule a task.
         self.listener_removers = [
             self.hass.bus.async_listen(
                 EVENT_CALL_SERVICE,
                 self.turn_on_off_event_listener,
+                event_filter=self._is_light_service_call,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
                 self.state_changed_event_listener,
+                event_filter=self._is_light_state_change,
             ),
         ]
 
@@ -1695,6 +2089,86 @@ class AdaptiveLightingManager:
         for remove in self.listener_removers:
             remove()
 
+    @callback
+    def _is_light_service_call(self, event_data: Event | dict[str, Any]) -> bool:
+        """Let only 'light' service calls through to turn_on_off_event_listener."""
+        return _event_data(event_data).get(ATTR_DOMAIN) == LIGHT_DOMAIN
+
+    @callback
+    def _is_light_state_change(self, event_data: Event | dict[str, Any]) -> bool:
+        """Let only state changes of our lights through to the listener."""
+        return _event_data(event_data).get(ATTR_ENTITY_ID) in self.lights
+
+    def set_switch_lights(self, switch: AdaptiveSwitch, lights: list[str]) -> None:
+        """Index 'switch' under 'lights', replacing the lights it had before."""
+        self.remove_switch(switch)
+        for light in lights:
+            self.switches_by_light.setdefault(light, []).append(switch)
+
+    def remove_switch(self, switch: AdaptiveSwitch) -> None:
+        """Remove 'switch' from the light → switches index."""
+        for light, switches in list(self.switches_by_light.items()):
+            if switch in switches:
+                switches.remove(switch)
+                if not switches:
+                    del self.switches_by_light[light]
+
+    def switches_with_lights(self, lights: Iterable[str]) -> list[AdaptiveSwitch]:
+        """Get the switches that control at least one of 'lights'."""
+        switches: list[AdaptiveSwitch] = []
+        for light in lights:
+            for switch in self.switches_by_light.get(light, ()):
+                if switch not in switches:
+                    switches.append(switch)
+        return switches
+
+    def get_settings(
+        self,
+        sun_light_settings: SunLightSettings,
+        is_sleep: bool,
+        transition: float | None,
+    ) -> dict[str, Any]:
+        """Get the light settings of a switch, computed once per time bucket.
+
+        Switches whose settings only differ in name get the same result, which
+        is computed at the start of the bucket that 'now + transition' falls in.
+        """
+        bucket_size = SETTINGS_TIME_BUCKET.total_seconds()
+        now_ts = dt_util.utcnow().timestamp()
+        bucket = int((now_ts + (transition or 0)) // bucket_size)
+        key = (sun_light_settings.curve_key, bucket, is_sleep)
+        settings = self.settings_memo.get(key)
+        if settings is not None:
+            self.instrumentation.count(sun_light_settings.name, "settings_memo_hits")
+        else:
+            # Buckets before now are never asked for again
+            now_bucket = int(now_ts // bucket_size)
+            self.settings_memo = {
+                k: v for k, v in self.settings_memo.items() if k[1] >= now_bucket
+            }
+            dt = datetime.datetime.fromtimestamp(bucket * bucket_size, dt_util.UTC)
+            start = self.hass.loop.time()
+            settings = sun_light_settings.settings_at(dt, is_sleep)
+            self.instrumentation.record_time(
+                sun_light_settings.name,
+                "settings",
+                self.hass.loop.time() - start,
+            )
+            self.settings_memo[key] = settings
+        # Switches update their own copy of the settings
+        return dict(settings)
+
+    def instrumentation_snapshot(self) -> dict[str, Any]:
+        """Return the instrumentation's measurements and what is running now."""
+        snapshot = self.instrumentation.snapshot()
+        snapshot["running"] = {
+            "transition_timers": sum(
+                timer.is_running() for timer in self.transition_timers.values()
+            ),
+            "adaptation_tasks": sum(not task.done() for task in self.adaptation_tasks),
+        }
+        return snapshot
+
     def set_proactively_adapting(self, context_id: str, entity_id: str) -> None:
         """Declare the adaptation with context_id as proactively adapting,
         and associate it to an entity_id.
@@ -2055,7 +2529,7 @@ class AdaptiveLightingManager:
     def _handle_timer(
         self,
         light: str,
-        timers_dict: dict[str, _AsyncSingleShotTimer],
+        timers_dict: MutableMapping[str, _AsyncSingleShotTimer],
         delay: float | None,
         reset_coroutine: Callable[[], Coroutine[Any, Any, None]],
     ) -> None:
@@ -2095,6 +2569,7 @@ class AdaptiveLightingManager:
             last_transition,
             light,
         )
+        self.instrumentation.count(MANAGER_GROUP, "transition_timers_started")
 
         async def reset():
             # Called when the timer expires, doesn't need to do anything
@@ -2169,6 +2644,7 @@ class AdaptiveLightingManager:
                 light_id,
             )
             brightness_task.cancel()
+            self.instrumentation.count(MANAGER_GROUP, "cancelled_adaptation_tasks")
         if (
             which in ("both", "color")
             and color_task is not None
@@ -2182,6 +2658,7 @@ class AdaptiveLightingManager:
             )
             # color_task might be the same as brightness_task
             color_task.cancel()
+            self.instrumentation.count(MANAGER_GROUP, "cancelled_adaptation_tasks")
 
     def reset(self, *lights, reset_manual_control: bool = True) -> None:
         """Reset the 'manual_control' status of the lights."""
@@ -2194,6 +2671,40 @@ class AdaptiveLightingManager:
             self.last_service_data.pop(light, None)
             self.cancel_ongoing_adaptation_calls(light)
 
+    def forget_light(self, light: str) -> None:
+        """Drop everything tracked for a light that no longer exists.
+
+        Lights that a switch is configured with keep their place in 'lights'
+        and their auto reset time, so they are tracked again if they return.
+        """
+        self.cancel_ongoing_adaptation_calls(light)
+        self.adaptation_tasks_brightness.pop(light, None)
+        self.adaptation_tasks_color.pop(light, None)
+        self.manual_control.pop(light, None)
+        if timer := self.auto_reset_manual_control_timers.pop(light, None):
+            timer.cancel()
+        if light not in self.switches_by_light:
+            self.auto_reset_manual_control_times.pop(light, None)
+            self.lights.discard(light)
+
+        record = self.light_records.pop(light, None)
+        if record is not None:
+            if record.transition_timer is not None:
+                record.transition_timer.cancel()
+            if record.sleep_task is not None:
+                record.sleep_task.cancel()
+        _LOGGER.debug("Forgot the tracked state of removed light '%s'", light)
+
+    def discard_adaptation_task(
+        self,
+        light: str,
+        task: asyncio.Future | _BatchedCallHandle,
+    ) -> None:
+        """Stop tracking a finished adaptation of 'light', unless it was replaced."""
+        for tasks in (self.adaptation_tasks_brightness, self.adaptation_tasks_color):
+            if tasks.get(light) is task:
+                del tasks[light]
+
     def _get_entity_list(self, service_data: ServiceData) -> list[str]:
         if ATTR_ENTITY_ID in service_data:
             return cv.ensure_list_csv(service_data[ATTR_ENTITY_ID])
@@ -2286,6 +2797,30 @@ class AdaptiveLightingManager:
                     on(eid, event)
 
     async def state_changed_event_listener(self, event: Event) -> None:
+        """Track 'state_changed' events, timed if instrumentation is enabled."""
+        if not self.instrumentation.enabled:
+            await self._handle_state_changed_event(event)
+            return
+        start = self.hass.loop.time()
+        # Time the event spent on the bus before reaching this listener
+        delay = (dt_util.utcnow() - event.time_fired).total_seconds()
+        self.instrumentation.record_time(MANAGER_GROUP, "state_changed_delay", delay)
+        await self._handle_state_changed_event(event)
+        self.instrumentation.record_time(
+            MANAGER_GROUP,
+            "state_changed_handler",
+            self.hass.loop.time() - start,
+        )
+
+    def _track_our_state(self, light: str, state: State) -> None:
+        """Add a state to our_last_state_on_change, keeping the list bounded."""
+        states = self.our_last_state_on_change[light]
+        states.append(state)
+        if len(states) > MAX_TRACKED_STATES:
+            # Keep the first state, its context identifies our adaptation
+            del states[1]
+
+    async def _handle_state_changed_event(self, event: Event) -> None:
         """Track 'state_changed' events."""
         entity_id = event.data.get(ATTR_ENTITY_ID, "")
         if entity_id not in self.lights:
@@ -2293,6 +2828,10 @@ class AdaptiveLightingManager:
 
         old_state = event.data.get("old_state")
         new_state = event.data.get("new_state")
+        if new_state is None:
+            # The light was removed
+            self.forget_light(entity_id)
+            return
 
         new_on = new_state is not None and new_state.state == STATE_ON
         new_off = new_state is not None and new_state.state == STATE_OFF
@@ -2332,7 +2871,7 @@ class AdaptiveLightingManager:
                         entity_id,
                         new_state.context.id,
                     )
-                    self.our_last_state_on_change[entity_id].append(new_state)
+                    self._track_our_state(entity_id, new_state)
                 else:
                     _LOGGER.debug(
                         "AdaptiveLightingManager: New adapt '%s' found for %s",
@@ -2342,7 +2881,7 @@ class AdaptiveLightingManager:
                     self.our_last_state_on_change[entity_id] = [new_state]
                     self.start_transition_timer(entity_id)
             elif last_state is not None:
-                self.our_last_state_on_change[entity_id].append(new_state)
+                self._track_our_state(entity_id, new_state)
 
         if old_on and new_off:
             # Tracks 'on' → 'off' state changes
@@ -2440,13 +2979,15 @@ class AdaptiveLightingManager:
         adapt_brightness: bool,
         adapt_color: bool,
         context: Context,  # just for logging
+        refresh: bool = True,
     ) -> bool:
         """Has the light made a significant change since last update.
 
         This method will detect changes that were made to the light without
         calling 'light.turn_on', so outside of Home Assistant. If a change is
         detected, we mark the light as 'manually controlled' until the light
-        or switch is turned 'off' and 'on' again.
+        or switch is turned 'off' and 'on' again. Pass 'refresh=False' if the
+        state was already updated with `refresh_light_states`.
         """
         assert switch._detect_non_ha_changes
 
@@ -2457,7 +2998,8 @@ class AdaptiveLightingManager:
         # Ensure HASS is correctly updating your light's state with
         # light.turn_on calls if any problems arise. This
         # can happen e.g. using zigbee2mqtt with 'report: false' in device settings.
-        await self.hass.helpers.entity_component.async_update_entity(light)
+        if refresh:
+            await self.hass.helpers.entity_component.async_update_entity(light)
         refreshed_state = self.hass.states.get(light)
         assert refreshed_state is not None
 
@@ -2489,6 +3031,55 @@ class AdaptiveLightingManager:
         )
         return False
 
+    async def refresh_light_states(
+        self,
+        lights: list[str],
+        concurrency: int = 1,
+        timeout: float = 0,
+        freshness: float = 0,
+    ) -> set[str]:
+        """Update the states of lights before significant_change checks them.
+
+        Up to 'concurrency' lights are updated at the same time. Lights without
+        'last_service_data' are never checked, so they are not updated, and
+        neither are lights whose state was reported less than 'freshness'
+        seconds ago. Returns the lights whose update took longer than 'timeout'
+        seconds and was given up on.
+        """
+        now = dt_util.utcnow()
+        stale_lights = []
+        for light in lights:
+            if light not in self.last_service_data:
+                continue
+            state = self.hass.states.get(light)
+            if freshness and state is not None:
+                # HA<2024.3 has no 'last_reported'
+                reported = getattr(state, "last_reported", state.last_updated)
+                if (now - reported).total_seconds() < freshness:
+                    continue
+            stale_lights.append(light)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def refresh(light: str) -> bool:
+            async with semaphore:
+                try:
+                    await asyncio.wait_for(
+                        self.hass.helpers.entity_component.async_update_entity(light),
+                        timeout or None,
+                    )
+                except asyncio.TimeoutError:
+                    _LOGGER.debug(
+                        "Gave up updating the state of '%s' after %s seconds",
+                        light,
+                        timeout,
+                    )
+                    return False
+            return True
+
+        refreshed = await asyncio.gather(*(refresh(light) for light in stale_lights))
+        return {light for light, ok in zip(stale_lights, refreshed) if not ok}
+
     def _off_to_on_state_event_is_from_turn_on(
         self,
         entity_id: str,
@@ -2658,6 +3249,116 @@ class AdaptiveLightingManager:
         return False
 
 
+class _LightRecord:
+    """Everything AdaptiveLightingManager tracks for a single light."""
+
+    __slots__ = (
+        "turn_off_event",
+        "turn_on_event",
+        "toggle_event",
+        "on_to_off_event",
+        "off_to_on_event",
+        "sleep_task",
+        "turn_off_lock",
+        "our_last_states",
+        "last_service_data",
+        "transition_timer",
+        "capability_profile",
+    )
+
+    def __init__(self) -> None:
+        """Initialize a record without anything tracked."""
+        for field in self.__slots__:
+            setattr(self, field, None)
+
+    def is_empty(self) -> bool:
+        """Return whether nothing is tracked anymore."""
+        return all(getattr(self, field) is None for field in self.__slots__)
+
+
+class _LightRecordView(MutableMapping):
+    """Dict of one _LightRecord field by light, where None means missing."""
+
+    __slots__ = ("_records", "_field")
+
+    def __init__(self, records: dict[str, _LightRecord], field: str) -> None:
+        """Initialize the view on 'field' of 'records'."""
+        self._records = records
+        self._field = field
+
+    def __getitem__(self, light: str) -> Any:
+        record = self._records.get(light)
+        value = None if record is None else getattr(record, self._field)
+        if value is None:
+            raise KeyError(light)
+        return value
+
+    def __setitem__(self, light: str, value: Any) -> None:
+        record = self._records.get(light)
+        if record is None:
+            record = self._records[light] = _LightRecord()
+        setattr(record, self._field, value)
+
+    def __delitem__(self, light: str) -> None:
+        record = self._records.get(light)
+        if record is None or getattr(record, self._field) is None:
+            raise KeyError(light)
+        setattr(record, self._field, None)
+        if record.is_empty():
+            del self._records[light]
+
+    def __iter__(self) -> Iterator[str]:
+        return (
+            light
+            for light, record in list(self._records.items())
+            if getattr(record, self._field) is not None
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class _BatchedCall:
+    """A pending 'light.turn_on' call shared by a batch of lights."""
+
+    __slots__ = ("task", "pending")
+
+    def __init__(self, lights: Iterable[str]) -> None:
+        """Initialize the call for 'lights', before its task is started."""
+        self.task: asyncio.Future | None = None
+        # Lights that are still to be included in the call
+        self.pending = set(lights)
+
+    def drop(self, light: str) -> bool:
+        """Leave 'light' out of the call, cancelling it if no lights remain."""
+        if light not in self.pending or self.task is None or self.task.done():
+            return False
+        self.pending.discard(light)
+        if not self.pending:
+            self.task.cancel()
+        return True
+
+
+class _BatchedCallHandle:
+    """One light's share of a _BatchedCall, cancellable like its own task."""
+
+    __slots__ = ("call", "light")
+
+    def __init__(self, call: _BatchedCall, light: str) -> None:
+        """Initialize the handle of 'light' in 'call'."""
+        self.call = call
+        self.light = light
+
+    def cancel(self) -> bool:
+        """Drop the light from the call."""
+        return self.call.drop(self.light)
+
+    def done(self) -> bool:
+        """Return whether the light was dropped or the call has finished."""
+        task = self.call.task
+        return self.light not in self.call.pending or task is None or task.done()
+
+
 class _AsyncSingleShotTimer:
     def __init__(self, delay, callback) -> None:
         """Initialize the timer."""
@@ -2698,3 +3399,101 @@ class _AsyncSingleShotTimer:
             elapsed_time = (dt_util.utcnow() - self.start_time).total_seconds()
             return max(0, self.delay - elapsed_time)
         return 0
+
+
+class _IntervalScheduler:
+    """Run the interval updates of all switches on shared ticks.
+
+    Switches whose adaptation intervals round up to the same number of seconds
+    share one `async_track_time_interval`, so a tick wakes them together
+    instead of each switch drifting on its own timer. The 'light.turn_on'
+    calls of interval updates are spaced out to stay within the lowest
+    nonzero calls-per-second budget of the subscribed switches.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        # Subscribed (action, calls per second) per interval in seconds
+        self._subscribers: dict[int, list[tuple[Callable, float]]] = {}
+        self._remove_trackers: dict[int, Callable[[], None]] = {}
+        # Loop time at which the next 'light.turn_on' call may be made
+        self._next_call_time = 0.0
+
+    @property
+    def calls_per_second(self) -> float:
+        """Return the budget that applies, 0 if unlimited."""
+        budgets = [
+            budget
+            for subscribers in self._subscribers.values()
+            for _, budget in subscribers
+            if budget
+        ]
+        return min(budgets, default=0)
+
+    def subscribe(
+        self,
+        interval: timedelta,
+        action: Callable[[], Coroutine[Any, Any, None]],
+        calls_per_second: float = 0,
+    ) -> Callable[[], None]:
+        """Run 'action' on the tick for 'interval' and return a remove callback."""
+        seconds = max(1, math.ceil(interval.total_seconds()))
+        subscriber = (action, calls_per_second)
+        subscribers = self._subscribers.setdefault(seconds, [])
+        subscribers.append(subscriber)
+        if seconds not in self._remove_trackers:
+            self._remove_trackers[seconds] = async_track_time_interval(
+                self.hass,
+                action=partial(self._async_tick, seconds),
+                interval=timedelta(seconds=seconds),
+            )
+
+        def remove() -> None:
+            subscribers.remove(subscriber)
+            if not subscribers:
+                del self._subscribers[seconds]
+                self._remove_trackers.pop(seconds)()
+
+        return remove
+
+    async def _async_tick(self, seconds: int, now: datetime.datetime) -> None:
+        """Update every switch subscribed to the interval."""
+        actions = [action for action, _ in self._subscribers.get(seconds, [])]
+        results = await asyncio.gather(
+            *(action() for action in actions),
+            return_exceptions=True,
+        )
+        for action, result in zip(actions, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Error in interval update %s",
+                    action,
+                    exc_info=result,
+                )
+
+    async def wait_for_call_slot(self, calls: int = 1) -> None:
+        """Wait until 'calls' more calls fit in the calls-per-second budget.
+
+        Slots are reserved in order, so concurrent callers are spread out
+        evenly instead of all sending once the budget allows. A caller that is
+        cancelled while waiting gives its slots back, so adaptations cancelled
+        by the next tick do not push later calls ever further out.
+        """
+        calls_per_second = self.calls_per_second
+        if not calls_per_second:
+            return
+        now = self.hass.loop.time()
+        start = max(now, self._next_call_time)
+        duration = calls / calls_per_second
+        self._next_call_time = start + duration
+        if start <= now:
+            return
+        try:
+            await asyncio.sleep(start - now)
+        except asyncio.CancelledError:
+            self._next_call_time = max(
+                self.hass.loop.time(),
+                self._next_call_time - duration,
+            )
+            raise
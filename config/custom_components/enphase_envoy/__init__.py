@@ -16,7 +16,7 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.storage import Store
 
-from .const import COORDINATOR, DOMAIN, NAME, PLATFORMS, SENSORS, CONF_USE_ENLIGHTEN, CONF_SERIAL, PHASE_SENSORS, DEFAULT_SCAN_INTERVAL
+from .const import COORDINATOR, DOMAIN, NAME, READER, PLATFORMS, SENSORS, CONF_USE_ENLIGHTEN, CONF_SERIAL, PHASE_SENSORS, DEFAULT_SCAN_INTERVAL
 
 SCAN_INTERVAL = timedelta(seconds=60)
 STORAGE_KEY = "envoy"
@@ -24,8 +24,21 @@ STORAGE_VERSION = 1
 FETCH_RETRIES = 1
 FETCH_TIMEOUT_SECONDS = 30
 FETCH_HOLDOFF_SECONDS = 0
+FETCH_CONCURRENCY = 2
 COLLECTION_TIMEOUT_SECONDS = 55
 
+# Values read with the reader's extraction plan, batteries are built from battery_storage
+# and the battery totals are calculated by their sensors
+EXTRACTED_KEYS = (
+    [
+        description.key
+        for description in SENSORS
+        if description.key not in ["inverters", "batteries", "current_battery_capacity", "total_battery_percentage"]
+    ]
+    + [description.key for description in PHASE_SENSORS]
+    + ["grid_status", "inverters_production", "battery_storage", "envoy_info"]
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -55,12 +68,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         fetch_timeout_seconds=options.get("data_fetch_timeout_seconds", FETCH_TIMEOUT_SECONDS),
         fetch_holdoff_seconds=options.get("data_fetch_holdoff_seconds", FETCH_HOLDOFF_SECONDS),
         do_not_use_production_json=options.get("do_not_use_production_json",False),
+        fetch_concurrency=options.get("data_fetch_concurrency", FETCH_CONCURRENCY),
     )
     await envoy_reader._sync_store()
 
     async def async_update_data():
         """Fetch data from API endpoint."""
-        data = {}
         async with async_timeout.timeout(options.get("data_collection_timeout_seconds", COLLECTION_TIMEOUT_SECONDS)):
             try:
                 await envoy_reader.getData()
@@ -69,44 +82,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             except httpx.HTTPError as err:
                 raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-            for description in SENSORS:
-                if description.key == "inverters":
-                    data[
-                        "inverters_production"
-                    ] = await envoy_reader.inverters_production()
-
-                elif description.key == "batteries":
-                    battery_data = await envoy_reader.battery_storage()
-                    if isinstance(battery_data, list) and len(battery_data) > 0:
-                        battery_dict = {}
-                        for item in battery_data:
-                            battery_dict[item["serial_num"]] = item
-
-                        data[description.key] = battery_dict
-
-                elif (description.key not in ["current_battery_capacity", "total_battery_percentage"]):
-                    data[description.key] = await getattr(
-                        envoy_reader, description.key
-                    )()
-
-            for description in PHASE_SENSORS:
-                if description.key[:-2] in [
-                    "none_known_at_this_time_"
-                ]:
-                    # call phase function for these
-                    data[description.key] = await getattr(envoy_reader, description.key[:-3]+"_phase")( description.key[-2:].lower())
-
-                else:
-                
-                    #catchall for non-specified phase sensors
-                    #get attributes for phase sensors based on key name
-                    #Removes _L1, _L2 or _L3 from key to call base non-phased function
-                    #Pass l1, l2 or l3 as parameter to _phase function
-                    data[description.key] = await getattr(envoy_reader, description.key[:-3])( description.key[-2:].lower())
- 
-                        
-            data["grid_status"] = await envoy_reader.grid_status()
-            data["envoy_info"] = await envoy_reader.envoy_info()
+            # one pass over the payloads, the plan is compiled for the model after detection
+            data = envoy_reader.extract(EXTRACTED_KEYS)
+
+            battery_data = data.pop("battery_storage")
+            if isinstance(battery_data, list) and len(battery_data) > 0:
+                battery_dict = {}
+                for item in battery_data:
+                    battery_dict[item["serial_num"]] = item
+
+                data["batteries"] = battery_dict
 
             _LOGGER.debug("Retrieved data from API: %s", data)
 
@@ -125,10 +110,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryAuthFailed:
-        envoy_reader.get_inverters = False
-        await coordinator.async_config_entry_first_refresh()
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryAuthFailed:
+            envoy_reader.get_inverters = False
+            await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # setup is retried with a new reader, close this one's connections
+        await envoy_reader.close()
+        raise
 
     if not entry.unique_id:
         try:
@@ -141,6 +131,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         COORDINATOR: coordinator,
         NAME: name,
+        READER: envoy_reader,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -152,5 +143,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data[READER].close()
     return unload_ok
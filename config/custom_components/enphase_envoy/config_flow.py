@@ -45,12 +45,15 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> EnvoyRead
         await envoy_reader.getData()
     except httpx.HTTPStatusError as err:
         _LOGGER.warning("Validate input, getdata returned HTTPStatusError: %s",err)
+        await envoy_reader.close()
         raise InvalidAuth from err
     except (httpx.HTTPError) as err:
         _LOGGER.warning("Validate input, getdata returned HTTPError: %s",err)
+        await envoy_reader.close()
         raise CannotConnect from err
     except (RuntimeError) as err:
         _LOGGER.warning("Validate input, getdata returned RuntimeError: %s",err)
+        await envoy_reader.close()
         raise
 
     return envoy_reader
@@ -183,6 +186,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data[CONF_NAME] = self._async_envoy_name()
 
                 if self._reauth_entry:
+                    await envoy_reader.close()
                     self.hass.config_entries.async_update_entry(
                         self._reauth_entry,
                         data=data,
@@ -193,6 +197,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     envoy_reader
                 ):
                     data[CONF_NAME] = self._async_envoy_name()
+                await envoy_reader.close()
 
                 if self.unique_id:
                     self._abort_if_unique_id_configured({CONF_HOST: data[CONF_HOST]})
@@ -257,6 +262,12 @@ class EnvoyOptionsFlowHandler(config_entries.OptionsFlow):
                     "data_fetch_holdoff_seconds", 0
                 ),
             ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                "data_fetch_concurrency",
+                default=self.config_entry.options.get(
+                    "data_fetch_concurrency", 2
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
             vol.Optional(
                 "data_collection_timeout_seconds",
                 default=self.config_entry.options.get(
@@ -28,6 +28,7 @@ ICON = "mdi:flash"
 
 COORDINATOR = "coordinator"
 NAME = "name"
+READER = "reader"
 
 DEFAULT_SCAN_INTERVAL = 60  # default in seconds
 
@@ -12,7 +12,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import COORDINATOR, DOMAIN
+from .const import COORDINATOR, DOMAIN, READER
 
 CONF_TITLE = "title"
 
@@ -31,6 +31,7 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator: DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    envoy_reader = hass.data[DOMAIN][entry.entry_id][READER]
 
     device_registry = dr.async_get(hass)
     entity_registry = er.async_get(hass)
@@ -64,6 +65,7 @@ async def async_get_config_entry_diagnostics(
         {
             "entry": entry.as_dict(),
             "data": coordinator.data,
+            "connections": envoy_reader.connection_stats,
             "Note": "Entities that show as null are not available for your Envoy",
             "devices": devices,
         },
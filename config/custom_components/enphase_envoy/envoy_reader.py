@@ -1,6 +1,8 @@
 """Module to read production and consumption values from an Enphase Envoy on the local network."""
 import argparse
+import contextlib
 import datetime
+import functools
 import logging
 import time
 from json.decoder import JSONDecodeError
@@ -8,6 +10,7 @@ import json
 from ipaddress import IPv4Address, IPv6Address
 import sys
 import getpass
+from typing import Any, NamedTuple
 
 #Modules not in standard Python Library - add to manifest requirements
 import re
@@ -44,8 +47,25 @@ ENDPOINT_URL_METERS = "http{}://{}/ivp/meters"
 ENDPOINT_URL_METERS_REPORTS = "http{}://{}/ivp/meters/reports"
 ENDPOINT_URL_METERS_READINGS = "http{}://{}/ivp/meters/readings"
 
+# Seconds between refreshes of endpoints that are slow to serve and change slowly,
+# all other endpoints are refreshed every poll. Info and meters use
+# info_refresh_buffer_seconds. Inverters only report every 5 minutes.
+ENDPOINT_REFRESH_SECONDS = {
+    "endpoint_home_results": 300,
+    "endpoint_production_inverters": 300,
+}
+
 # pylint: disable=pointless-string-statement
 
+# Idle connections to the Envoy are kept open between polls, its TLS handshake is slow.
+# The Envoy may close them sooner, then a new connection is made on the next request.
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 120
+
+# Position of the report types in the meters reports and readings json
+METERS_REPORTS_INDEX = {"production": 0, "net-consumption": 1, "total-consumption": 2}
+METERS_READINGS_INDEX = {"production": 0, "net-consumption": 1, "total-consumption": 1}
+PHASE_INDEX = {"l1": 0, "l2": 1, "l3": 2}
+
 ENVOY_MODEL_S = "PC"
 ENVOY_MODEL_C = "P"
 ENVOY_MODEL_LEGACY = "P0"
@@ -95,6 +115,88 @@ def get_consumption_meters_phase_count(json):
     return json[1]["phaseCount"]
 
     
+def meters_reports_view(json):
+    """Return the meters reports per report type, as values per phase and None for the cumulative values."""
+    return _meters_view(json, METERS_REPORTS_INDEX, "cumulative", "lines")
+
+
+def meters_readings_view(json):
+    """Return the meters readings per report type, as values per phase and None for the totals."""
+    return _meters_view(json, METERS_READINGS_INDEX, None, "channels")
+
+
+def _meters_view(json, report_index, totals_key, phases_key):
+    """Return the values of the meters json per report type and phase, skipping missing reports."""
+    view = {}
+    for report, index in report_index.items():
+        try:
+            values = json[index]
+            phases = values.get(phases_key) or []
+            if totals_key:
+                values = values[totals_key]
+        except (KeyError, IndexError, TypeError, AttributeError):
+            continue
+        view[report] = {None: values}
+        for phase, phase_index in PHASE_INDEX.items():
+            if phase_index < len(phases):
+                view[report][phase] = phases[phase_index]
+    return view
+
+
+def float_from_json(value):
+    """Return a json number as float, keeping its decimal representation."""
+    return float(str(value))
+
+
+# Values read from the meters reports and readings: accessor name, endpoint, view,
+# report type, field, conversion and the EnvoyReader message if not available.
+# Production and lifetime production only read their phase values from the meters.
+METERS_VALUES = (
+    ("production", "endpoint_meters_reports_json_results", meters_reports_view,
+        "production", "currW", int, "message_production_not_available"),
+    ("consumption", "endpoint_meters_reports_json_results", meters_reports_view,
+        "total-consumption", "currW", int, "message_consumption_not_available"),
+    ("net_consumption", "endpoint_meters_readings_json_results", meters_readings_view,
+        "net-consumption", "instantaneousDemand", int, "message_consumption_not_available"),
+    ("lifetime_production", "endpoint_meters_reports_json_results", meters_reports_view,
+        "production", "whDlvdCum", int, "message_production_not_available"),
+    ("lifetime_net_production", "endpoint_meters_readings_json_results", meters_readings_view,
+        "net-consumption", "actEnergyRcvd", int, "message_consumption_not_available"),
+    ("lifetime_consumption", "endpoint_meters_reports_json_results", meters_reports_view,
+        "total-consumption", "whDlvdCum", int, "message_consumption_not_available"),
+    ("lifetime_net_consumption", "endpoint_meters_readings_json_results", meters_readings_view,
+        "net-consumption", "actEnergyDlvd", int, "message_consumption_not_available"),
+    ("pf", "endpoint_meters_reports_json_results", meters_reports_view,
+        "net-consumption", "pwrFactor", float_from_json, "message_pf_not_available"),
+    ("voltage", "endpoint_meters_reports_json_results", meters_reports_view,
+        "net-consumption", "rmsVoltage", float_from_json, "message_voltage_not_available"),
+    ("frequency", "endpoint_meters_reports_json_results", meters_reports_view,
+        "net-consumption", "freqHz", float_from_json, "message_frequency_not_available"),
+    ("consumption_Current", "endpoint_meters_reports_json_results", meters_reports_view,
+        "net-consumption", "rmsCurrent", float_from_json, "message_current_consumption_not_available"),
+    ("production_Current", "endpoint_meters_reports_json_results", meters_reports_view,
+        "production", "rmsCurrent", float_from_json, "message_current_production_not_available"),
+)
+
+# Extraction.missing value to raise the KeyError or IndexError of a missing value
+MISSING_RAISES = object()
+
+
+class Extraction(NamedTuple):
+    """Where a value is in the decoded json of an endpoint, see EnvoyReader.extract.
+
+    The path is looked up in the json, or in the view built from it. The missing
+    value is returned if the endpoint has no response, the path is not in it, or
+    attr is None.
+    """
+
+    attr: str | None
+    path: tuple
+    convert: Any = None
+    missing: Any = MISSING_RAISES
+    view: Any = None
+
+
 def is_ipv6_address(address: str) -> bool:
     """Check if a given string is an IPv6 address."""
     try:
@@ -173,6 +275,7 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
         fetch_holdoff_seconds=0,
         fetch_retries=1,
         do_not_use_production_json=False,
+        fetch_concurrency=1,
     ):
         """Init the EnvoyReader."""
         self.host = host.lower().replace('[','').replace(']','')
@@ -222,6 +325,23 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
         self._fetch_holdoff_seconds = fetch_holdoff_seconds
         self._fetch_retries = max(fetch_retries,1)
         self._do_not_use_production_json=do_not_use_production_json
+        # Limits the concurrent requests to this Envoy's slow web server
+        self._fetch_concurrency = max(fetch_concurrency,1)
+        self._fetch_semaphore = asyncio.Semaphore(self._fetch_concurrency)
+        # Monotonic time of the last fetch per endpoint attribute
+        self._endpoint_fetch_times = {}
+        # Only one request refreshes the token on a 401, the others retry with it
+        self._token_refresh_lock = asyncio.Lock()
+        self._token_generation = 0
+        # Connections to the Envoy are pooled by one client, closed with close()
+        self._pooled_client = None
+        self._requests_sent = 0
+        self._connections_created = 0
+        # Decoded json and views of the endpoint responses, see _decoded
+        self._snapshot = {}
+        # How values are read from the payloads, see _extraction_plan_for_setup
+        self._extraction_plan = None
+        self._extraction_plan_signature = None
 
     @property
     def _token(self):
@@ -242,32 +362,117 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
 
     @property
     def async_client(self):
-        """Return the httpx client."""
-        return self._async_client or httpx.AsyncClient(verify=False,
-                                                       headers=self._authorization_header,
-                                                       cookies=self._cookies)
+        """Return the httpx client, the reader's pooled client unless one was passed."""
+        if self._async_client:
+            return self._async_client
+        if self._pooled_client is None or self._pooled_client.is_closed:
+            self._pooled_client = httpx.AsyncClient(verify=False,
+                                                    headers=self._authorization_header,
+                                                    cookies=self._cookies,
+                                                    limits=httpx.Limits(
+                                                        max_connections=self._fetch_concurrency + 1,
+                                                        max_keepalive_connections=self._fetch_concurrency,
+                                                        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                                                    ))
+        return self._pooled_client
+
+    @property
+    def connection_stats(self):
+        """Return the number of requests to the Envoy and connections created and reused for them."""
+        return {
+            "requests": self._requests_sent,
+            "connections_created": self._connections_created,
+            "connections_reused": self._requests_sent - self._connections_created,
+        }
+
+    async def close(self):
+        """Close the pooled connections to the Envoy."""
+        _LOGGER.debug("Closing Envoy connections: %s", self.connection_stats)
+        if self._pooled_client is not None:
+            await self._pooled_client.aclose()
+            self._pooled_client = None
+
+    async def _trace_connection(self, event_name, info):
+        """Count the connections opened for requests, from httpcore trace events."""
+        if event_name == "connection.connect_tcp.complete":
+            self._connections_created += 1
 
     @property
     def non_local_async_client(self):
-        """Return the httpx client for non-local usage."""
+        """Return a new httpx client for non-local usage."""
         return self._async_client or httpx.AsyncClient(verify=True,
                                                        headers=self._authorization_header,
                                                        cookies=self._cookies)
 
-    async def _update(self):
-        """Update the data."""
+    def _decoded(self, attr, view=None):
+        """Return the decoded json of an endpoint response, or a view built from it.
+
+        Each response is decoded, and each view built, once and kept in the
+        snapshot until the endpoint is fetched again.
+        """
+        response = getattr(self, attr)
+        cached = self._snapshot.get((attr, view))
+        if cached is not None and cached[0] is response:
+            return cached[1]
+        if view is None:
+            value = response.json()
+        else:
+            value = view(self._decoded(attr))
+        self._snapshot[(attr, view)] = (response, value)
+        return value
+
+    async def _update(self, get_inverters=False):
+        """Update the data, fetching independent endpoints concurrently."""
         _LOGGER.debug("_update running")
         if self.endpoint_type == ENVOY_MODEL_S:
-            await self._update_meters_endpoint()
-            await self._update_from_pc_endpoint()
+            # The metering setup decides which endpoints to read, so it goes first
+            await self._update_meters_setup_endpoint()
+
+        updates = self._plan_updates(get_inverters)
+        _LOGGER.debug(
+            "Fetching %s endpoint updates with concurrency %s",
+            len(updates),
+            self._fetch_concurrency,
+        )
+        results = await asyncio.gather(*updates, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _plan_updates(self, get_inverters=False):
+        """Return the endpoint updates of a poll, which don't depend on each other."""
+        updates = []
+        if self.endpoint_type == ENVOY_MODEL_S:
+            updates.append(self._update_from_meters_reports_endpoint())
+            updates.append(self._update_from_meters_readings_endpoint())
+            if not self._do_not_use_production_json:
+                updates.append(self._update_endpoint(
+                    "endpoint_production_json_results", ENDPOINT_URL_PRODUCTION_JSON
+                ))
+            updates.append(self._update_endpoint(
+                "endpoint_ensemble_json_results", ENDPOINT_URL_ENSEMBLE_INVENTORY
+            ))
+            if self.has_grid_status:
+                updates.append(self._update_endpoint(
+                    "endpoint_home_json_results", ENDPOINT_URL_HOME_JSON
+                ))
         if self.endpoint_type == ENVOY_MODEL_C or (
             self.endpoint_type == ENVOY_MODEL_S and not self.isProductionMeteringEnabled
         ):
-            await self._update_from_p_endpoint()
+            updates.append(self._update_endpoint(
+                "endpoint_production_v1_results", ENDPOINT_URL_PRODUCTION_V1
+            ))
         if self.endpoint_type == ENVOY_MODEL_LEGACY:
-            await self._update_from_p0_endpoint()
-            
-        await self._update_info_endpoint()
+            updates.append(self._update_endpoint(
+                "endpoint_production_results", ENDPOINT_URL_PRODUCTION
+            ))
+            updates.append(self._update_endpoint_when_due(
+                "endpoint_home_results", ENDPOINT_URL_HOME
+            ))
+        updates.append(self._update_info_endpoint())
+        if get_inverters and self._endpoint_due("endpoint_production_inverters"):
+            updates.append(self._update_inverters_endpoint())
+        return updates
 
     async def _update_from_meters_reports_endpoint(self):
         """Update from ivp/meters endpoint."""
@@ -334,28 +539,25 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
             )
 
     async def _update_meters_endpoint(self):
-        """Update from meters endpoint if next time expried."""
+        """Update from meters endpoint if next time expried, then meters reports and readings."""
+        await self._update_meters_setup_endpoint()
+        await self._update_from_meters_reports_endpoint()
+        await self._update_from_meters_readings_endpoint()
+
+    async def _update_meters_setup_endpoint(self):
+        """Update the metering setup from meters endpoint if next time expried."""
         if self.meters_next_refresh_time <= datetime.datetime.now():
             await self._update_endpoint("endpoint_meters_json_results", ENDPOINT_URL_METERS)
 
             #some devices return [] for ivp/meters
             if self.endpoint_meters_json_results and self.endpoint_meters_json_results.text != "[]":
 
-                self.isProductionMeteringEnabled = has_production_metering_setup(
-                    self.endpoint_meters_json_results.json()
-                )
-                self.isConsumptionMeteringEnabled = has_consumption_metering_setup(
-                    self.endpoint_meters_json_results.json()
-                )
-                self.net_consumption_meters_type = has_net_consumption_meters_type(
-                    self.endpoint_meters_json_results.json()
-                )
-                self.production_meters_phase_count = get_production_meters_phase_count(
-                    self.endpoint_meters_json_results.json()
-                )
-                self.consumption_meters_phase_count = get_consumption_meters_phase_count(
-                    self.endpoint_meters_json_results.json()
-                )
+                meters_json = self._decoded("endpoint_meters_json_results")
+                self.isProductionMeteringEnabled = has_production_metering_setup(meters_json)
+                self.isConsumptionMeteringEnabled = has_consumption_metering_setup(meters_json)
+                self.net_consumption_meters_type = has_net_consumption_meters_type(meters_json)
+                self.production_meters_phase_count = get_production_meters_phase_count(meters_json)
+                self.consumption_meters_phase_count = get_consumption_meters_phase_count(meters_json)
                 self.meters_next_refresh_time = datetime.datetime.now() + datetime.timedelta(
                     seconds=self.info_refresh_buffer_seconds
                 )
@@ -371,19 +573,66 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
                 self.meters_next_refresh_time,
                 self.info_refresh_buffer_seconds,
             )
-        await self._update_from_meters_reports_endpoint()
-        await self._update_from_meters_readings_endpoint()
 
     async def _update_endpoint(self, attr, url):
         """Update a property from an endpoint."""
         formatted_url = url.format(self.https_flag, self.host)
-        response = await self._async_fetch_with_retry(
-            formatted_url, follow_redirects=False
-        )
+        async with self._fetch_semaphore:
+            response = await self._async_fetch_with_retry(
+                formatted_url, follow_redirects=False
+            )
         setattr(self, attr, response)
+        self._endpoint_fetch_times[attr] = time.monotonic()
+
+    def _endpoint_due(self, attr):
+        """Return whether the refresh interval of an endpoint passed since its fetch."""
+        interval = ENDPOINT_REFRESH_SECONDS.get(attr, 0)
+        fetched = self._endpoint_fetch_times.get(attr)
+        if fetched is not None and time.monotonic() - fetched < interval:
+            _LOGGER.debug(
+                "Endpoint %s fetched %s sec ago, refresh interval: %s",
+                attr,
+                round(time.monotonic() - fetched),
+                interval,
+            )
+            return False
+        return True
+
+    async def _update_endpoint_when_due(self, attr, url):
+        """Update a property from an endpoint if its refresh interval passed."""
+        if self._endpoint_due(attr):
+            await self._update_endpoint(attr, url)
+
+    async def _refresh_token_after_401(self, token_generation, attempt):
+        """Refresh cookies or token after a 401, once for concurrent requests."""
+        async with self._token_refresh_lock:
+            if token_generation != self._token_generation:
+                _LOGGER.debug(
+                    "Token refreshed by another request, retrying, in attempt %s of %s:",
+                    attempt+1,
+                    self._fetch_retries + 1
+                )
+                return
+            _LOGGER.debug(
+                "Received 401 from Envoy; refreshing cookies, in attempt %s of %s:",
+                attempt+1,
+                self._fetch_retries + 1
+            )
+            could_refresh_cookies = await self._refresh_token_cookies()
+            if not could_refresh_cookies:
+                _LOGGER.debug(
+                    "cookie refresh failed, getting token, in attempt %s of %s:",
+                    attempt+1,
+                    self._fetch_retries + 1
+                )
+                await self._getEnphaseToken()
+            self._token_generation += 1
+
+    async def _async_fetch_with_retry(self, url, refresh_token=True, **kwargs):
+        """Retry 3 times to fetch the url if there is a transport error.
 
-    async def _async_fetch_with_retry(self, url, **kwargs):
-        """Retry 3 times to fetch the url if there is a transport error."""
+        On a 401 the token is refreshed if refresh_token is set, else the request is retried.
+        """
         for attempt in range(self._fetch_retries + 1):
             header = " <Blank Header> "
             if self._authorization_header:
@@ -398,71 +647,65 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
                 self._fetch_timeout_seconds,
                 self._fetch_holdoff_seconds,
             )
-            async with self.async_client as client:
-                try:
-                    getstart = time.time()
-                    resp = await client.get(
-                        url, headers=self._authorization_header, timeout=self._fetch_timeout_seconds, **kwargs
-                    )
-                    getend = time.time()
-                    if resp.status_code == 401 and attempt < self._fetch_retries:
-                        if self.use_enlighten_owner_token:
-                            _LOGGER.debug(
-                                "Received 401 from Envoy; refreshing cookies, in attempt %s of %s:",
-                                attempt+1,
-                                self._fetch_retries + 1
-                             )
-                            could_refresh_cookies = await self._refresh_token_cookies()
-                            if not could_refresh_cookies:
-                                _LOGGER.debug(
-                                    "cookie refresh failed, getting token, in attempt %s of %s:",
-                                    attempt+1,
-                                    self._fetch_retries + 1
-                                )
-                                await self._getEnphaseToken()
-                            continue
-                        # don't try token and cookies refresh for legacy envoy
-                        else:
-                            _LOGGER.debug(
-                                "Received 401 from Envoy; retrying, attempt %s of %s",
-                                attempt+1,
-                                self._fetch_retries + 1
-                            )
-                            continue
-                    _LOGGER.debug("Fetched (%s of %s) in %s sec from %s: %s: %s",
-                        attempt + 1,
-                        self._fetch_retries + 1,
-                        round(getend - getstart,1),
-                        url, 
-                        resp, 
-                        resp.text
-                    )
-                    if resp.status_code == 404:
-                        return None
-                    return resp
-                
-                except httpx.TimeoutException as exc:
-                    if attempt == self._fetch_retries:
-                        _LOGGER.warning("HTTP Timeout in fetch_with_retry, raising: %s",exc)
-                        raise
-                    # Sleep a bit and try once more
-                    _LOGGER.warning("HTTP Timeout in fetch_with_retry, waiting %s sec: %s",self._fetch_holdoff_seconds,exc)
-                    await asyncio.sleep(self._fetch_holdoff_seconds)
-                except Exception as exc:
-                    if attempt == self._fetch_retries:
-                        _LOGGER.warning("Error in fetch_with_retry, raising: %s",exc)
-                        raise
-                    # Sleep a bit and try once more
-                    _LOGGER.warning("Error in fetch_with_retry, waiting %s sec: %s",self._fetch_holdoff_seconds,exc)
-                    await asyncio.sleep(self._fetch_holdoff_seconds)
+            client = self.async_client
+            try:
+                token_generation = self._token_generation
+                getstart = time.time()
+                self._requests_sent += 1
+                resp = await client.get(
+                    url, headers=self._authorization_header, timeout=self._fetch_timeout_seconds,
+                    extensions={"trace": self._trace_connection}, **kwargs
+                )
+                getend = time.time()
+                if resp.status_code == 401 and attempt < self._fetch_retries:
+                    if self.use_enlighten_owner_token and refresh_token:
+                        await self._refresh_token_after_401(token_generation, attempt)
+                        continue
+                    # don't try token and cookies refresh for legacy envoy
+                    else:
+                        _LOGGER.debug(
+                            "Received 401 from Envoy; retrying, attempt %s of %s",
+                            attempt+1,
+                            self._fetch_retries + 1
+                        )
+                        continue
+                _LOGGER.debug("Fetched (%s of %s) in %s sec from %s: %s: %s",
+                    attempt + 1,
+                    self._fetch_retries + 1,
+                    round(getend - getstart,1),
+                    url, 
+                    resp, 
+                    resp.text
+                )
+                if resp.status_code == 404:
+                    return None
+                return resp
+            
+            except httpx.TimeoutException as exc:
+                if attempt == self._fetch_retries:
+                    _LOGGER.warning("HTTP Timeout in fetch_with_retry, raising: %s",exc)
+                    raise
+                # Sleep a bit and try once more
+                _LOGGER.warning("HTTP Timeout in fetch_with_retry, waiting %s sec: %s",self._fetch_holdoff_seconds,exc)
+                await asyncio.sleep(self._fetch_holdoff_seconds)
+            except Exception as exc:
+                if attempt == self._fetch_retries:
+                    _LOGGER.warning("Error in fetch_with_retry, raising: %s",exc)
+                    raise
+                # Sleep a bit and try once more
+                _LOGGER.warning("Error in fetch_with_retry, waiting %s sec: %s",self._fetch_holdoff_seconds,exc)
+                await asyncio.sleep(self._fetch_holdoff_seconds)
 
     async def _async_post(self, url, data, cookies=None, client=None, **kwargs):
         _LOGGER.debug("HTTP POST Attempt: %s", url)
         if client is None:
-            client = self.async_client
+            # keep the pooled client open for the next requests
+            client_context = contextlib.nullcontext(self.async_client)
+        else:
+            client_context = client
         # _LOGGER.debug("HTTP POST Data: %s", data)
         try:
-            async with client:
+            async with client_context as client:
                 resp = await client.post(
                     url, cookies=cookies, data=data, timeout=30, **kwargs
                 )
@@ -515,9 +758,10 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
         # Create HTTP Header
         self._authorization_header = {"Authorization": "Bearer " + self._token}
 
-        # Fetch the Enphase Token status from the local Envoy
+        # Fetch the Enphase Token status from the local Envoy, without refreshing
+        # the token again on a 401 as this may run within _refresh_token_after_401
         token_validation = await self._async_fetch_with_retry(
-            ENDPOINT_URL_CHECK_JWT.format(self.host)
+            ENDPOINT_URL_CHECK_JWT.format(self.host), refresh_token=False
         )
 
         if token_validation.status_code == 200:
@@ -588,8 +832,14 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
 
         if not self.endpoint_type:
             await self.detect_model()
+            if self.get_inverters and getInverters:
+                await self._update_inverters_endpoint()
         else:
-            await self._update()
+            # The inverters are fetched concurrently with the other endpoints
+            await self._update(get_inverters=self.get_inverters and getInverters)
+
+        # compile the extraction plan after model detection or a metering setup change
+        self._extraction_plan_for_setup()
 
         _LOGGER.debug(
             "Using Model: %s (HTTP%s, Production Metering: %s phases: %s, Consumption Metering: %s phases: %s, Net consumption CT: %s, Get Inverters: %s)",
@@ -603,20 +853,20 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
             self.get_inverters
         )
 
-        if not self.get_inverters or not getInverters:
-            return
-
+    async def _update_inverters_endpoint(self):
+        """Update the inverters production, disable inverters if not available."""
         inverters_url = ENDPOINT_URL_PRODUCTION_INVERTERS.format(
             self.https_flag, self.host
         )
-        if self.use_enlighten_owner_token:
-            response = await self._async_fetch_with_retry(inverters_url)
-        else:
-            # Inverter page on envoy with old firmware requires username/password
-            inverters_auth = httpx.DigestAuth(self.username, self.password)
-            response = await self._async_fetch_with_retry(
-                inverters_url, auth=inverters_auth
-            )
+        async with self._fetch_semaphore:
+            if self.use_enlighten_owner_token:
+                response = await self._async_fetch_with_retry(inverters_url)
+            else:
+                # Inverter page on envoy with old firmware requires username/password
+                inverters_auth = httpx.DigestAuth(self.username, self.password)
+                response = await self._async_fetch_with_retry(
+                    inverters_url, auth=inverters_auth
+                )
         if response.status_code in [401,404]:
             if self.endpoint_type in [ENVOY_MODEL_C, ENVOY_MODEL_LEGACY]:
                 self.get_inverters = False
@@ -624,6 +874,7 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
                 return
             response.raise_for_status()
         self.endpoint_production_inverters = response
+        self._endpoint_fetch_times["endpoint_production_inverters"] = time.monotonic()
         return
 
     async def detect_model(self):
@@ -658,7 +909,7 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
             self.endpoint_production_json_results
             and self.endpoint_production_json_results.status_code == 200
             and has_production_and_consumption(
-                self.endpoint_production_json_results.json()
+                self._decoded("endpoint_production_json_results")
             )
         ):
             _LOGGER.debug("Detect Model found production and consumption")
@@ -747,326 +998,271 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
             + "support the requested metric."
         )
 
-    async def _meters_readings_value(self,field,report="net-consumption",phase=None):
-        """Extract value from meters readings json"""
-        report_map = {"production": 0, "net-consumption": 1, "total-consumption": 1}
-
-        phase_map = {"l1": 0, "l2": 1, "l3": 2}
-        #meters readings is only available for ENVOY Metered with CT configured
-        if (self.endpoint_type == ENVOY_MODEL_S) and (
-            #net-consumption requires consumption CT installed is Solar power included mode
-            (report == "net-consumption" 
-                and self.isConsumptionMeteringEnabled 
-                and self.net_consumption_meters_type)
-            # production data requires production CT installed
-            or (report == "production" and self.isProductionMeteringEnabled )
-            #if at least consumption CT is installed total-consumption will be available even in Load only mode install
-            or (report == "total-consumption" 
-                and self.isConsumptionMeteringEnabled
-                and not self.net_consumption_meters_type )
-        ):
-            if self.endpoint_meters_readings_json_results:
-                raw_json = self.endpoint_meters_readings_json_results.json()
-                if phase == None:
-                    try:
-                        jsondata = raw_json[report_map[report]][field]
-                        return jsondata
-                    except (KeyError, IndexError):
-                        return None
-                
-                #if production data requested and multiple phases are configured and requested phase is in count of configured phases return data or
-                #if consumption data requested and multiple phases are configured and requested phase is in count of configured phases return date
-                if ((self.production_meters_phase_count > 1 and phase_map[phase] < self.production_meters_phase_count and report=="production")
-                 or (self.consumption_meters_phase_count > 1 and phase_map[phase] < self.consumption_meters_phase_count and report!="production")):
-                    try:
-                        jsondata = raw_json[report_map[report]]["channels"][phase_map[phase]][field]
-                        return jsondata
-                    except (KeyError, IndexError):
-                        return None
-        return None
+    def _extraction_plan_for_setup(self):
+        """Return the extraction plan, compiled again if the model or metering setup changed."""
+        signature = (
+            self.endpoint_type,
+            self.isProductionMeteringEnabled,
+            self.isConsumptionMeteringEnabled,
+            self.net_consumption_meters_type,
+            self.production_meters_phase_count,
+            self.consumption_meters_phase_count,
+            self._do_not_use_production_json,
+        )
+        if signature != self._extraction_plan_signature:
+            self._extraction_plan = self._compile_extraction_plan()
+            self._extraction_plan_signature = signature
+            _LOGGER.debug("Compiled extraction plan for %s", signature)
+        return self._extraction_plan
 
-    async def _meters_report_value(self,field,report="production",phase=None):
-        """Extract value from meters reports json if consumption meter is available"""
-        report_map = {"production": 0, "net-consumption": 1, "total-consumption": 2}
-        phase_map = {"l1": 0, "l2": 1, "l3": 2}
-        #meters reports is only available for ENVOY Metered with CT configured
-        if (self.endpoint_type == ENVOY_MODEL_S) and (
-            #net-consumption requires consumption CT installed is Solar power included mode
-            (report == "net-consumption" and self.isConsumptionMeteringEnabled and self.net_consumption_meters_type)
-            # production data requires production CT installed
-            or (report == "production" and self.isProductionMeteringEnabled)
-            #if at least consumption CT is installed total-consumption will be available even in Load only mode install
-            or (report == "total-consumption" and self.isConsumptionMeteringEnabled)
-        ):
-            if self.endpoint_meters_reports_json_results:
-                raw_json = self.endpoint_meters_reports_json_results.json()
-                if phase == None:
-                    jsondata = raw_json[report_map[report]]["cumulative"][field]
-                    return jsondata
-                
-                #if production data requested and multiple phases are configured and requested phase is in count of configured phases return data or
-                #if consumption data requested and multiple phases are configured and requested phase is in count of configured phases return date
-                if ((self.production_meters_phase_count > 1 and phase_map[phase] < self.production_meters_phase_count and report=="production")
-                 or (self.consumption_meters_phase_count > 1 and phase_map[phase] < self.consumption_meters_phase_count and report!="production")):
-                    try:
-                        jsondata = raw_json[report_map[report]]["lines"][phase_map[phase]][field]
-                        return jsondata
-                    except (KeyError, IndexError):
-                        return None
-        return None
+    def _compile_extraction_plan(self):
+        """Return how each value is read from the decoded payloads, for the model and metering setup.
 
-    async def production(self,phase=None):
-        """Report System or Phase Power Production data from sources for various Envoy types"""
-        if phase is not None:
-            # if phase is specified return phase data rather then system data
-            return await self.production_phase(phase)
-        
-        if self.endpoint_type == ENVOY_MODEL_S:
-            if self.isProductionMeteringEnabled:
-                raw_json = self.endpoint_meters_reports_json_results.json()
-                production = raw_json[0]["cumulative"]["currW"]
+        Keys are the accessor names, with _l1, _l2 or _l3 appended for phase values.
+        """
+        metered = self.endpoint_type == ENVOY_MODEL_S
+        production_metered = metered and self.isProductionMeteringEnabled
+        consumption_metered = metered and self.isConsumptionMeteringEnabled
+        net_consumption_metered = consumption_metered and self.net_consumption_meters_type
+        production_json = not self._do_not_use_production_json
+        # Envoy-C, or metered Envoy without production CT, reports production from api/v1
+        production_v1 = self.endpoint_type == ENVOY_MODEL_C or (metered and not self.isProductionMeteringEnabled)
+        legacy = self.endpoint_type == ENVOY_MODEL_LEGACY
+
+        def unavailable(message):
+            return Extraction(None, (), missing=message)
+
+        def production_json_value(*path, missing=MISSING_RAISES):
+            return Extraction("endpoint_production_json_results", path, int, missing)
+
+        def phase_available(report, phase):
+            if report == "production":
+                return self.production_meters_phase_count > 1 and PHASE_INDEX[phase] < self.production_meters_phase_count
+            return self.consumption_meters_phase_count > 1 and PHASE_INDEX[phase] < self.consumption_meters_phase_count
+
+        plan = {}
+        for name, attr, view, report, field, convert, message in METERS_VALUES:
+            if view is meters_reports_view:
+                #net-consumption requires consumption CT installed is Solar power included mode
+                #production data requires production CT installed
+                #if at least consumption CT is installed total-consumption will be available even in Load only mode install
+                available = {
+                    "net-consumption": net_consumption_metered,
+                    "production": production_metered,
+                    "total-consumption": consumption_metered,
+                }[report]
             else:
-                raw_json = self.endpoint_production_json_results.json()
-                production = raw_json["production"][0]["wNow"]
-        elif self.endpoint_type == ENVOY_MODEL_C:
-            raw_json = self.endpoint_production_v1_results.json()
-            production = raw_json["wattsNow"]
-        elif self.endpoint_type == ENVOY_MODEL_LEGACY:
-            text = self.endpoint_production_results.text
-            match = re.search(PRODUCTION_REGEX, text, re.MULTILINE)
-            if match:
-                if match.group(2) == "kW":
-                    production = float(match.group(1)) * 1000
-                else:
-                    if match.group(2) == "mW":
-                        production = float(match.group(1)) * 1000000
-                    else:
-                        production = float(match.group(1))
+                available = {
+                    "net-consumption": net_consumption_metered,
+                    "production": production_metered,
+                    "total-consumption": consumption_metered and not self.net_consumption_meters_type,
+                }[report]
+            if name not in ("production", "lifetime_production"):
+                plan[name] = (
+                    Extraction(attr, (report, None, field), convert, getattr(self, message), view)
+                    if available else unavailable(getattr(self, message))
+                )
+            for phase in PHASE_INDEX:
+                plan[f"{name}_{phase}"] = (
+                    Extraction(attr, (report, phase, field), convert, None, view)
+                    if available and phase_available(report, phase) else unavailable(None)
+                )
+
+        if production_metered:
+            plan["production"] = Extraction(
+                "endpoint_meters_reports_json_results", ("production", None, "currW"), int, view=meters_reports_view
+            )
+            plan["lifetime_production"] = Extraction(
+                "endpoint_meters_reports_json_results", ("production", None, "whDlvdCum"), int, view=meters_reports_view
+            )
+        elif metered:
+            plan["production"] = production_json_value("production", 0, "wNow")
+            plan["lifetime_production"] = production_json_value("production", 0, "whLifetime")
+        elif production_v1:
+            plan["production"] = Extraction("endpoint_production_v1_results", ("wattsNow",), int)
+            plan["lifetime_production"] = Extraction("endpoint_production_v1_results", ("wattHoursLifetime",), int)
+        elif legacy:
+            plan["production"] = functools.partial(
+                self._legacy_production_value, PRODUCTION_REGEX, {"kW": 1000, "mW": 1000000},
+                "No match for production, check REGEX  "
+            )
+            plan["lifetime_production"] = functools.partial(
+                self._legacy_production_value, LIFE_PRODUCTION_REGEX, {"kWh": 1000, "MWh": 1000000},
+                "No match for Lifetime production, " "check REGEX "
+            )
+        else:
+            plan["production"] = plan["lifetime_production"] = unavailable(self.message_production_not_available)
+
+        if production_metered:
+            if production_json:
+                plan["daily_production"] = production_json_value("production", 1, "whToday")
+                plan["seven_days_production"] = production_json_value("production", 1, "whLastSevenDays")
             else:
-                raise RuntimeError("No match for production, check REGEX  " + text)
-        return int(production)
+                plan["daily_production"] = plan["seven_days_production"] = unavailable(
+                    self.message_production_not_available
+                )
+        elif production_v1:
+            plan["daily_production"] = Extraction("endpoint_production_v1_results", ("wattHoursToday",), int)
+            plan["seven_days_production"] = Extraction("endpoint_production_v1_results", ("wattHoursSevenDays",), int)
+        elif legacy:
+            plan["daily_production"] = functools.partial(
+                self._legacy_production_value, DAY_PRODUCTION_REGEX, {"kWh": 1000, "MWh": 1000000},
+                "No match for Day production, " "check REGEX  "
+            )
+            plan["seven_days_production"] = functools.partial(
+                self._legacy_production_value, WEEK_PRODUCTION_REGEX, {"kWh": 1000, "MWh": 1000000},
+                "No match for 7 Day production, " "check REGEX "
+            )
+        else:
+            plan["daily_production"] = plan["seven_days_production"] = unavailable(
+                self.message_production_not_available
+            )
+
+        # Only return data if Envoy supports Consumption
+        if consumption_metered and production_json:
+            plan["daily_consumption"] = production_json_value("consumption", 0, "whToday")
+            plan["seven_days_consumption"] = production_json_value("consumption", 0, "whLastSevenDays")
+        elif consumption_metered:
+            plan["daily_consumption"] = unavailable(self.message_consumption_not_available)
+            plan["seven_days_consumption"] = unavailable(self.message_production_not_available)
+        else:
+            plan["daily_consumption"] = plan["seven_days_consumption"] = unavailable(
+                self.message_consumption_not_available
+            )
+
+        for phase, index in PHASE_INDEX.items():
+            plan[f"daily_production_{phase}"] = (
+                production_json_value("production", 1, "lines", index, "whToday", missing=None)
+                if production_metered and production_json and phase_available("production", phase)
+                else unavailable(None)
+            )
+            plan[f"daily_consumption_{phase}"] = (
+                production_json_value("consumption", 0, "lines", index, "whToday", missing=None)
+                if consumption_metered and production_json and phase_available("consumption", phase)
+                else unavailable(None)
+            )
+
+        plan["inverters_production"] = self._inverters_production
+        plan["battery_storage"] = self._battery_storage
+        plan["grid_status"] = self._grid_status
+        plan["active_inverter_count"] = self._active_inverter_count
+        plan["envoy_info"] = self._envoy_info
+        return plan
+
+    def extract(self, keys):
+        """Return the values of keys in one pass over the decoded payloads.
+
+        Running getData() beforehand fetches the payloads, keys are the names
+        of the accessors with _l1, _l2 or _l3 appended for phase values.
+        """
+        plan = self._extraction_plan_for_setup()
+        data = {}
+        for key in keys:
+            step = plan[key]
+            if not isinstance(step, Extraction):
+                data[key] = step()
+                continue
+            try:
+                if step.attr is None or getattr(self, step.attr) is None:
+                    raise KeyError(step.attr)
+                value = self._decoded(step.attr, step.view)
+                for path_key in step.path:
+                    value = value[path_key]
+            except (KeyError, IndexError, TypeError):
+                if step.missing is MISSING_RAISES:
+                    raise
+                data[key] = step.missing
+                continue
+            data[key] = step.convert(value) if step.convert else value
+        return data
+
+    def _extract_value(self, name, phase=None):
+        """Return one value from the extraction plan."""
+        key = name if phase is None else f"{name}_{phase}"
+        return self.extract((key,))[key]
+
+    def _legacy_production_value(self, regex, multipliers, no_match_message):
+        """Return a production value in Wh or W from the production html of legacy Envoys."""
+        text = self.endpoint_production_results.text
+        match = re.search(regex, text, re.MULTILINE)
+        if not match:
+            raise RuntimeError(no_match_message + text)
+        return int(float(match.group(1)) * multipliers.get(match.group(2), 1))
+
+    async def production(self,phase=None):
+        """Report System or Phase Power Production data from sources for various Envoy types"""
+        return self._extract_value("production", phase)
 
     async def production_phase(self, phase):
         """Report Phase Power Production data from meters report json"""
-        jsondata = await self._meters_report_value("currW",report="production",phase=phase)
-        if jsondata is None:
-            return self.message_consumption_not_available if phase is None else None
-        return int(jsondata)
+        return self._extract_value("production", phase)
 
     async def consumption(self,phase=None):
         """Report cumulative or phase Power consumption (to house) from consumption CT meters report"""
-        jsondata = await self._meters_report_value("currW",report="total-consumption",phase=phase)
-        if jsondata is None:
-            return self.message_consumption_not_available if phase is None else None
-        return int(jsondata)
+        return self._extract_value("consumption", phase)
 
     async def net_consumption(self,phase=None):
         """Report cumulative or phase Power consumption (to/from grid) from consumption CT meters report"""
-        jsondata = await self._meters_readings_value("instantaneousDemand",report="net-consumption",phase=phase)
-        if jsondata is None:
-            return self.message_consumption_not_available if phase is None else None
-        return int(jsondata)
+        return self._extract_value("net_consumption", phase)
 
     async def daily_production(self,phase=None):
         """Report System or Phase Daily energy Production data from sources for various Envoy types"""
-        if phase is not None:
-            # if phase is specified return phase data rather then system data
-            return await self.daily_production_phase(phase)
-
-        if self.endpoint_type == ENVOY_MODEL_S and self.isProductionMeteringEnabled:
-            if self._do_not_use_production_json:
-                return self.message_production_not_available
-            raw_json = self.endpoint_production_json_results.json()
-            daily_production = raw_json["production"][1]["whToday"]
-        elif self.endpoint_type == ENVOY_MODEL_C or (
-            self.endpoint_type == ENVOY_MODEL_S and not self.isProductionMeteringEnabled
-        ):
-            raw_json = self.endpoint_production_v1_results.json()
-            daily_production = raw_json["wattHoursToday"]
-        elif self.endpoint_type == ENVOY_MODEL_LEGACY:
-            text = self.endpoint_production_results.text
-            match = re.search(DAY_PRODUCTION_REGEX, text, re.MULTILINE)
-            if match:
-                if match.group(2) == "kWh":
-                    daily_production = float(match.group(1)) * 1000
-                else:
-                    if match.group(2) == "MWh":
-                        daily_production = float(match.group(1)) * 1000000
-                    else:
-                        daily_production = float(match.group(1))
-            else:
-                raise RuntimeError(
-                    "No match for Day production, " "check REGEX  " + text
-                )
-        return int(daily_production)
+        return self._extract_value("daily_production", phase)
 
     async def daily_production_phase(self, phase):
         """Report Phase Daily energy Production data from production json"""
-        phase_map = {"l1": 0,"l2": 1,"l3": 2}
-
-        if (self.endpoint_type == ENVOY_MODEL_S and self.isProductionMeteringEnabled and
-            self.production_meters_phase_count > 1 and phase_map[phase] < self.production_meters_phase_count
-            and not self._do_not_use_production_json):
-            raw_json = self.endpoint_production_json_results.json()
-            try:
-                return int(
-                    raw_json["production"][1]["lines"][phase_map[phase]]["whToday"]
-                )
-            except (KeyError, IndexError):
-                return None
-
-        return None
+        return self._extract_value("daily_production", phase)
 
     async def daily_consumption(self,phase=None):
         """Report System or Phase Daily energy Consumption data from production json"""
-        if phase is not None:
-            # if phase is specified return phase data rather then system data
-            return await self.daily_consumption_phase(phase)
- 
-        """Only return data if Envoy supports Consumption"""
-        if self.endpoint_type == ENVOY_MODEL_S and self.isConsumptionMeteringEnabled:
-            if self._do_not_use_production_json:
-                return self.message_consumption_not_available
-            raw_json = self.endpoint_production_json_results.json()
-            daily_consumption = raw_json["consumption"][0]["whToday"]
-            return int(daily_consumption)
-
-        return self.message_consumption_not_available
+        return self._extract_value("daily_consumption", phase)
 
     async def daily_consumption_phase(self, phase):
         """Report Phase Daily energy Consumption data from production json"""
-        phase_map = {"l1": 0,"l2": 1,"l3": 2}
-
-        """Only return data if Envoy supports Consumption"""
-        if (self.endpoint_type == ENVOY_MODEL_S and self.isConsumptionMeteringEnabled and
-            self.consumption_meters_phase_count > 1 and phase_map[phase] < self.consumption_meters_phase_count):
-            if self._do_not_use_production_json:
-                return None
-            raw_json = self.endpoint_production_json_results.json()
-            try:
-                return int(
-                    raw_json["consumption"][0]["lines"][phase_map[phase]]["whToday"]
-                )
-            except (KeyError, IndexError):
-                return None
-
-        return None
+        return self._extract_value("daily_consumption", phase)
 
     async def seven_days_production(self):
         """Report Last seven day energy production data from production json"""
-
-        if self.endpoint_type == ENVOY_MODEL_S and self.isProductionMeteringEnabled:
-            if self._do_not_use_production_json:
-                return self.message_production_not_available
-            raw_json = self.endpoint_production_json_results.json()
-            seven_days_production = raw_json["production"][1]["whLastSevenDays"]
-        elif self.endpoint_type == ENVOY_MODEL_C or (
-            self.endpoint_type == ENVOY_MODEL_S and not self.isProductionMeteringEnabled
-        ):
-            raw_json = self.endpoint_production_v1_results.json()
-            seven_days_production = raw_json["wattHoursSevenDays"]
-        elif self.endpoint_type == ENVOY_MODEL_LEGACY:
-            text = self.endpoint_production_results.text
-            match = re.search(WEEK_PRODUCTION_REGEX, text, re.MULTILINE)
-            if match:
-                if match.group(2) == "kWh":
-                    seven_days_production = float(match.group(1)) * 1000
-                else:
-                    if match.group(2) == "MWh":
-                        seven_days_production = float(match.group(1)) * 1000000
-                    else:
-                        seven_days_production = float(match.group(1))
-            else:
-                raise RuntimeError(
-                    "No match for 7 Day production, " "check REGEX " + text
-                )
-        return int(seven_days_production)
+        return self._extract_value("seven_days_production")
 
     async def seven_days_consumption(self):
         """Report Last seven day energy consumption data from production json"""
-
-        """Only return data if Envoy supports Consumption"""
-        if self.endpoint_type == ENVOY_MODEL_S and self.isConsumptionMeteringEnabled:
-            if self._do_not_use_production_json:
-                return self.message_production_not_available    
-            raw_json = self.endpoint_production_json_results.json()
-            seven_days_consumption = raw_json["consumption"][0]["whLastSevenDays"]
-            return int(seven_days_consumption)
-
-        return self.message_consumption_not_available
+        return self._extract_value("seven_days_consumption")
 
     async def lifetime_production(self,phase=None):
         """Report system or Phase lifetime Energy production from sources for various Envoy types"""
-        if phase is not None:
-            # if phase is specified return phase data rather then system data
-            return await self.lifetime_production_phase(phase)
-
-        if self.endpoint_type == ENVOY_MODEL_S:
-            if self.isProductionMeteringEnabled:
-                raw_json = self.endpoint_meters_reports_json_results.json()
-                lifetime_production = raw_json[0]["cumulative"]["whDlvdCum"]
-            else:
-                raw_json = self.endpoint_production_json_results.json()
-                lifetime_production = raw_json["production"][0]["whLifetime"]
-        elif self.endpoint_type == ENVOY_MODEL_C:
-            raw_json = self.endpoint_production_v1_results.json()
-            lifetime_production = raw_json["wattHoursLifetime"]
-        elif self.endpoint_type == ENVOY_MODEL_LEGACY:
-            text = self.endpoint_production_results.text
-            match = re.search(LIFE_PRODUCTION_REGEX, text, re.MULTILINE)
-            if match:
-                if match.group(2) == "kWh":
-                    lifetime_production = float(match.group(1)) * 1000
-                else:
-                    if match.group(2) == "MWh":
-                        lifetime_production = float(match.group(1)) * 1000000
-                    else:
-                        lifetime_production = float(match.group(1))
-            else:
-                raise RuntimeError(
-                    "No match for Lifetime production, " "check REGEX " + text
-                )
-        return int(lifetime_production)
+        return self._extract_value("lifetime_production", phase)
 
     async def lifetime_production_phase(self, phase):
         """Report Phase lifetime Energy production from meters repors json"""
-        jsondata = await self._meters_report_value("whDlvdCum",report="production",phase=phase)
-        if jsondata is None:
-            return self.message_production_not_available if phase is None else None
-        return int(jsondata)
+        return self._extract_value("lifetime_production", phase)
 
     async def lifetime_net_production(self,phase=None):
         """Report cumulative or phase lifetime net production (exported to grid) from consumption CT meters report"""
-        jsondata = await self._meters_readings_value("actEnergyRcvd",report="net-consumption",phase=phase)
-        if jsondata is None:
-            return self.message_consumption_not_available if phase is None else None
-        return int(jsondata)
-        
+        return self._extract_value("lifetime_net_production", phase)
+
     async def lifetime_consumption(self,phase=None):
         """Report cumulative or phase lifetime total-consumption from consumption CT meters report"""
-        jsondata = await self._meters_report_value("whDlvdCum",report="total-consumption",phase=phase)
-        if jsondata is None:
-            return self.message_consumption_not_available if phase is None else None
-        return int(jsondata)
-        
+        return self._extract_value("lifetime_consumption", phase)
+
     async def lifetime_net_consumption(self,phase=None):
         """Report cumulative or phase lifetime net-consumption from consumption CT meters report"""
-        jsondata = await self._meters_readings_value("actEnergyDlvd",report="net-consumption",phase=phase)
-        if jsondata is None:
-            return self.message_consumption_not_available if phase is None else None
-        return int(jsondata)
-        
+        return self._extract_value("lifetime_net_consumption", phase)
+
     async def inverters_production(self):
         """Running getData() beforehand will set self.enpoint_type and self.isDataRetrieved"""
         """so that this method will only read data from stored variables"""
+        return self._inverters_production()
 
-        """Only return data if Envoy supports retrieving Inverter data"""
+    def _inverters_production(self):
+        """Return the last reported watts and report time per inverter serial number."""
+        # Only return data if Envoy supports retrieving Inverter data
         if not self.get_inverters:
             return None
-        
+
         response_dict = {}
         try:
-            for item in self.endpoint_production_inverters.json():
+            for item in self._decoded("endpoint_production_inverters"):
                 response_dict[item["serialNumber"]] = [
                     item["lastReportWatts"],
                     time.strftime(
@@ -1080,11 +1276,15 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
 
     async def battery_storage(self):
         """Return battery data from Envoys that support and have batteries installed"""
+        return self._battery_storage()
+
+    def _battery_storage(self):
+        """Return the batteries from production json or the ensemble inventory."""
         if self.endpoint_type in [ENVOY_MODEL_C,ENVOY_MODEL_LEGACY]:
             return self.message_battery_not_available
 
         try:
-            raw_json = self.endpoint_production_json_results.json()
+            raw_json = self._decoded("endpoint_production_json_results")
         except JSONDecodeError:
             return None
 
@@ -1095,7 +1295,7 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
             # "ENCHARGE" batteries are part of the "ENSEMBLE" api instead
             # Check to see if it's there. Enphase has too much fun with these names
             if self.endpoint_ensemble_json_results is not None:
-                ensemble_json = self.endpoint_ensemble_json_results.json()
+                ensemble_json = self._decoded("endpoint_ensemble_json_results")
                 if len(ensemble_json) > 0 and "devices" in ensemble_json[0].keys():
                     return ensemble_json[0]["devices"]
             return self.message_battery_not_available
@@ -1104,44 +1304,33 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
 
     async def pf(self,phase=None):
         """Report cumulative or phase PowerFactor from consumption CT meters report"""
-        jsondata = await self._meters_report_value("pwrFactor",report="net-consumption",phase=phase)
-        if jsondata is None:
-            return self.message_pf_not_available if phase is None else None
-        return float(str(jsondata))
-        
+        return self._extract_value("pf", phase)
+
     async def voltage(self,phase=None):
         """Report cumulative or phase Voltage from consumption CT meters report"""
-        jsondata = await self._meters_report_value("rmsVoltage",report="net-consumption",phase=phase)
-        if jsondata is None:
-            return self.message_voltage_not_available if phase is None else None
-        return float(str(jsondata))
-        
+        return self._extract_value("voltage", phase)
+
     async def frequency(self,phase=None):
         """Report cumulative or phase Frequency from consumption CT meters report"""
-        jsondata = await self._meters_report_value("freqHz",report="net-consumption",phase=phase)
-        if jsondata is None:
-            return self.message_frequency_not_available if phase is None else None
-        return float(str(jsondata))
+        return self._extract_value("frequency", phase)
 
     async def consumption_Current(self,phase=None):
         """Report cumulative or phase rmsCurrent from consumption CT meters report"""
-        jsondata = await self._meters_report_value("rmsCurrent",report="net-consumption",phase=phase)
-        if jsondata is None:
-            return self.message_current_consumption_not_available if phase is None else None
-        return float(str(jsondata))
-        
+        return self._extract_value("consumption_Current", phase)
+
     async def production_Current(self,phase=None):
         """Report cumulative or phase rmsCurrent from production CT meters report"""
-        jsondata = await self._meters_report_value("rmsCurrent",report="production",phase=phase)
-        if jsondata is None:
-            return self.message_current_production_not_available if phase is None else None
-        return float(str(jsondata))
-        
+        return self._extract_value("production_Current", phase)
+
     async def grid_status(self):
         """Return grid status reported by Envoy"""
+        return self._grid_status()
+
+    def _grid_status(self):
+        """Return the grid status from home json, stop reading it if not reported."""
         if self.has_grid_status and self.endpoint_home_json_results is not None:
             if self.endpoint_home_json_results.status_code == 200:
-                home_json = self.endpoint_home_json_results.json()
+                home_json = self._decoded("endpoint_home_json_results")
                 if ("enpower" in home_json.keys() and "grid_status" in home_json["enpower"].keys()):
                     return home_json["enpower"]["grid_status"]
         self.has_grid_status = False
@@ -1149,10 +1338,14 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
 
     async def active_inverter_count(self) -> int|str:
         """Return active inverter count from /home html for legacy envoy"""
+        return self._active_inverter_count()
+
+    def _active_inverter_count(self):
+        """Return the active inverter count from the legacy home html."""
         if (self.endpoint_type == ENVOY_MODEL_LEGACY
             and self.endpoint_home_results
             and self.endpoint_home_results.status_code == 200):
-                
+
             text = self.endpoint_home_results.text
             match = re.search(ACTIVE_INVERTER_COUNT_REGEX, text, re.MULTILINE)
             if match:
@@ -1163,6 +1356,10 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
 
     async def envoy_info(self):
         """Return information reported by Envoy info.xml."""
+        return self._envoy_info()
+
+    def _envoy_info(self):
+        """Return the info.xml device data and the reader's settings and raw payloads."""
         device_data = {}
 
         if self.endpoint_info_results:
@@ -1348,6 +1545,9 @@ class EnvoyReader:  # pylint: disable=too-many-instance-attributes
             if dumpraw:
                 print(f"envoy_info:              {json.dumps(results[13],indent=2)}")
 
+        loop.run_until_complete(self.close())
+        print(f"connections:              {self.connection_stats}")
+
 
 if __name__ == "__main__":
     SECURE = ""
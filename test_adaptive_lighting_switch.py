@@ -0,0 +1,480 @@
+"""Unit tests for adaptive_lighting's switch scheduling and light calls."""
+
+import asyncio
+import importlib.util
+import sys
+import time
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent / "config"))
+
+DEPENDENCIES_AVAILABLE = importlib.util.find_spec("homeassistant") is not None
+
+# Budget of the scheduler tests and the tick of the switch in them
+CALLS_PER_SECOND = 10
+TICK_SECONDS = 0.3
+
+
+class FakeClock:
+    """Loop clock whose sleeps only end when the test advances it."""
+
+    def __init__(self):
+        """Start at zero with no sleepers."""
+        self.now = 0.0
+        self.sleepers = []
+        self.real_sleep = asyncio.sleep
+
+    def time(self):
+        """Get the current fake loop time."""
+        return self.now
+
+    async def sleep(self, delay, result=None):
+        """Sleep until the clock is advanced past the delay."""
+        if delay <= 0:
+            return await self.real_sleep(0, result)
+        future = asyncio.get_running_loop().create_future()
+        self.sleepers.append((self.now + delay, future))
+        await future
+        return result
+
+    async def advance(self, seconds):
+        """Move the clock forward and let woken sleepers run."""
+        self.now += seconds
+        for wake_time, future in self.sleepers:
+            if wake_time <= self.now + 1e-9 and not future.done():
+                future.set_result(None)
+        self.sleepers = [item for item in self.sleepers if not item[1].done()]
+        for _ in range(5):
+            await self.real_sleep(0)
+
+
+@unittest.skipUnless(DEPENDENCIES_AVAILABLE, "needs homeassistant")
+class TestIntervalScheduler(unittest.IsolatedAsyncioTestCase):
+    """Test the calls-per-second budget of interval updates."""
+
+    async def asyncSetUp(self):
+        """Set up a scheduler on a fake clock with one budgeted switch."""
+        from custom_components.adaptive_lighting import switch
+
+        self.clock = FakeClock()
+        hass = SimpleNamespace(loop=SimpleNamespace(time=self.clock.time))
+        self.scheduler = switch._IntervalScheduler(hass)
+        with mock.patch.object(switch, "async_track_time_interval"):
+            self.scheduler.subscribe(
+                timedelta(seconds=1),
+                mock.AsyncMock(),
+                calls_per_second=CALLS_PER_SECOND,
+            )
+        patcher = mock.patch("asyncio.sleep", self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def send(self, sent):
+        """Wait for a call slot and record when it was granted."""
+        await self.scheduler.wait_for_call_slot()
+        sent.append(self.clock.now)
+
+    async def test_calls_are_spaced_by_the_budget(self):
+        """Test that concurrent callers get consecutive slots."""
+        sent = []
+        tasks = [asyncio.ensure_future(self.send(sent)) for _ in range(3)]
+        await self.clock.advance(0)
+        for _ in range(2):
+            await self.clock.advance(1 / CALLS_PER_SECOND)
+        await asyncio.gather(*tasks)
+        self.assertEqual(sent, [0.0, 0.1, 0.2])
+
+    async def test_cancelled_callers_release_their_slots(self):
+        """Test that cancelling each tick's leftovers keeps calls flowing."""
+        sent_per_tick = []
+        pending = []
+        for _ in range(20):
+            for task in pending:
+                task.cancel()
+            sent = []
+            pending = [asyncio.ensure_future(self.send(sent)) for _ in range(4)]
+            await self.clock.advance(0)
+            await self.clock.advance(TICK_SECONDS)
+            sent_per_tick.append(len(sent))
+        for task in pending:
+            task.cancel()
+
+        self.assertGreaterEqual(
+            min(sent_per_tick), round(TICK_SECONDS * CALLS_PER_SECOND)
+        )
+
+    async def test_unlimited_budget_never_waits(self):
+        """Test that callers without a budget are not delayed."""
+        self.scheduler._subscribers.clear()
+        sent = []
+        await asyncio.gather(*(self.send(sent) for _ in range(5)))
+        self.assertEqual(sent, [0.0] * 5)
+
+
+@unittest.skipUnless(DEPENDENCIES_AVAILABLE, "needs homeassistant")
+class TestAdaptationCalls(unittest.IsolatedAsyncioTestCase):
+    """Test how a switch turns its adaptations into 'light.turn_on' calls."""
+
+    async def asyncSetUp(self):
+        """Set up a manager on a bare hass and a switch with mocked calls."""
+        from custom_components.adaptive_lighting import switch
+        from homeassistant.core import HomeAssistant
+
+        self.module = switch
+        self.hass = HomeAssistant(str(Path(__file__).parent / "config"))
+        self.manager = switch.AdaptiveLightingManager(self.hass)
+        self.switch = switch.AdaptiveSwitch.__new__(switch.AdaptiveSwitch)
+        self.switch.hass = self.hass
+        self.switch.manager = self.manager
+        self.switch._name = "test"
+        self.switch._context_cnt = 0
+        self.calls = []
+
+        async def call_light_turn_on(service_data, context, lights=1):
+            self.calls.append(service_data)
+
+        self.switch._call_light_turn_on = call_light_turn_on
+
+    def batch(self, *lights, which="both"):
+        """Build a batch of adaptations with identical service data."""
+        from custom_components.adaptive_lighting.adaptation_utils import AdaptationData
+
+        context = self.switch.create_context("interval")
+        return [
+            (
+                AdaptationData(
+                    entity_id=light,
+                    context=context,
+                    sleep_time=0,
+                    service_call_datas=None,
+                    force=False,
+                    max_length=1,
+                    which=which,
+                ),
+                {"entity_id": light, "brightness": 128},
+            )
+            for light in lights
+        ]
+
+    async def test_slots_are_only_reserved_for_lights_that_are_on(self):
+        """Test that lights which turned off do not use up the budget."""
+        self.hass.states.async_set("light.on", "on")
+        self.hass.states.async_set("light.off", "off")
+        with mock.patch.object(
+            self.manager.interval_scheduler, "wait_for_call_slot"
+        ) as wait_for_call_slot:
+            batch = self.batch("light.on", "light.off")
+            call = self.module._BatchedCall(["light.on", "light.off"])
+            await self.switch._execute_batched_adaptation_call(batch, call)
+
+        wait_for_call_slot.assert_awaited_once_with(1)
+        self.assertEqual(self.calls, [{"entity_id": "light.on", "brightness": 128}])
+
+    async def test_lights_with_identical_data_share_a_call(self):
+        """Test that a batch is adapted with one multi-entity call."""
+        key = self.module._service_data_key
+        self.assertEqual(
+            key({"entity_id": "light.a", "brightness": 128, "rgb_color": [1, 2, 3]}),
+            key({"entity_id": "light.b", "brightness": 128, "rgb_color": [1, 2, 3]}),
+        )
+        self.assertNotEqual(
+            key({"entity_id": "light.a", "brightness": 128}),
+            key({"entity_id": "light.a", "brightness": 129}),
+        )
+
+        for light in ("light.a", "light.b"):
+            self.hass.states.async_set(light, "on")
+        await self.switch.execute_cancellable_batched_adaptation_call(
+            self.batch("light.a", "light.b")
+        )
+        self.assertEqual(
+            self.calls, [{"entity_id": ["light.a", "light.b"], "brightness": 128}]
+        )
+
+    async def test_cancelling_one_light_keeps_the_others_in_the_call(self):
+        """Test that cancelling a light only drops it from its batch."""
+        for light in ("light.a", "light.b", "light.c"):
+            self.hass.states.async_set(light, "on")
+        slot = asyncio.Event()
+
+        async def wait_for_call_slot(calls):
+            await slot.wait()
+
+        with mock.patch.object(
+            self.manager.interval_scheduler,
+            "wait_for_call_slot",
+            side_effect=wait_for_call_slot,
+        ):
+            task = asyncio.ensure_future(
+                self.switch.execute_cancellable_batched_adaptation_call(
+                    self.batch("light.a", "light.b", "light.c")
+                )
+            )
+            await asyncio.sleep(0)
+            self.manager.cancel_ongoing_adaptation_calls("light.b")
+            self.manager.cancel_ongoing_adaptation_calls("light.b")
+            slot.set()
+            await task
+
+        self.assertEqual(
+            self.calls, [{"entity_id": ["light.a", "light.c"], "brightness": 128}]
+        )
+        self.assertNotIn("light.b", self.manager.last_service_data)
+        self.assertEqual(self.manager.adaptation_tasks_brightness, {})
+        self.assertEqual(self.manager.adaptation_tasks_color, {})
+
+    async def test_cancelling_every_light_cancels_the_call(self):
+        """Test that a batch without lights left is not sent."""
+        for light in ("light.a", "light.b"):
+            self.hass.states.async_set(light, "on")
+
+        async def wait_for_call_slot(calls):
+            await asyncio.Event().wait()
+
+        with mock.patch.object(
+            self.manager.interval_scheduler,
+            "wait_for_call_slot",
+            side_effect=wait_for_call_slot,
+        ):
+            task = asyncio.ensure_future(
+                self.switch.execute_cancellable_batched_adaptation_call(
+                    self.batch("light.a", "light.b", which="brightness")
+                )
+            )
+            await asyncio.sleep(0)
+            call = self.manager.adaptation_tasks_brightness["light.b"].call
+            self.manager.cancel_ongoing_adaptation_calls("light.a", which="color")
+            self.manager.cancel_ongoing_adaptation_calls("light.a")
+            self.manager.cancel_ongoing_adaptation_calls("light.b")
+            await task
+
+        self.assertEqual(self.calls, [])
+        self.assertTrue(call.task.cancelled())
+
+    async def test_every_light_is_eventually_adapted(self):
+        """Test that a tight budget does not starve the same lights every tick."""
+        from custom_components.adaptive_lighting.adaptation_utils import AdaptationData
+
+        lights = [f"light.{i}" for i in range(5)]
+        for light in lights:
+            self.hass.states.async_set(light, "on")
+        slots = []
+
+        async def wait_for_call_slot(calls):
+            # Two calls fit in a tick; the rest wait until the next tick cancels them
+            if len(slots) == 2:
+                await asyncio.Event().wait()
+            slots.append(calls)
+
+        async def prepare_adaptation_data(light, transition, force, context):
+            # The targets differ per light and change every tick, so every
+            # light needs its own call on every tick
+            brightness = 10 * len(updates) + lights.index(light)
+
+            async def service_call_datas():
+                yield {"entity_id": light, "brightness": brightness}
+
+            return AdaptationData(
+                entity_id=light,
+                context=context,
+                sleep_time=0,
+                service_call_datas=service_call_datas(),
+                force=False,
+                max_length=1,
+                which="brightness",
+            )
+
+        self.switch.prepare_adaptation_data = prepare_adaptation_data
+        self.switch._separate_turn_on_commands = False
+        self.switch._interval_rotation = 0
+        updates = []
+        with mock.patch.object(
+            self.manager.interval_scheduler,
+            "wait_for_call_slot",
+            side_effect=wait_for_call_slot,
+        ):
+            for _ in range(len(lights)):
+                slots.clear()
+                context = self.switch.create_context("interval")
+                updates.append(
+                    asyncio.ensure_future(
+                        self.switch._adapt_lights(lights, context, 0, force=False)
+                    )
+                )
+                for _ in range(5):
+                    await asyncio.sleep(0)
+            for update in updates:
+                update.cancel()
+            await asyncio.gather(*updates, return_exceptions=True)
+
+        self.assertEqual({call["entity_id"] for call in self.calls}, set(lights))
+
+    async def test_interval_timing_is_written_with_the_next_tick(self):
+        """Test that each tick writes the state once, with the previous timing."""
+        written = []
+        adapt_seconds = iter([0.25, 0.5])
+
+        async def update_attrs_and_maybe_adapt_lights(*, timing, **kwargs):
+            self.switch.async_write_ha_state()
+            timing["adapt_seconds"] = next(adapt_seconds)
+
+        self.switch._last_interval_timing = {}
+        self.switch._transition = 0
+        self.switch._state = True
+        self.switch._update_attrs_and_maybe_adapt_lights = (
+            update_attrs_and_maybe_adapt_lights
+        )
+        self.switch.async_write_ha_state = lambda: written.append(
+            dict(self.switch._last_interval_timing)
+        )
+        await self.switch._async_update_at_interval_action()
+        await self.switch._async_update_at_interval_action()
+
+        self.assertEqual(len(written), 2)
+        self.assertEqual(written[1]["adapt_seconds"], 0.25)
+        self.assertEqual(self.switch._last_interval_timing["adapt_seconds"], 0.5)
+        self.assertIn("last_interval_timing", self.switch._unrecorded_attributes)
+
+
+@unittest.skipUnless(DEPENDENCIES_AVAILABLE, "needs homeassistant")
+class TestLightRecords(unittest.IsolatedAsyncioTestCase):
+    """Test the per-light state kept by the manager."""
+
+    async def asyncSetUp(self):
+        """Set up a manager on a bare hass."""
+        from custom_components.adaptive_lighting import switch
+        from homeassistant.core import HomeAssistant
+
+        self.module = switch
+        self.hass = HomeAssistant(str(Path(__file__).parent / "config"))
+        self.manager = switch.AdaptiveLightingManager(self.hass)
+
+    async def test_capability_profiles_are_per_manager_and_forgotten(self):
+        """Test that profiles are cached on the manager until a light is removed."""
+        self.hass.states.async_set(
+            "light.a",
+            "on",
+            {"supported_features": 0, "supported_color_modes": ["color_temp"]},
+        )
+        profiles = self.manager.capability_profiles
+        supported = self.module._supported_features(self.hass, "light.a", profiles)
+
+        self.assertEqual(supported, {"color_temp", "brightness"})
+        self.assertIs(profiles["light.a"][2], supported)
+        other = self.module.AdaptiveLightingManager(self.hass)
+        self.assertNotIn("light.a", other.capability_profiles)
+
+        self.manager.forget_light("light.a")
+        self.assertNotIn("light.a", profiles)
+
+    def test_record_view_semantics(self):
+        """Test that views act as dicts where None means missing."""
+        view = self.manager.last_service_data
+        self.assertNotIn("light.a", view)
+        with self.assertRaises(KeyError):
+            view["light.a"]
+        with self.assertRaises(KeyError):
+            del view["light.a"]
+
+        view["light.a"] = {"brightness": 1}
+        self.manager.sleep_tasks["light.a"] = mock.Mock()
+        self.assertEqual(dict(view), {"light.a": {"brightness": 1}})
+        self.assertEqual(len(self.manager.sleep_tasks), 1)
+        self.assertIs(
+            self.manager.light_records["light.a"].last_service_data, view["light.a"]
+        )
+
+        # The record goes away with its last tracked field
+        del view["light.a"]
+        self.assertIn("light.a", self.manager.light_records)
+        del self.manager.sleep_tasks["light.a"]
+        self.assertNotIn("light.a", self.manager.light_records)
+        self.assertEqual(len(view), 0)
+
+    async def test_forget_light_drops_all_tracked_state(self):
+        """Test that a removed light leaves nothing behind in the manager."""
+        configured = object()
+        self.manager.switches_by_light["light.configured"] = [configured]
+        for light in ("light.a", "light.configured"):
+            self.hass.states.async_set(
+                light, "on", {"supported_features": 0, "supported_color_modes": []}
+            )
+            self.manager.lights.add(light)
+            self.manager.set_auto_reset_manual_control_times([light], 60)
+            self.manager.mark_as_manual_control(light)
+            self.manager.last_service_data[light] = {"entity_id": light}
+            self.module._supported_features(
+                self.hass, light, self.manager.capability_profiles
+            )
+            task = asyncio.ensure_future(asyncio.Event().wait())
+            self.manager.adaptation_tasks_brightness[light] = task
+            self.manager.adaptation_tasks_color[light] = task
+
+        for light in ("light.a", "light.configured"):
+            self.hass.states.async_remove(light)
+        await self.hass.async_block_till_done()
+
+        for tracked in (
+            self.manager.light_records,
+            self.manager.manual_control,
+            self.manager.auto_reset_manual_control_timers,
+            self.manager.adaptation_tasks_brightness,
+            self.manager.adaptation_tasks_color,
+        ):
+            self.assertEqual(dict(tracked), {})
+        self.assertTrue(task.cancelled())
+        # Configured lights are tracked again if they come back
+        self.assertEqual(self.manager.lights, {"light.configured"})
+        self.assertEqual(
+            self.manager.auto_reset_manual_control_times, {"light.configured": 60}
+        )
+
+    async def refresh(self, hang=(), **kwargs):
+        """Refresh light states and get which lights were updated."""
+        updated = []
+
+        async def async_update_entity(light):
+            updated.append(light)
+            if light in hang:
+                await asyncio.Event().wait()
+
+        helpers = SimpleNamespace(
+            entity_component=SimpleNamespace(async_update_entity=async_update_entity)
+        )
+        with mock.patch.object(self.hass, "helpers", helpers):
+            not_refreshed = await self.manager.refresh_light_states(
+                ["light.a", "light.b", "light.c"], **kwargs
+            )
+        return sorted(updated), not_refreshed
+
+    async def test_refresh_skips_fresh_and_unadapted_lights(self):
+        """Test that only stale lights we adapted before are updated."""
+        with mock.patch("time.time", return_value=time.time() - 120):
+            self.hass.states.async_set("light.b", "on")
+        self.hass.states.async_set("light.a", "on")
+        self.hass.states.async_set("light.c", "on")
+        self.manager.last_service_data["light.a"] = {"entity_id": "light.a"}
+        self.manager.last_service_data["light.b"] = {"entity_id": "light.b"}
+
+        self.assertEqual(await self.refresh(freshness=60), (["light.b"], set()))
+        self.assertEqual(await self.refresh(), (["light.a", "light.b"], set()))
+
+    async def test_refresh_gives_up_on_slow_lights(self):
+        """Test that lights exceeding the timeout are reported, not awaited."""
+        for light in ("light.a", "light.b", "light.c"):
+            self.hass.states.async_set(light, "on")
+            self.manager.last_service_data[light] = {"entity_id": light}
+
+        updated, not_refreshed = await self.refresh(
+            hang={"light.b"}, concurrency=2, timeout=0.01
+        )
+        self.assertEqual(updated, ["light.a", "light.b", "light.c"])
+        self.assertEqual(not_refreshed, {"light.b"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""Unit tests for adaptive_lighting's SunLightSettings."""
+
+import datetime
+import importlib.util
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+MODULE_FILE = (
+    Path(__file__).parent
+    / "config/custom_components/adaptive_lighting/color_and_brightness.py"
+)
+DEPENDENCIES_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("homeassistant", "astral")
+)
+
+# How far interpolating a 10 second day curve may stray from the scalar path
+MAX_SUN_POSITION_ERROR = 1e-3
+MAX_BRIGHTNESS_PCT_ERROR = 0.1
+MAX_COLOR_TEMP_ERROR = 5
+
+
+def load_module():
+    """Load color_and_brightness.py without the integration's package."""
+    spec = importlib.util.spec_from_file_location("color_and_brightness", MODULE_FILE)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses look their module up
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipUnless(DEPENDENCIES_AVAILABLE, "needs homeassistant and astral")
+class TestSunLightSettings(unittest.TestCase):
+    """Test day curves and the keys switches share settings by."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        from astral import LocationInfo
+        from astral.location import Location
+
+        self.module = load_module()
+        self.location = Location(
+            LocationInfo("Amsterdam", "NL", "Europe/Amsterdam", 52.37, 4.89)
+        )
+        self.rng = random.Random(0)
+        self.start = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def settings(self, resolution=None, **kwargs):
+        """Build SunLightSettings with the integration's defaults."""
+        values = {
+            "name": "test",
+            "astral_location": self.location,
+            "adapt_until_sleep": False,
+            "max_brightness": 100,
+            "max_color_temp": 5500,
+            "min_brightness": 1,
+            "min_color_temp": 2000,
+            "sleep_brightness": 1,
+            "sleep_rgb_or_color_temp": "color_temp",
+            "sleep_color_temp": 1000,
+            "sleep_rgb_color": (255, 56, 0),
+            "sunrise_time": None,
+            "min_sunrise_time": None,
+            "max_sunrise_time": None,
+            "sunset_time": None,
+            "min_sunset_time": None,
+            "max_sunset_time": None,
+            "brightness_mode_time_dark": datetime.timedelta(seconds=900),
+            "brightness_mode_time_light": datetime.timedelta(seconds=3600),
+            "timezone": self.location.tzinfo,
+            "day_curve_resolution": resolution,
+        }
+        values.update(kwargs)
+        return self.module.SunLightSettings(**values)
+
+    def random_times(self, per_day=500):
+        """Get random instants on days spread over a year."""
+        return [
+            self.start
+            + datetime.timedelta(days=days, seconds=self.rng.uniform(0, 86400))
+            for days in (0, 79, 171, 265)
+            for _ in range(per_day)
+        ]
+
+    def max_errors(self, scalar, curve):
+        """Get the largest differences between scalar and interpolated settings."""
+        errors = {"sun_position": 0, "brightness_pct": 0, "color_temp_kelvin": 0}
+        for dt in self.random_times():
+            expected = self.get_settings_at(scalar, dt)
+            actual = self.get_settings_at(curve, dt)
+            self.assertEqual(expected["force_rgb_color"], actual["force_rgb_color"])
+            for key, error in errors.items():
+                errors[key] = max(error, abs(expected[key] - actual[key]))
+        return errors
+
+    def get_settings_at(self, settings, dt, is_sleep=False):
+        """Call get_settings as if it were 'dt' now."""
+        with mock.patch.object(self.module, "utcnow", return_value=dt):
+            return settings.get_settings(is_sleep, transition=0)
+
+    def test_matches_scalar_path(self):
+        """Test every brightness mode and custom sun times."""
+        resolution = datetime.timedelta(seconds=10)
+        variants = {
+            "default": {},
+            "linear": {"brightness_mode": "linear"},
+            "tanh": {"brightness_mode": "tanh"},
+            "adapt_until_sleep": {
+                "adapt_until_sleep": True,
+                "sleep_rgb_or_color_temp": "rgb_color",
+            },
+            "custom_times": {
+                "min_sunrise_time": datetime.time(7),
+                "max_sunset_time": datetime.time(20),
+                "brightness_mode": "linear",
+            },
+        }
+        for variant, kwargs in variants.items():
+            errors = self.max_errors(
+                self.settings(**kwargs), self.settings(resolution, **kwargs)
+            )
+            with self.subTest(variant=variant, errors=errors):
+                self.assertLessEqual(errors["sun_position"], MAX_SUN_POSITION_ERROR)
+                self.assertLessEqual(errors["brightness_pct"], MAX_BRIGHTNESS_PCT_ERROR)
+                self.assertLessEqual(errors["color_temp_kelvin"], MAX_COLOR_TEMP_ERROR)
+
+    def test_sleep_brightness(self):
+        """Test that sleep mode bypasses the sampled brightness."""
+        curve = self.settings(datetime.timedelta(seconds=10))
+        settings = self.get_settings_at(curve, self.start, is_sleep=True)
+        self.assertEqual(settings["brightness_pct"], 1)
+        self.assertEqual(settings["color_temp_kelvin"], 1000)
+
+    def test_plain_python_matches_numpy(self):
+        """Test that both ways of building the curve agree."""
+        if self.module.np is None:
+            self.skipTest("needs numpy")
+        for mode in ("default", "linear", "tanh"):
+            settings = self.settings(
+                datetime.timedelta(seconds=60), brightness_mode=mode
+            )
+            vectorized = settings.day_curve(self.start)
+            with mock.patch.object(self.module, "np", None):
+                settings = self.settings(
+                    datetime.timedelta(seconds=60), brightness_mode=mode
+                )
+                plain = settings.day_curve(self.start)
+            with self.subTest(mode=mode):
+                for name in ("sun_positions", "brightness_pcts"):
+                    for a, b in zip(getattr(vectorized, name), getattr(plain, name)):
+                        self.assertAlmostEqual(a, b, places=9)
+
+    def test_rolls_over_to_next_day(self):
+        """Test that the current and next day's curves are kept."""
+        settings = self.settings(datetime.timedelta(seconds=60))
+        first = settings.day_curve(self.start)
+        self.assertIs(
+            settings.day_curve(self.start + datetime.timedelta(hours=23)), first
+        )
+        second = settings.day_curve(self.start + datetime.timedelta(days=1))
+        self.assertIsNot(second, first)
+        # Going back and forth across midnight reuses both curves
+        self.assertIs(settings.day_curve(self.start), first)
+        self.assertIs(
+            settings.day_curve(self.start + datetime.timedelta(days=1)), second
+        )
+        third = settings.day_curve(self.start + datetime.timedelta(days=2))
+        self.assertEqual(list(settings._day_curves.values()), [second, third])
+
+    def test_curve_key_ignores_name(self):
+        """Test that switches differing only in name share a hashable key."""
+        kitchen = self.settings(name="kitchen", sleep_rgb_color=[255, 56, 0])
+        hallway = self.settings(name="hallway", sleep_rgb_color=[255, 56, 0])
+        dimmer = self.settings(name="kitchen", max_brightness=50)
+        self.assertEqual(hash(kitchen.curve_key), hash(hallway.curve_key))
+        self.assertEqual(kitchen.curve_key, hallway.curve_key)
+        self.assertNotEqual(kitchen.curve_key, dimmer.curve_key)
+
+    def test_cached_color_conversions(self):
+        """Test that the memoized conversions match Home Assistant's."""
+        from homeassistant.util import color
+
+        for kelvin in (1000, 2700, 2700, 6500):
+            self.assertEqual(
+                self.module.cached_color_temperature_to_rgb(kelvin),
+                color.color_temperature_to_rgb(kelvin),
+            )
+        rgb = color.color_temperature_to_rgb(2700)
+        xy = color.color_RGB_to_xy(*rgb)
+        self.assertEqual(
+            self.module.cached_color_RGB_to_xy_and_hs(*rgb),
+            (xy, color.color_xy_to_hs(*xy)),
+        )
+        self.assertEqual(
+            self.module.cached_color_xy_to_RGB(*xy), color.color_xy_to_RGB(*xy)
+        )
+        info = self.module.cached_color_temperature_to_rgb.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
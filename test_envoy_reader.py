@@ -0,0 +1,161 @@
+"""Unit tests for enphase_envoy's concurrent endpoint fetching."""
+
+import asyncio
+import importlib.util
+import sys
+import time
+import unittest
+from collections import Counter
+from pathlib import Path
+
+MODULE_FILE = (
+    Path(__file__).parent / "config/custom_components/enphase_envoy/envoy_reader.py"
+)
+FIXTURES_DIR = Path(__file__).parent / "benchmarks/fixtures/enphase_envoy"
+
+DEPENDENCIES_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("httpx", "jwt", "xmltodict", "envoy_utils")
+)
+
+# Fixture served for each path, the legacy pages are served as plain text
+FIXTURES = {
+    "/info": "info.xml",
+    "/production.json": "production.json",
+    "/api/v1/production": "production_v1.json",
+    "/api/v1/production/inverters": "inverters.json",
+    "/ivp/meters": "meters.json",
+    "/ivp/meters/reports": "meters_reports.json",
+    "/ivp/meters/readings": "meters_readings.json",
+    "/ivp/ensemble/inventory": "ensemble_inventory.json",
+    "/home.json": "home.json",
+}
+
+
+def load_module():
+    """Load envoy_reader.py without the integration's package."""
+    spec = importlib.util.spec_from_file_location("envoy_reader", MODULE_FILE)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeEnvoy:
+    """Serves the fixtures like a slow Envoy and records the requests."""
+
+    def __init__(self):
+        """Start with a valid token and no requests."""
+        self.hits = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.token_expired = False
+        self.failing_paths = set()
+
+    async def handle(self, request):
+        """Answer a request after a short delay, so requests overlap."""
+        import httpx
+
+        path = request.url.path
+        self.hits[path] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if path in self.failing_paths:
+            raise httpx.ConnectError("Envoy unreachable", request=request)
+        if path == "/auth/check_jwt":
+            self.token_expired = False
+            return httpx.Response(200, text="Valid token.")
+        if self.token_expired:
+            return httpx.Response(401)
+        if path not in FIXTURES:
+            return httpx.Response(200, text="<html></html>")
+        return httpx.Response(200, content=(FIXTURES_DIR / FIXTURES[path]).read_bytes())
+
+
+@unittest.skipUnless(DEPENDENCIES_AVAILABLE, "needs httpx, jwt, xmltodict, envoy_utils")
+class TestConcurrentFetching(unittest.IsolatedAsyncioTestCase):
+    """Test the fetch limit, token refreshes and error handling of polls."""
+
+    async def asyncSetUp(self):
+        """Set up a fake Envoy behind a mock transport."""
+        import httpx
+
+        self.module = load_module()
+        self.envoy = FakeEnvoy()
+        self.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.envoy.handle)
+        )
+        self.addAsyncCleanup(self.client.aclose)
+
+    def reader(self, endpoint_type, **kwargs):
+        """Create a reader for the fake Envoy whose model is already detected."""
+        reader = self.module.EnvoyReader(
+            "192.168.1.2",
+            async_client=self.client,
+            fetch_holdoff_seconds=0,
+            **kwargs,
+        )
+        reader.endpoint_type = endpoint_type
+        return reader
+
+    async def test_fetches_are_limited_to_the_concurrency(self):
+        """Test that no more requests than fetch_concurrency are in flight."""
+        reader = self.reader(self.module.ENVOY_MODEL_S, fetch_concurrency=2)
+        await reader.getData(getInverters=False)
+        self.assertEqual(self.envoy.max_in_flight, 2)
+        self.assertIsNotNone(reader.endpoint_ensemble_json_results)
+
+    async def test_concurrent_401s_refresh_the_token_once(self):
+        """Test that requests rejected together share one token refresh."""
+        import jwt
+
+        reader = self.reader(
+            self.module.ENVOY_MODEL_S,
+            https_flag="s",
+            use_enlighten_owner_token=True,
+            fetch_concurrency=4,
+        )
+        reader._token = jwt.encode(
+            {"exp": int(time.time()) + 86400}, "secret", algorithm="HS256"
+        )
+        reader._authorization_header = {"Authorization": f"Bearer {reader._token}"}
+        self.envoy.token_expired = True
+        await reader.getData(getInverters=False)
+
+        self.assertEqual(self.envoy.hits["/auth/check_jwt"], 1)
+        self.assertEqual(reader._token_generation, 1)
+        self.assertEqual(reader.endpoint_ensemble_json_results.status_code, 200)
+
+    async def test_fetch_errors_are_raised_from_the_poll(self):
+        """Test that a failed endpoint fails the poll after the others finished."""
+        import httpx
+
+        reader = self.reader(self.module.ENVOY_MODEL_C, fetch_concurrency=2)
+        self.envoy.failing_paths.add("/api/v1/production")
+        with self.assertRaises(httpx.ConnectError):
+            await reader.getData(getInverters=False)
+        self.assertEqual(self.envoy.hits["/api/v1/production"], 2)
+        self.assertIsNotNone(reader.endpoint_info_results)
+
+    async def test_only_slow_endpoints_are_throttled(self):
+        """Test that the inventory is read every poll, the legacy pages are not."""
+        reader = self.reader(self.module.ENVOY_MODEL_S, inverters=True)
+        for _ in range(2):
+            await reader.getData()
+        self.assertEqual(self.envoy.hits["/ivp/ensemble/inventory"], 2)
+        self.assertEqual(self.envoy.hits["/api/v1/production/inverters"], 1)
+
+        reader = self.reader(self.module.ENVOY_MODEL_LEGACY)
+        self.envoy.hits.clear()
+        for _ in range(2):
+            await reader.getData()
+        self.assertEqual(self.envoy.hits["/production"], 2)
+        self.assertEqual(self.envoy.hits["/home"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
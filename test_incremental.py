@@ -0,0 +1,134 @@
+"""Unit tests for incremental validation planning."""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+from tools.incremental import ValidationManifest
+from tools.reference_validator import ReferenceValidator
+from tools.registry_index import RegistryIndex
+
+
+class TestValidationManifest(unittest.TestCase):
+    """Test which files an incremental run rechecks."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_dir = Path(self.temp_dir) / "config"
+        self.storage_dir = self.config_dir / ".storage"
+        self.storage_dir.mkdir(parents=True)
+        self.manifest_file = Path(self.temp_dir) / "manifest.json"
+
+        self.porch_id = "fedcba9876543210fedcba9876543210"
+        self.entities = [
+            {
+                "entity_id": "light.kitchen",
+                "id": "0123456789abcdef0123456789abcdef",
+                "disabled_by": None,
+            },
+            {"entity_id": "light.porch", "id": self.porch_id, "disabled_by": None},
+        ]
+        self.write_registries()
+
+        with open(self.config_dir / "configuration.yaml", "w") as f:
+            f.write("homeassistant:\n  name: Test\n")
+        self.write_yaml("kitchen.yaml", {"entity_id": "light.kitchen"})
+        self.write_yaml("porch.yaml", {"entity_id": self.porch_id})
+
+        self.record_full_run()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def write_registries(self):
+        """Write the entity, device and area registries."""
+        registries = {
+            "core.entity_registry": {"entities": self.entities},
+            "core.device_registry": {"devices": []},
+            "core.area_registry": {"areas": []},
+        }
+        for name, data in registries.items():
+            with open(self.storage_dir / name, "w") as f:
+                json.dump({"data": data}, f)
+
+    def write_yaml(self, name, data):
+        """Write a YAML file to the config directory."""
+        with open(self.config_dir / name, "w") as f:
+            yaml.dump(data, f)
+
+    def yaml_files(self):
+        """Get the YAML files of the config directory."""
+        return ReferenceValidator(str(self.config_dir)).get_yaml_files()
+
+    def record_full_run(self):
+        """Validate everything and record it in the manifest."""
+        index = RegistryIndex.load(self.storage_dir)
+        validator = ReferenceValidator(str(self.config_dir), registry_index=index)
+        self.assertTrue(validator.validate_all())
+
+        manifest = ValidationManifest()
+        files = self.yaml_files()
+        manifest.update(self.config_dir, files, index, files, validator.file_references)
+        manifest.save(self.manifest_file)
+
+    def plan(self):
+        """Plan an incremental run from the saved manifest."""
+        manifest = ValidationManifest.load(self.manifest_file)
+        index = RegistryIndex.load(self.storage_dir)
+        return manifest.plan(self.config_dir, self.yaml_files(), index)
+
+    def planned_names(self):
+        """Get the names of the files an incremental run would recheck."""
+        return [path.name for path in self.plan().files]
+
+    def test_missing_manifest_forces_full_run(self):
+        """Test that the first run checks everything."""
+        self.manifest_file.unlink()
+        plan = self.plan()
+        self.assertTrue(plan.full)
+        self.assertEqual(len(plan.files), 3)
+
+    def test_unchanged_config_checks_nothing(self):
+        """Test that nothing is rechecked after a successful run."""
+        plan = self.plan()
+        self.assertFalse(plan.full)
+        self.assertEqual(plan.files, [])
+
+    def test_changed_file_rechecked(self):
+        """Test that only edited and new files are rechecked."""
+        self.write_yaml("kitchen.yaml", {"entity_id": "light.porch"})
+        self.write_yaml("new.yaml", {"entity_id": "light.kitchen"})
+        self.assertEqual(self.planned_names(), ["kitchen.yaml", "new.yaml"])
+
+    def test_changed_entity_rechecks_referencing_files(self):
+        """Test that files referencing a removed entity are rechecked."""
+        del self.entities[0]
+        self.write_registries()
+        self.assertEqual(self.planned_names(), ["kitchen.yaml"])
+
+    def test_changed_registry_id_rechecks_referencing_files(self):
+        """Test that files referencing an entity by registry ID are rechecked."""
+        self.entities[1]["disabled_by"] = "user"
+        self.write_registries()
+        self.assertEqual(self.planned_names(), ["porch.yaml"])
+
+    def test_global_inputs_force_full_run(self):
+        """Test that configuration.yaml and device registry changes check all."""
+        for name in ("configuration.yaml", ".storage/core.device_registry"):
+            with self.subTest(changed=name):
+                with open(self.config_dir / name, "a") as f:
+                    f.write("\n")
+                plan = self.plan()
+                self.assertTrue(plan.full)
+                self.assertIn(Path(name).name, plan.reason)
+                self.record_full_run()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Unit tests for adaptive_lighting's instrumentation."""
+
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+
+MODULE_FILE = (
+    Path(__file__).parent
+    / "config/custom_components/adaptive_lighting/instrumentation.py"
+)
+
+
+def load_module():
+    """Load instrumentation.py without the integration's package."""
+    spec = importlib.util.spec_from_file_location("instrumentation", MODULE_FILE)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test opting in, histograms and snapshots."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.module = load_module()
+        self.instrumentation = self.module.Instrumentation()
+
+    def test_disabled_by_default(self):
+        """Test that nothing is recorded before a switch opts in."""
+        self.instrumentation.count("kitchen", "service_calls")
+        self.instrumentation.record_time(self.module.MANAGER_GROUP, "handler", 0.1)
+        self.assertFalse(self.instrumentation.enabled)
+        self.assertEqual(self.instrumentation.snapshot()["groups"], {})
+
+    def test_records_enabled_switches_and_manager(self):
+        """Test that only opted in switches and the manager are recorded."""
+        self.instrumentation.set_enabled("kitchen", True)
+        self.instrumentation.count("kitchen", "service_calls")
+        self.instrumentation.count("kitchen", "adapted_lights", 3)
+        self.instrumentation.count("hallway", "service_calls")
+        self.instrumentation.record_time(self.module.MANAGER_GROUP, "handler", 0.1)
+
+        groups = self.instrumentation.snapshot()["groups"]
+        self.assertEqual(set(groups), {"kitchen", self.module.MANAGER_GROUP})
+        self.assertEqual(
+            groups["kitchen"]["counters"], {"service_calls": 1, "adapted_lights": 3}
+        )
+
+        self.instrumentation.set_enabled("kitchen", False)
+        self.instrumentation.count("kitchen", "service_calls")
+        self.assertFalse(self.instrumentation.enabled)
+        self.assertEqual(self.instrumentation.counters["kitchen"]["service_calls"], 1)
+
+    def test_histogram_buckets(self):
+        """Test that durations land in the right buckets."""
+        histogram = self.module.Histogram()
+        for seconds in (0.00005, 0.001, 0.0011, 20):
+            histogram.record(seconds)
+        result = histogram.as_dict()
+        self.assertEqual(result["count"], 4)
+        self.assertEqual(result["max_seconds"], 20)
+        self.assertEqual(
+            result["buckets"],
+            {"<=0.0001s": 1, "<=0.001s": 1, "<=0.0025s": 1, ">10.0s": 1},
+        )
+
+    def test_snapshot_is_json_serializable_and_resettable(self):
+        """Test that snapshots can be returned from a service and cleared."""
+        self.instrumentation.set_enabled("kitchen", True)
+        self.instrumentation.record_time("kitchen", "settings", 0.0003)
+        json.dumps(self.instrumentation.snapshot())
+        self.instrumentation.reset()
+        snapshot = self.instrumentation.snapshot()
+        self.assertEqual(snapshot["groups"], {})
+        self.assertEqual(snapshot["enabled_switches"], ["kitchen"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,8 @@ from pathlib import Path
 
 import yaml
 
-from tools.reference_validator import ReferenceValidator
+from tools.reference_validator import REF_DEVICE, REF_ENTITY, ReferenceValidator
+from tools.registry_index import RegistryIndex, read_registry
 
 
 class TestReferenceValidatorUUID(unittest.TestCase):
@@ -396,6 +397,50 @@ class TestReferenceValidatorUUID(unittest.TestCase):
         expected_refs = {"sensor.normal", "binary_sensor.door"}
         self.assertEqual(entity_refs, expected_refs)
 
+    def test_extract_entities_from_template_forms(self):
+        """Test that every supported template form is scanned."""
+        template = (
+            "{{ states('sensor.a') }} {{ states(\"sensor.b\", rounded=True) }}"
+            "{{ states.sensor.c.state }} {{ states['sensor.d'].state }}"
+            "{{ is_state('light.e', 'on') and is_state_attr('light.f', 'x', 1) }}"
+            "{{ state_attr('climate.g', 'temperature') }}"
+            "{{ expand('group.h', 'light.i') | list }}"
+            "{{ states('not_an_entity') }}"
+        )
+        self.assertEqual(
+            self.validator.extract_entities_from_template(template),
+            {
+                "sensor.a",
+                "sensor.b",
+                "sensor.c",
+                "sensor.d",
+                "light.e",
+                "light.f",
+                "climate.g",
+                "group.h",
+                "light.i",
+            },
+        )
+
+    def test_area_entities_checked_against_area_ids_and_names(self):
+        """Test that area_entities() arguments resolve by area ID or name."""
+        config_data = {
+            "value_template": (
+                "{{ expand(area_entities('living_room')) | list }}"
+                "{{ area_entities('living room') }}"
+                "{{ area_entities('Garage') }}"
+            )
+        }
+        refs = self.validator.collect_references(config_data)
+        self.assertEqual(refs.entities, set())
+        self.assertEqual(refs.template_areas, {"living_room", "living room", "Garage"})
+
+        self.assertTrue(self.validator.check_file_references(Path("t.yaml"), refs))
+        self.assertEqual(
+            self.validator.warnings,
+            ["t.yaml: Unknown area 'Garage' in area_entities()"],
+        )
+
     def test_extract_entity_references_with_blueprint_inputs(self):
         """Test entity reference extraction skips blueprint inputs."""
         blueprint_data = {
@@ -464,6 +509,157 @@ class TestReferenceValidatorUUID(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(len(self.validator.errors), 0)
 
+    def test_collect_references_single_pass(self):
+        """Test that one traversal collects every reference kind."""
+        automation_data = [
+            {
+                "triggers": [
+                    {
+                        "device_id": "0c086f69ee6b3fa8411af7194876cbd7",
+                        "entity_id": "88a52f17bf43cb276836f06ac5c07444",
+                    }
+                ],
+                "actions": [
+                    {
+                        "target": {
+                            "entity_id": ["light.kitchen", "all"],
+                            "area_id": "living_room",
+                        },
+                        "data": {"message": "{{ states('sensor.outside') }}"},
+                    }
+                ],
+            }
+        ]
+
+        refs = self.validator.collect_references(automation_data)
+        self.assertEqual(refs.entities, {"light.kitchen", "sensor.outside"})
+        self.assertEqual(refs.devices, {"0c086f69ee6b3fa8411af7194876cbd7"})
+        self.assertEqual(refs.areas, {"living_room"})
+        self.assertEqual(refs.entity_registry_ids, {"88a52f17bf43cb276836f06ac5c07444"})
+
+    def test_collect_references_source_paths(self):
+        """Test that collected references report where they were found."""
+        automation_data = [
+            {"triggers": [{"entity_id": "sensor.a"}]},
+            {"actions": [{"target": {"entity_id": ["sensor.a", "light.b"]}}]},
+        ]
+
+        refs = self.validator.collect_references(automation_data)
+        self.assertEqual(
+            refs.get_paths(REF_ENTITY, "sensor.a"),
+            ["[0].triggers[0].entity_id", "[1].actions[0].target.entity_id"],
+        )
+        self.assertEqual(
+            refs.get_paths(REF_ENTITY, "light.b"),
+            ["[1].actions[0].target.entity_id"],
+        )
+        self.assertEqual(refs.get_paths(REF_DEVICE, "light.b"), [])
+
+    def test_registry_index_lookups(self):
+        """Test registry index hash-map lookups."""
+        index = RegistryIndex.load(self.storage_dir)
+
+        self.assertEqual(index.errors, [])
+        self.assertIn("sensor.normal_sensor", index.entities)
+        self.assertIn("0c086f69ee6b3fa8411af7194876cbd7", index.devices)
+        self.assertIn("living_room", index.areas)
+        self.assertEqual(
+            index.resolve_registry_id("88a52f17bf43cb276836f06ac5c07444"),
+            "binary_sensor.test_motion_battery",
+        )
+        self.assertIsNone(index.resolve_registry_id("ffffffffffffffffffffffffffffffff"))
+        self.assertTrue(index.is_disabled("sensor.disabled_sensor"))
+        self.assertFalse(index.is_disabled("sensor.normal_sensor"))
+
+    def test_read_registry_skips_deleted_entries(self):
+        """Test that deleted entries are only parsed when asked for."""
+        registry = dict(self.entity_registry_data)
+        registry["data"] = dict(
+            registry["data"],
+            deleted_entities=[{"entity_id": "sensor.gone", "id": "gone"}],
+        )
+        registry_file = self.storage_dir / "core.entity_registry"
+        with open(registry_file, "w") as f:
+            json.dump(registry, f, indent=2)
+
+        data = read_registry(registry_file, "entities", "entity_id")
+        self.assertNotIn("deleted_entities", data)
+        entities = self.entity_registry_data["data"]["entities"]
+        self.assertEqual(data["entities"], entities)
+
+        data = read_registry(
+            registry_file, "entities", "entity_id", include_deleted=True
+        )
+        self.assertEqual(data["deleted_entities"][0]["entity_id"], "sensor.gone")
+
+    def test_read_registry_unexpected_layout_falls_back(self):
+        """Test that a registry with deleted entries first is still read whole."""
+        registry_file = self.storage_dir / "core.entity_registry"
+        with open(registry_file, "w") as f:
+            f.write(
+                '{"data": {"deleted_entities": [], '
+                '"entities": [{"entity_id": "light.a", "name": "A"}]}}'
+            )
+
+        data = read_registry(registry_file, "entities", "entity_id", ["entity_id"])
+        self.assertEqual(data["entities"], [{"entity_id": "light.a"}])
+
+    def test_registry_index_keeps_only_validated_fields(self):
+        """Test that registry entries are projected to the fields validators use."""
+        index = RegistryIndex.load(self.storage_dir)
+        self.assertEqual(
+            index.entities["sensor.disabled_sensor"],
+            {
+                "entity_id": "sensor.disabled_sensor",
+                "id": "11223344556677889900aabbccddeeff",
+                "disabled_by": "user",
+                "device_id": "disabled_device_id_123456789012",
+            },
+        )
+
+    def test_registry_index_shared_between_validators(self):
+        """Test that validators reuse an injected registry index."""
+        index = RegistryIndex.load(self.storage_dir)
+        first = ReferenceValidator(str(self.config_dir), registry_index=index)
+        second = ReferenceValidator(str(self.config_dir), registry_index=index)
+
+        self.assertIs(first.get_registry_index(), index)
+        self.assertIs(second.load_entity_registry(), index.entities)
+
+    def test_missing_registry_reported_once(self):
+        """Test that a missing registry is reported once, not once per file."""
+        (self.storage_dir / "core.device_registry").unlink()
+        for name in ("first.yaml", "second.yaml"):
+            with open(self.config_dir / name, "w") as f:
+                yaml.dump({"entity_id": "sensor.normal_sensor"}, f)
+
+        self.validator.validate_all()
+        missing = [e for e in self.validator.errors if "registry not found" in e]
+        self.assertEqual(len(missing), 1)
+
+    def test_parallel_validation_matches_serial(self):
+        """Test that --jobs validation reports the same results as a serial run."""
+        for i in range(4):
+            with open(self.config_dir / f"automations_{i}.yaml", "w") as f:
+                yaml.dump(
+                    [
+                        {
+                            "triggers": [{"entity_id": f"sensor.unknown_{i}"}],
+                            "actions": [{"device_id": f"unknown_device_{i}"}],
+                            "target": {"area_id": "unknown_area"},
+                        }
+                    ],
+                    f,
+                )
+
+        serial = ReferenceValidator(str(self.config_dir))
+        parallel = ReferenceValidator(str(self.config_dir))
+
+        self.assertEqual(serial.validate_all(), parallel.validate_all(jobs=2))
+        self.assertEqual(serial.errors, parallel.errors)
+        self.assertEqual(serial.warnings, parallel.warnings)
+        self.assertEqual(len(serial.errors), 8)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+"""Unit tests for the validation test runner orchestration."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+from tools.run_tests import ValidationTestRunner
+
+
+class TestValidationTestRunner(unittest.TestCase):
+    """Test in-process and isolated runs of the validators."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_dir = Path(self.temp_dir) / "config"
+        (self.config_dir / ".storage").mkdir(parents=True)
+
+        with open(self.config_dir / "configuration.yaml", "w") as f:
+            f.write(
+                "homeassistant:\n"
+                "  name: Test\n"
+                "automation: !include automations.yaml\n"
+            )
+        with open(self.config_dir / "automations.yaml", "w") as f:
+            yaml.dump(
+                [
+                    {
+                        "alias": "Test",
+                        "triggers": [{"entity_id": "sensor.missing"}],
+                        "actions": [{"device_id": "missing_device"}],
+                    }
+                ],
+                f,
+            )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_in_process_matches_isolated(self):
+        """Test that in-process validators report what subprocesses report."""
+        in_process = ValidationTestRunner(str(self.config_dir), use_cache=False)
+        isolated = ValidationTestRunner(
+            str(self.config_dir), use_cache=False, isolated=True
+        )
+        in_process.run_all_tests()
+        isolated.run_all_tests()
+
+        for script_name in ("yaml_validator.py", "reference_validator.py"):
+            with self.subTest(validator=script_name):
+                self.assertEqual(
+                    in_process.results[script_name]["passed"],
+                    isolated.results[script_name]["passed"],
+                )
+                self.assertEqual(
+                    in_process.results[script_name]["stdout"],
+                    isolated.results[script_name]["stdout"],
+                )
+
+    def test_in_process_reports_stage_timings(self):
+        """Test that snapshot and validator stages are timed."""
+        runner = ValidationTestRunner(str(self.config_dir), use_cache=False)
+        runner.run_all_tests()
+
+        self.assertIn("Parse YAML snapshot", runner.stage_timings)
+        self.assertIn("Load registries", runner.stage_timings)
+        for _script_name, description in ValidationTestRunner.VALIDATORS:
+            self.assertIn(description, runner.stage_timings)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -282,6 +282,23 @@ class TestValidatorImprovements(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(len(self.yaml_validator.errors), 0)
 
+    def test_parallel_validation_matches_serial(self):
+        """Test that --jobs validation reports the same results as a serial run."""
+        with open(self.config_dir / "automations.yaml", "w") as f:
+            yaml.dump([{"id": "no_alias", "trigger": [], "action": []}, {}], f)
+        with open(self.config_dir / "scripts.yaml", "w") as f:
+            yaml.dump({"broken": {"alias": "No sequence"}}, f)
+        with open(self.config_dir / "broken.yaml", "w") as f:
+            f.write("key: [unclosed\n")
+
+        serial = YAMLValidator(str(self.config_dir))
+        parallel = YAMLValidator(str(self.config_dir))
+
+        self.assertEqual(serial.validate_all(), parallel.validate_all(jobs=2))
+        self.assertEqual(serial.errors, parallel.errors)
+        self.assertEqual(serial.warnings, parallel.warnings)
+        self.assertTrue(serial.errors)
+
 
 if __name__ == "__main__":
     unittest.main()
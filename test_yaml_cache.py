@@ -0,0 +1,175 @@
+"""Unit tests for the parsed-YAML cache shared by the validators."""
+
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+import yaml
+
+from tools.reference_validator import ReferenceValidator
+from tools.yaml_cache import YAMLCache
+from tools.yaml_validator import HAYamlLoader, YAMLValidator
+
+
+class CountingLoader(HAYamlLoader):
+    """Loader that counts how many documents it parsed."""
+
+    parses = 0
+
+    def __init__(self, stream):
+        """Count each parse."""
+        CountingLoader.parses += 1
+        super().__init__(stream)
+
+
+class TestYAMLCache(unittest.TestCase):
+    """Test the on-disk parse cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_dir = Path(self.temp_dir) / "config"
+        self.config_dir.mkdir()
+        self.cache_dir = Path(self.temp_dir) / ".validator-cache"
+        self.file = self.config_dir / "automations.yaml"
+        self.file.write_text("- alias: Test\n  entity_id: light.test\n")
+        CountingLoader.parses = 0
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_unchanged_file_is_not_reparsed(self):
+        """Test that a second process reuses the pickled tree."""
+        first = YAMLCache(self.cache_dir).load(self.file, CountingLoader)
+        second = YAMLCache(self.cache_dir).load(self.file, CountingLoader)
+
+        self.assertEqual(first, second)
+        self.assertEqual(CountingLoader.parses, 1)
+
+    def test_changed_file_is_reparsed(self):
+        """Test that edits invalidate the cached tree."""
+        YAMLCache(self.cache_dir).load(self.file, CountingLoader)
+        self.file.write_text("- alias: Changed\n")
+
+        data = YAMLCache(self.cache_dir).load(self.file, CountingLoader)
+        self.assertEqual(data, [{"alias": "Changed"}])
+        self.assertEqual(CountingLoader.parses, 2)
+
+    def test_touched_file_is_reparsed(self):
+        """Test that an mtime change alone misses the cache."""
+        YAMLCache(self.cache_dir).load(self.file, CountingLoader)
+        stat = self.file.stat()
+        os.utime(self.file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        YAMLCache(self.cache_dir).load(self.file, CountingLoader)
+        self.assertEqual(CountingLoader.parses, 2)
+
+    def test_parse_errors_propagate_and_are_not_cached(self):
+        """Test that syntax errors surface as from yaml.load."""
+        self.file.write_text("key: [unclosed\n")
+        cache = YAMLCache(self.cache_dir)
+
+        with self.assertRaises(yaml.YAMLError):
+            cache.load(self.file, HAYamlLoader)
+        self.assertEqual(list(self.cache_dir.glob("*.pickle")), [])
+
+    def test_extras_follow_the_tree(self):
+        """Test extras are kept for unchanged files and dropped on edits."""
+        cache = YAMLCache(self.cache_dir)
+        cache.load(self.file, HAYamlLoader)
+        cache.set_extra(self.file, "refs", ["light.test"])
+
+        self.assertEqual(
+            YAMLCache(self.cache_dir).get_extra(self.file, "refs"), ["light.test"]
+        )
+
+        self.file.write_text("- alias: Changed\n")
+        self.assertIsNone(YAMLCache(self.cache_dir).get_extra(self.file, "refs"))
+
+    def test_lru_size_cap(self):
+        """Test that least recently used entries are evicted over the cap."""
+        files = []
+        for i in range(3):
+            path = self.config_dir / f"file_{i}.yaml"
+            path.write_text(f"value: {'x' * 2000}{i}\n")
+            files.append(path)
+
+        cache = YAMLCache(self.cache_dir, max_bytes=5000)
+        for i, path in enumerate(files):
+            cache.load(path, HAYamlLoader)
+            for entry in self.cache_dir.glob("*.pickle"):
+                # Make recency deterministic regardless of timer resolution
+                if entry == cache._entry_file(str(path.resolve())):
+                    os.utime(entry, ns=(i * 10**9, i * 10**9))
+
+        remaining = list(self.cache_dir.glob("*.pickle"))
+        self.assertEqual(len(remaining), 2)
+        self.assertNotIn(cache._entry_file(str(files[0].resolve())), remaining)
+
+    def test_extras_are_written_with_the_tree(self):
+        """Test extras passed to load are stored in the same single write."""
+        cache = YAMLCache(self.cache_dir)
+        with unittest.mock.patch.object(
+            cache, "_write_entry", wraps=cache._write_entry
+        ) as write_entry:
+            cache.load(self.file, HAYamlLoader, {"count": len})
+            cache.load(self.file, HAYamlLoader, {"count": len})
+
+        self.assertEqual(write_entry.call_count, 1)
+        self.assertEqual(YAMLCache(self.cache_dir).get_extra(self.file, "count"), 1)
+
+    def test_eviction_scans_cache_dir_once(self):
+        """Test entries of earlier runs count towards the cap without rescans."""
+        files = []
+        for i in range(4):
+            path = self.config_dir / f"file_{i}.yaml"
+            path.write_text(f"value: {'x' * 2000}{i}\n")
+            files.append(path)
+        YAMLCache(self.cache_dir).load(files[0], HAYamlLoader)
+        os.utime(
+            YAMLCache(self.cache_dir)._entry_file(str(files[0].resolve())),
+            ns=(0, 0),
+        )
+
+        cache = YAMLCache(self.cache_dir, max_bytes=5000)
+        with unittest.mock.patch.object(
+            Path, "glob", autospec=True, side_effect=Path.glob
+        ) as glob:
+            for path in files[1:]:
+                cache.load(path, HAYamlLoader)
+
+        self.assertEqual(glob.call_count, 1)
+        remaining = list(self.cache_dir.glob("*.pickle"))
+        self.assertEqual(len(remaining), 2)
+        self.assertNotIn(cache._entry_file(str(files[0].resolve())), remaining)
+        self.assertNotIn(cache._entry_file(str(files[1].resolve())), remaining)
+
+    def test_validators_give_same_results_with_cache(self):
+        """Test that cached runs report exactly what uncached runs report."""
+        (self.config_dir / "scripts.yaml").write_text("broken:\n  alias: x\n")
+
+        results = []
+        for cache in (None, YAMLCache(self.cache_dir), YAMLCache(self.cache_dir)):
+            yaml_validator = YAMLValidator(str(self.config_dir), cache=cache)
+            reference_validator = ReferenceValidator(str(self.config_dir), cache=cache)
+            results.append(
+                (
+                    yaml_validator.validate_all(),
+                    yaml_validator.errors,
+                    yaml_validator.warnings,
+                    reference_validator.validate_all(),
+                    reference_validator.errors,
+                    reference_validator.warnings,
+                )
+            )
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Unit tests for the shared Home Assistant YAML loader."""
+
+import importlib.util
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from tools.yaml_loader import HA_TAGS, LIBYAML_AVAILABLE, HAYamlLoader, PureHAYamlLoader
+
+REPO_DIR = Path(__file__).parent
+
+TAGGED_DOCUMENT = """
+homeassistant:
+  packages: !include_dir_named packages
+  customize: !include customize.yaml
+api_password: !secret http_password
+automation manual: !include_dir_merge_list automations/
+script: !include_dir_merge_named scripts/
+sensor: !include_dir_list sensors/
+blueprint:
+  input:
+    motion_entity:
+      selector: {entity: {domain: binary_sensor}}
+trigger:
+  platform: state
+  entity_id: !input motion_entity
+defaults: &defaults
+  transition: 2
+  brightness_pct: 80
+light_on:
+  <<: *defaults
+  entity_id: light.kitchen
+updated: 2024-01-15 08:30:00
+date_only: 2024-01-15
+value_template: >-
+  {{ states('sensor.outside') | float(0) > 20.5 }}
+numbers: [1, 1.5, 0x1F, .inf, -.inf, ~, yes, "on", off]
+"""
+
+
+def _config_yaml_files():
+    """Get every YAML file shipped in the config and add-on directories."""
+    for directory in ("config", "addon_configs"):
+        for pattern in ("*.yaml", "*.yml"):
+            yield from sorted((REPO_DIR / directory).rglob(pattern))
+
+
+class TestHAYamlLoader(unittest.TestCase):
+    """Test that the libyaml fast path has the same semantics."""
+
+    def test_ha_tags_load_as_strings(self):
+        """Test that every HA tag loads as a '!tag value' string."""
+        for tag in HA_TAGS:
+            data = yaml.load(f"key: {tag} some_value", Loader=HAYamlLoader)
+            self.assertEqual(data, {"key": f"{tag} some_value"})
+
+    @unittest.skipUnless(LIBYAML_AVAILABLE, "PyYAML built without libyaml")
+    def test_fast_path_uses_libyaml(self):
+        """Test that the fast loader is backed by libyaml."""
+        self.assertTrue(issubclass(HAYamlLoader, yaml.CSafeLoader))
+
+    def test_tagged_document_identical(self):
+        """Test identical trees for a document using every tag and feature."""
+        fast = yaml.load(TAGGED_DOCUMENT, Loader=HAYamlLoader)
+        pure = yaml.load(TAGGED_DOCUMENT, Loader=PureHAYamlLoader)
+        self.assertEqual(fast, pure)
+        self.assertEqual(fast["light_on"]["transition"], 2)
+
+    def test_config_directory_identical(self):
+        """Test identical trees for every YAML file in the repository config."""
+        files = list(_config_yaml_files())
+        self.assertTrue(files)
+
+        for path in files:
+            with self.subTest(path=str(path.relative_to(REPO_DIR))):
+                text = path.read_text(encoding="utf-8")
+                try:
+                    pure = yaml.load(text, Loader=PureHAYamlLoader)
+                except yaml.YAMLError:
+                    with self.assertRaises(yaml.YAMLError):
+                        yaml.load(text, Loader=HAYamlLoader)
+                    continue
+                self.assertEqual(yaml.load(text, Loader=HAYamlLoader), pure)
+
+    def test_falls_back_without_libyaml(self):
+        """Test that the loader falls back to SafeLoader without libyaml."""
+        spec = importlib.util.spec_from_file_location(
+            "yaml_loader_without_libyaml", REPO_DIR / "tools" / "yaml_loader.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+
+        with mock.patch.dict(yaml.__dict__):
+            yaml.__dict__.pop("CSafeLoader", None)
+            spec.loader.exec_module(module)
+
+        self.assertFalse(module.LIBYAML_AVAILABLE)
+        self.assertTrue(issubclass(module.HAYamlLoader, yaml.SafeLoader))
+        self.assertEqual(
+            yaml.load(TAGGED_DOCUMENT, Loader=module.HAYamlLoader),
+            yaml.load(TAGGED_DOCUMENT, Loader=PureHAYamlLoader),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
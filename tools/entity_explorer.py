@@ -7,15 +7,33 @@ organized by domain and area for easy automation creation.
 """
 
 import argparse
-import json
 import sys
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    from tools.registry_index import read_registry
+except ImportError:  # Run as a script from inside the tools directory
+    from registry_index import read_registry  # type: ignore[no-redef]
+
+# Entity registry fields used by the explorer
+EXPLORER_FIELDS = (
+    "entity_id",
+    "name",
+    "original_name",
+    "disabled_by",
+    "hidden_by",
+    "area_id",
+    "original_device_class",
+    "device_class",
+    "platform",
+    "unit_of_measurement",
+)
+
 
 def load_entity_registry(config_path: Path) -> Optional[Dict]:
-    """Load and parse the entity registry file."""
+    """Load the data section of the entity registry file."""
     registry_path = config_path / ".storage" / "core.entity_registry"
 
     if not registry_path.exists():
@@ -23,8 +41,7 @@ def load_entity_registry(config_path: Path) -> Optional[Dict]:
         return None
 
     try:
-        with open(registry_path, "r") as f:
-            return json.load(f)
+        return read_registry(registry_path, "entities", "entity_id", EXPLORER_FIELDS)
     except Exception as e:
         print(f"Error reading entity registry: {e}")
         return None
@@ -37,10 +54,9 @@ def load_area_registry(config_path: Path) -> Dict[str, str]:
 
     if area_path.exists():
         try:
-            with open(area_path, "r") as f:
-                area_data = json.load(f)
-                for area in area_data.get("data", {}).get("areas", []):
-                    area_names[area["id"]] = area["name"]
+            area_data = read_registry(area_path, "areas", "id", ("id", "name"))
+            for area in area_data.get("areas", []):
+                area_names[area["id"]] = area["name"]
         except Exception as e:
             print(f"Warning: Could not load area names: {e}")
 
@@ -290,11 +306,11 @@ def main():
 
     # Load data
     registry_data = load_entity_registry(config_path)
-    if not registry_data:
+    if registry_data is None:
         return 1
 
     area_names = load_area_registry(config_path)
-    entities = registry_data.get("data", {}).get("entities", [])
+    entities = registry_data.get("entities", [])
 
     if not entities:
         print("No entities found in registry")
@@ -12,67 +12,10 @@ from typing import Any, Dict, List
 
 import yaml
 
-
-class HAYamlLoader(yaml.SafeLoader):
-    """Custom YAML loader that handles Home Assistant specific tags."""
-
-    pass
-
-
-def include_constructor(loader, node):
-    """Handle !include tag."""
-    filename = loader.construct_scalar(node)
-    return f"!include {filename}"
-
-def include_dir_named_constructor(loader, node):
-    """Handle !include_dir_named tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_named {dirname}"
-
-def include_dir_merge_named_constructor(loader, node):
-    """Handle !include_dir_merge_named tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_merge_named {dirname}"
-
-
-def include_dir_merge_list_constructor(loader, node):
-    """Handle !include_dir_merge_list tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_merge_list {dirname}"
-
-
-def include_dir_list_constructor(loader, node):
-    """Handle !include_dir_list tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_list {dirname}"
-
-
-def input_constructor(loader, node):
-    """Handle !input tag for blueprints."""
-    input_name = loader.construct_scalar(node)
-    return f"!input {input_name}"
-
-
-def secret_constructor(loader, node):
-    """Handle !secret tag."""
-    secret_name = loader.construct_scalar(node)
-    return f"!secret {secret_name}"
-
-
-# Register custom constructors
-HAYamlLoader.add_constructor("!include", include_constructor)
-HAYamlLoader.add_constructor(
-    "!include_dir_named", include_dir_named_constructor
-)
-HAYamlLoader.add_constructor(
-    "!include_dir_merge_named", include_dir_merge_named_constructor
-)
-HAYamlLoader.add_constructor(
-    "!include_dir_merge_list", include_dir_merge_list_constructor
-)
-HAYamlLoader.add_constructor("!include_dir_list", include_dir_list_constructor)
-HAYamlLoader.add_constructor("!input", input_constructor)
-HAYamlLoader.add_constructor("!secret", secret_constructor)
+try:
+    from tools.yaml_loader import HAYamlLoader
+except ImportError:  # Run as a script from inside the tools directory
+    from yaml_loader import HAYamlLoader  # type: ignore[no-redef]
 
 
 class HAConfigValidator:
@@ -215,7 +158,7 @@ class HAConfigValidator:
         # Validate configuration.yaml syntax and basic structure
         try:
             with open(config_file, "r") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=HAYamlLoader)
 
             if not isinstance(config, dict):
                 self.errors.append("configuration.yaml must contain a dictionary")
@@ -315,7 +258,7 @@ class HAConfigValidator:
 
         try:
             with open(automations_file, "r") as f:
-                automations = yaml.safe_load(f)
+                automations = yaml.load(f, Loader=HAYamlLoader)
 
             if automations is not None and not isinstance(automations, list):
                 self.errors.append("automations.yaml must contain a list")
@@ -352,7 +295,7 @@ class HAConfigValidator:
 
         try:
             with open(scripts_file, "r") as f:
-                scripts = yaml.safe_load(f)
+                scripts = yaml.load(f, Loader=HAYamlLoader)
 
             if scripts is not None and not isinstance(scripts, dict):
                 self.errors.append("scripts.yaml must contain a dictionary")
@@ -389,7 +332,7 @@ class HAConfigValidator:
 
         try:
             with open(secrets_file, "r") as f:
-                secrets = yaml.safe_load(f)
+                secrets = yaml.load(f, Loader=HAYamlLoader)
 
             if secrets is not None and not isinstance(secrets, dict):
                 self.errors.append("secrets.yaml must contain a dictionary")
@@ -0,0 +1,195 @@
+"""Manifest of the last successful validation, used for incremental runs.
+
+The manifest records a sha256 per validated YAML file, a fingerprint per
+entity registry entry and the entity references of every file. The next run
+then only rechecks files that changed or that reference entities which changed
+in .storage/core.entity_registry. Changes to configuration.yaml, the device or
+area registries, or the validators themselves force a full run.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+try:
+    from tools.registry_index import RegistryIndex
+except ImportError:  # Run as a script from inside the tools directory
+    from registry_index import RegistryIndex  # type: ignore[no-redef]
+
+MANIFEST_NAME = "manifest.json"
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+
+class IncrementalPlan:
+    """Files to recheck in an incremental run, and why."""
+
+    def __init__(self, files: List[Path], full: bool, reason: str):
+        """Initialize the plan."""
+        self.files = files
+        self.full = full
+        self.reason = reason
+
+
+class ValidationManifest:
+    """Paths and hashes of the last successful validation run."""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """Initialize from loaded manifest data, or empty."""
+        data = data or {}
+        self.inputs: Dict[str, Optional[str]] = data.get("inputs", {})
+        self.files: Dict[str, str] = data.get("files", {})
+        self.entities: Dict[str, str] = data.get("entities", {})
+        self.references: Dict[str, List[str]] = data.get("references", {})
+
+    @classmethod
+    def load(cls, manifest_file: Path) -> "ValidationManifest":
+        """Load a manifest, or an empty one if it is missing or outdated."""
+        try:
+            with open(manifest_file, "r") as f:
+                data = json.load(f)
+        except Exception:
+            return cls()
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return cls()
+        return cls(data)
+
+    def save(self, manifest_file: Path):
+        """Atomically write the manifest."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "inputs": self.inputs,
+            "files": self.files,
+            "entities": self.entities,
+            "references": self.references,
+        }
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=manifest_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp_name, manifest_file)
+
+    def plan(
+        self,
+        config_dir: Path,
+        yaml_files: List[Path],
+        registry_index: RegistryIndex,
+    ) -> IncrementalPlan:
+        """Work out which files need rechecking since the last successful run."""
+        if not self.files:
+            return IncrementalPlan(
+                yaml_files, True, "no previous successful validation"
+            )
+
+        inputs = input_fingerprints(config_dir)
+        for name, digest in inputs.items():
+            if self.inputs.get(name) != digest:
+                return IncrementalPlan(yaml_files, True, f"{name} changed")
+
+        changed_files = [
+            path
+            for path in yaml_files
+            if self.files.get(_relative(config_dir, path)) != file_sha256(path)
+        ]
+
+        changed_keys = self._changed_entity_keys(entity_fingerprints(registry_index))
+        referencing = [
+            path
+            for path in yaml_files
+            if changed_keys.intersection(
+                self.references.get(_relative(config_dir, path), ())
+            )
+        ]
+
+        files = sorted(set(changed_files) | set(referencing))
+        reason = (
+            f"{len(changed_files)} changed file(s), "
+            f"{len(referencing)} referencing {len(changed_keys)} changed entities"
+        )
+        return IncrementalPlan(files, False, reason)
+
+    def update(
+        self,
+        config_dir: Path,
+        yaml_files: List[Path],
+        registry_index: RegistryIndex,
+        checked_files: Iterable[Path],
+        file_references: Dict[Path, List[str]],
+    ):
+        """Record a successful run that checked the given files."""
+        current = {_relative(config_dir, path) for path in yaml_files}
+        for path in checked_files:
+            name = _relative(config_dir, path)
+            self.files[name] = file_sha256(path) or ""
+            self.references[name] = file_references.get(path, [])
+
+        # Forget files that no longer exist
+        self.files = {k: v for k, v in self.files.items() if k in current}
+        self.references = {k: v for k, v in self.references.items() if k in current}
+
+        self.inputs = input_fingerprints(config_dir)
+        self.entities = entity_fingerprints(registry_index)
+
+    def _changed_entity_keys(self, entities: Dict[str, str]) -> Set[str]:
+        """Get entity IDs and registry IDs of entities that changed."""
+        changed: Set[str] = set()
+        for entity_id in self.entities.keys() | entities.keys():
+            old = self.entities.get(entity_id)
+            new = entities.get(entity_id)
+            if old == new:
+                continue
+
+            changed.add(entity_id)
+            # Registry IDs (UUIDs) referencing the old or new entry
+            for fingerprint in (old, new):
+                if fingerprint is not None:
+                    changed.add(fingerprint.split("|", 1)[0])
+        return changed
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    """Get the sha256 of a file, or None if it does not exist."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def entity_fingerprints(registry_index: RegistryIndex) -> Dict[str, str]:
+    """Get a fingerprint of the fields validation depends on, per entity."""
+    return {
+        entity_id: f"{entity.get('id', '')}|{entity.get('disabled_by')}"
+        for entity_id, entity in registry_index.entities.items()
+    }
+
+
+def input_fingerprints(config_dir: Path) -> Dict[str, Optional[str]]:
+    """Get hashes of inputs whose change forces a full run."""
+    storage_dir = config_dir / ".storage"
+    inputs = {
+        "configuration.yaml": file_sha256(config_dir / "configuration.yaml"),
+        "core.device_registry": file_sha256(storage_dir / "core.device_registry"),
+        "core.area_registry": file_sha256(storage_dir / "core.area_registry"),
+    }
+
+    # New validation rules must recheck everything
+    tools_hash = hashlib.sha256()
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        tools_hash.update(source.read_bytes())
+    inputs["validators"] = tools_hash.hexdigest()
+
+    return inputs
+
+
+def _relative(config_dir: Path, path: Path) -> str:
+    """Get the manifest key for a file in the config directory."""
+    try:
+        return str(Path(path).resolve().relative_to(config_dir.resolve()))
+    except ValueError:
+        return str(Path(path).resolve())
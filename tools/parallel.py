@@ -0,0 +1,31 @@
+"""Helpers for fanning per-file validation work out over worker processes."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Turn a --jobs value into a worker count (0 or less means one per CPU)."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def map_in_order(func: Callable[[T], R], items: Sequence[T], jobs: int) -> List[R]:
+    """Apply func to every item in a process pool.
+
+    Results come back in input order, so callers can merge errors and
+    warnings exactly as a serial run would. func must be picklable, i.e. a
+    module-level function or a functools.partial of one.
+    """
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, items, chunksize=chunksize))
@@ -4,14 +4,37 @@
 Validates that all entity references in configuration files actually exist.
 """
 
-import json
+import argparse
 import re
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, TypedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+)
 
 import yaml
 
+try:
+    from tools.parallel import map_in_order, resolve_jobs
+    from tools.registry_index import RegistryIndex
+    from tools.yaml_cache import CACHE_DIR_NAME, YAMLCache
+    from tools.yaml_loader import HAYamlLoader
+except ImportError:  # Run as a script from inside the tools directory
+    from parallel import map_in_order, resolve_jobs  # type: ignore[no-redef]
+    from registry_index import RegistryIndex  # type: ignore[no-redef]
+    from yaml_cache import CACHE_DIR_NAME, YAMLCache  # type: ignore[no-redef]
+    from yaml_loader import HAYamlLoader  # type: ignore[no-redef]
+
 
 class DomainSummary(TypedDict):
     """Type definition for domain summary dictionary."""
@@ -22,68 +45,135 @@ class DomainSummary(TypedDict):
     examples: List[str]
 
 
-class HAYamlLoader(yaml.SafeLoader):
-    """Custom YAML loader that handles Home Assistant specific tags."""
-
-    pass
-
-
-def include_constructor(loader, node):
-    """Handle !include tag."""
-    filename = loader.construct_scalar(node)
-    return f"!include {filename}"
-
-
-def include_dir_named_constructor(loader, node):
-    """Handle !include_dir_named tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_named {dirname}"
-
-
-def include_dir_merge_named_constructor(loader, node):
-    """Handle !include_dir_merge_named tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_merge_named {dirname}"
-
-
-def include_dir_merge_list_constructor(loader, node):
-    """Handle !include_dir_merge_list tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_merge_list {dirname}"
-
-
-def include_dir_list_constructor(loader, node):
-    """Handle !include_dir_list tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_list {dirname}"
-
-
-def input_constructor(loader, node):
-    """Handle !input tag for blueprints."""
-    input_name = loader.construct_scalar(node)
-    return f"!input {input_name}"
-
+# Reference kinds, combinable as a bitmask for ReferenceValidator.collect_references
+REF_ENTITY = 1
+REF_DEVICE = 2
+REF_AREA = 4
+REF_REGISTRY_ID = 8
+REF_TEMPLATE_AREA = 16
+REF_ALL = REF_ENTITY | REF_DEVICE | REF_AREA | REF_REGISTRY_ID | REF_TEMPLATE_AREA
+
+# Parse cache slot for extracted references; bump when extraction rules change
+REFERENCES_CACHE_KEY = "references-v2"
+
+UUID_PATTERN = re.compile(r"^[a-f0-9]{32}$")
+TEMPLATE_PATTERN = re.compile(r"\{\{.*?\}\}")
+
+# One alternation for every template form that references entities or areas:
+# states('x'), is_state('x', ...), state_attr('x', ...), is_state_attr('x', ...),
+# states.domain.x, states['domain.x'], area_entities('area') and expand('x', ...).
+# expand() takes any number of arguments, which are matched separately.
+TEMPLATE_REFERENCE_PATTERN = re.compile(
+    r"\b(?:"
+    r"(?:is_state(?:_attr)?|state_attr|states)"
+    r"\(\s*(?P<q1>['\"])(?P<call>[^'\"]+)(?P=q1)"
+    r"|states(?:"
+    r"\.(?P<attr>[a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*)"
+    r"|\[\s*(?P<q2>['\"])(?P<item>[^'\"]+)(?P=q2)\s*\])"
+    r"|area_entities\(\s*(?P<q3>['\"])(?P<area>[^'\"]+)(?P=q3)"
+    r"|(?P<expand>expand)\("
+    r")"
+)
+TEMPLATE_ARGUMENT_PATTERN = re.compile(r"\s*(['\"])([^'\"]+)\1\s*,?")
+
+
+class ExtractedReferences:
+    """References collected from a configuration tree, with their source paths."""
+
+    def __init__(self):
+        """Initialize empty reference sets."""
+        self.entities: Set[str] = set()
+        self.devices: Set[str] = set()
+        self.areas: Set[str] = set()
+        self.entity_registry_ids: Set[str] = set()
+        # Area IDs or names passed to area_entities() in templates
+        self.template_areas: Set[str] = set()
+        self._by_kind = {
+            REF_ENTITY: self.entities,
+            REF_DEVICE: self.devices,
+            REF_AREA: self.areas,
+            REF_REGISTRY_ID: self.entity_registry_ids,
+            REF_TEMPLATE_AREA: self.template_areas,
+        }
+        self._links: Dict[Tuple[int, str], List[tuple]] = {}
+
+    def add(self, kind: int, value: str, link: tuple):
+        """Record a reference of the given kind found at the given path link."""
+        self._by_kind[kind].add(value)
+        self._links.setdefault((kind, value), []).append(link)
+
+    def get_paths(self, kind: int, value: str) -> List[str]:
+        """Get the config paths (e.g. 'triggers[0].entity_id') of a reference."""
+        return [_format_path(link) for link in self._links.get((kind, value), [])]
+
+    def to_cache(self) -> List[Tuple[int, str, List[tuple]]]:
+        """Convert to plain data that can be stored in the parse cache."""
+        return [(kind, value, links) for (kind, value), links in self._links.items()]
+
+    @classmethod
+    def from_cache(
+        cls, cached: List[Tuple[int, str, List[tuple]]]
+    ) -> "ExtractedReferences":
+        """Rebuild references stored with to_cache."""
+        refs = cls()
+        for kind, value, links in cached:
+            refs._by_kind[kind].add(value)
+            refs._links[(kind, value)] = list(links)
+        return refs
+
+
+def _format_path(link: Optional[tuple]) -> str:
+    """Render a (parent, key, is_index) link chain as a dotted config path."""
+    parts: List[Tuple[Any, bool]] = []
+    while link is not None:
+        link, key, is_index = link
+        parts.append((key, is_index))
+
+    path = ""
+    for key, is_index in reversed(parts):
+        if is_index:
+            path = f"{path}[{key}]"
+        else:
+            path = f"{path}.{key}" if path else str(key)
+    return path
+
+
+@lru_cache(maxsize=4096)
+def scan_template(template: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Scan a template once for the entities and areas it references.
+
+    Templates repeat a lot across automations, so results are memoized.
+    """
+    candidates = []
+    areas = set()
+    for match in TEMPLATE_REFERENCE_PATTERN.finditer(template):
+        kind = match.lastgroup
+        if kind == "expand":
+            pos = match.end()
+            argument = TEMPLATE_ARGUMENT_PATTERN.match(template, pos)
+            while argument is not None:
+                candidates.append(argument.group(2))
+                pos = argument.end()
+                argument = TEMPLATE_ARGUMENT_PATTERN.match(template, pos)
+        elif kind == "area":
+            areas.add(match.group("area"))
+        else:
+            assert kind is not None
+            candidates.append(match.group(kind))
 
-def secret_constructor(loader, node):
-    """Handle !secret tag."""
-    secret_name = loader.construct_scalar(node)
-    return f"!secret {secret_name}"
+    # Only keep values in entity ID format
+    entities = frozenset(value for value in candidates if value.count(".") == 1)
+    return entities, frozenset(areas)
 
 
-# Register custom constructors
-HAYamlLoader.add_constructor("!include", include_constructor)
-HAYamlLoader.add_constructor(
-    "!include_dir_named", include_dir_named_constructor
-)
-HAYamlLoader.add_constructor(
-    "!include_dir_merge_named", include_dir_merge_named_constructor
-)
-HAYamlLoader.add_constructor(
-    "!include_dir_merge_list", include_dir_merge_list_constructor
-)
-HAYamlLoader.add_constructor("!include_dir_list", include_dir_list_constructor)
-HAYamlLoader.add_constructor("!input", input_constructor)
-HAYamlLoader.add_constructor("!secret", secret_constructor)
+def _string_values(value: Any) -> Iterator[str]:
+    """Yield a string value, or the string items of a list value."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            if isinstance(item, str):
+                yield item
 
 
 class ReferenceValidator:
@@ -92,92 +182,98 @@ class ReferenceValidator:
     # Special keywords that are not entity IDs
     SPECIAL_KEYWORDS = {"all", "none"}
 
-    def __init__(self, config_dir: str = "config"):
-        """Initialize the ReferenceValidator."""
+    # Keys whose values hold references
+    ENTITY_KEYS = frozenset({"entity_id", "entity_ids", "entities"})
+    DEVICE_KEYS = frozenset({"device_id", "device_ids"})
+    AREA_KEYS = frozenset({"area_id", "area_ids"})
+
+    # Substrings that mark a value as a template worth scanning for entities
+    TEMPLATE_MARKERS = (
+        "state_attr(",
+        "states(",
+        "is_state(",
+        "states.",
+        "states[",
+        "expand(",
+        "area_entities(",
+    )
+
+    def __init__(
+        self,
+        config_dir: str = "config",
+        registry_index: Optional[RegistryIndex] = None,
+        cache: Optional[YAMLCache] = None,
+    ):
+        """Initialize the ReferenceValidator.
+
+        A registry index loaded once per run may be passed in to share it
+        between validators; otherwise it is loaded on first use. With a parse
+        cache, unchanged files skip both parsing and reference extraction.
+        """
         self.config_dir = Path(config_dir)
+        self.cache = cache
         self.storage_dir = self.config_dir / ".storage"
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
-        # Cache for loaded registries
-        self._entities: Optional[Dict[str, Any]] = None
-        self._devices: Optional[Dict[str, Any]] = None
-        self._areas: Optional[Dict[str, Any]] = None
+        # Entity IDs and registry IDs referenced by each checked file
+        self.file_references: Dict[Path, List[str]] = {}
+
+        self._registry_index = registry_index
+        self._registry_problems_reported = False
         self._config_entities: Optional[Set[str]] = None
 
+    def get_registry_index(self) -> RegistryIndex:
+        """Get the shared registry index, loading it on first use."""
+        if self._registry_index is None:
+            self._registry_index = RegistryIndex.load(self.storage_dir)
+
+        if not self._registry_problems_reported:
+            self.errors.extend(self._registry_index.errors)
+            self.warnings.extend(self._registry_index.warnings)
+            self._registry_problems_reported = True
+
+        return self._registry_index
+
     def load_entity_registry(self) -> Dict[str, Any]:
-        """Load and cache entity registry."""
-        if self._entities is None:
-            registry_file = self.storage_dir / "core.entity_registry"
-            if not registry_file.exists():
-                self.errors.append(f"Entity registry not found: {registry_file}")
-                return {}
-
-            try:
-                with open(registry_file, "r") as f:
-                    data = json.load(f)
-                    self._entities = {
-                        entity["entity_id"]: entity
-                        for entity in data.get("data", {}).get("entities", [])
-                    }
-            except Exception as e:
-                self.errors.append(f"Failed to load entity registry: {e}")
-                return {}
-
-        return self._entities
+        """Get entity registry entries keyed by entity_id."""
+        return self.get_registry_index().entities
 
     def load_device_registry(self) -> Dict[str, Any]:
-        """Load and cache device registry."""
-        if self._devices is None:
-            registry_file = self.storage_dir / "core.device_registry"
-            if not registry_file.exists():
-                self.errors.append(f"Device registry not found: {registry_file}")
-                return {}
-
-            try:
-                with open(registry_file, "r") as f:
-                    data = json.load(f)
-                    self._devices = {
-                        device["id"]: device
-                        for device in data.get("data", {}).get("devices", [])
-                    }
-            except Exception as e:
-                self.errors.append(f"Failed to load device registry: {e}")
-                return {}
-
-        return self._devices
+        """Get device registry entries keyed by device ID."""
+        return self.get_registry_index().devices
 
     def load_area_registry(self) -> Dict[str, Any]:
-        """Load and cache area registry."""
-        if self._areas is None:
-            registry_file = self.storage_dir / "core.area_registry"
-            if not registry_file.exists():
-                self.warnings.append(f"Area registry not found: {registry_file}")
-                return {}
-
-            try:
-                with open(registry_file, "r") as f:
-                    data = json.load(f)
-                    self._areas = {
-                        area["id"]: area
-                        for area in data.get("data", {}).get("areas", [])
-                    }
-            except Exception as e:
-                self.warnings.append(f"Failed to load area registry: {e}")
-                return {}
-
-        return self._areas
+        """Get area registry entries keyed by area ID."""
+        return self.get_registry_index().areas
+
+    def load_yaml(self, file_path: Path) -> Any:
+        """Parse a YAML file, through the parse cache when one is configured."""
+        if self.cache is not None:
+            return self.cache.load(file_path, HAYamlLoader, self.cache_extras())
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=HAYamlLoader)
+
+    def cache_extras(self) -> Dict[str, Callable[[Any], Any]]:
+        """Get the extras to store with each freshly parsed tree in the cache."""
+        return {REFERENCES_CACHE_KEY: self._references_for_cache}
+
+    def _references_for_cache(self, data: Any) -> Optional[list]:
+        """Collect the references of a parsed tree as cacheable plain data."""
+        if data is None:
+            return None
+        return self.collect_references(data).to_cache()
 
     def is_uuid_format(self, value: str) -> bool:
         """Check if a string matches UUID format (32 hex characters)."""
         # UUID format: 8-4-4-4-12 hex digits, but HA often stores without hyphens
-        uuid_pattern = r"^[a-f0-9]{32}$"
-        return bool(re.match(uuid_pattern, value))
+        return UUID_PATTERN.match(value) is not None
 
     def is_template(self, value: str) -> bool:
         """Check if value is a Jinja2 template expression."""
         # Match template expressions like {{ ... }}
-        return bool(re.search(r"\{\{.*?\}\}", value))
+        return "{{" in value and TEMPLATE_PATTERN.search(value) is not None
 
     def should_skip_entity_validation(self, value: str) -> bool:
         """Check if entity reference should be skipped during validation."""
@@ -189,171 +285,124 @@ class ReferenceValidator:
             in self.SPECIAL_KEYWORDS  # Special keywords like "all", "none"
         )
 
+    def collect_references(
+        self, data: Any, kinds: int = REF_ALL
+    ) -> ExtractedReferences:
+        """Collect entity, device, area and registry ID references in one pass.
+
+        The tree is walked iteratively with an explicit stack. Each stack entry
+        carries a bitmask of the reference kinds still being collected below it,
+        so the per-kind pruning rules of the original recursive extractors are
+        preserved exactly. Source paths are only materialized for nodes that
+        actually hold a reference.
+        """
+        refs = ExtractedReferences()
+        entity_keys = self.ENTITY_KEYS
+        device_keys = self.DEVICE_KEYS
+        area_keys = self.AREA_KEYS
+        template_markers = self.TEMPLATE_MARKERS
+        skip_entity = self.should_skip_entity_validation
+        is_uuid = self.is_uuid_format
+
+        stack: List[Tuple[Any, Optional[tuple], int]] = [(data, None, kinds)]
+        while stack:
+            node, parent, mask = stack.pop()
+
+            if isinstance(node, dict):
+                # Reversed so that children are visited in document order
+                for key, value in reversed(node.items()):
+                    link = (parent, key, False)
+                    child_mask = mask
+
+                    if key in entity_keys:
+                        if mask & REF_ENTITY:
+                            for entity in _string_values(value):
+                                if not skip_entity(entity):
+                                    refs.add(REF_ENTITY, entity, link)
+                        if (
+                            mask & REF_REGISTRY_ID
+                            and key == "entity_id"
+                            and isinstance(value, str)
+                            and is_uuid(value)
+                        ):
+                            refs.add(REF_REGISTRY_ID, value, link)
+                        child_mask &= ~(REF_ENTITY | REF_TEMPLATE_AREA)
+
+                    elif key in device_keys:
+                        if mask & REF_DEVICE:
+                            for device in _string_values(value):
+                                if not device.startswith("!"):
+                                    refs.add(REF_DEVICE, device, link)
+                        child_mask &= ~(REF_ENTITY | REF_TEMPLATE_AREA | REF_DEVICE)
+
+                    elif key in area_keys:
+                        if mask & REF_AREA:
+                            for area in _string_values(value):
+                                if not area.startswith("!"):
+                                    refs.add(REF_AREA, area, link)
+                        child_mask &= ~(REF_ENTITY | REF_TEMPLATE_AREA | REF_AREA)
+
+                    elif (
+                        mask & (REF_ENTITY | REF_TEMPLATE_AREA)
+                        and isinstance(value, str)
+                        and any(marker in value for marker in template_markers)
+                    ):
+                        entities, template_areas = scan_template(value)
+                        if mask & REF_ENTITY:
+                            for entity in entities:
+                                refs.add(REF_ENTITY, entity, link)
+                        if mask & REF_TEMPLATE_AREA:
+                            for area in template_areas:
+                                refs.add(REF_TEMPLATE_AREA, area, link)
+
+                    if child_mask and isinstance(value, (dict, list)):
+                        stack.append((value, link, child_mask))
+
+            elif isinstance(node, list):
+                for index in range(len(node) - 1, -1, -1):
+                    item = node[index]
+                    if isinstance(item, (dict, list)):
+                        stack.append((item, (parent, index, True), mask))
+
+        return refs
+
     def extract_entity_references(self, data: Any, path: str = "") -> Set[str]:
         """Extract entity references from configuration data."""
-        entities = set()
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-
-                # Common entity reference keys
-                if key in ["entity_id", "entity_ids", "entities"]:
-                    if isinstance(value, str):
-                        if not self.should_skip_entity_validation(value):
-                            entities.add(value)
-                    elif isinstance(value, list):
-                        for entity in value:
-                            if isinstance(
-                                entity, str
-                            ) and not self.should_skip_entity_validation(entity):
-                                entities.add(entity)
-
-                # Device-related keys
-                elif key in ["device_id", "device_ids"]:
-                    # Device IDs are handled separately
-                    pass
-
-                # Area-related keys
-                elif key in ["area_id", "area_ids"]:
-                    # Area IDs are handled separately
-                    pass
-
-                # Service data might contain entity references
-                elif key == "data" and isinstance(value, dict):
-                    entities.update(self.extract_entity_references(value, current_path))
-
-                # Templates might contain entity references
-                elif isinstance(value, str) and any(
-                    x in value for x in ["state_attr(", "states(", "is_state("]
-                ):
-                    entities.update(self.extract_entities_from_template(value))
-
-                # Recursive search
-                else:
-                    entities.update(self.extract_entity_references(value, current_path))
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]" if path else f"[{i}]"
-                entities.update(self.extract_entity_references(item, current_path))
-
-        return entities
+        return self.collect_references(data, REF_ENTITY).entities
 
     def extract_entities_from_template(self, template: str) -> Set[str]:
         """Extract entity references from Jinja2 templates."""
-        entities = set()
-
-        # Common patterns for entity references in templates
-        patterns = [
-            r"states\('([^']+)'\)",  # states('entity.id')
-            r'states\("([^"]+)"\)',  # states("entity.id")
-            # states.domain.entity
-            r"states\.([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*)",
-            r"is_state\('([^']+)'",  # is_state('entity.id', ...)
-            r'is_state\("([^"]+)"',  # is_state("entity.id", ...)
-            r"state_attr\('([^']+)'",  # state_attr('entity.id', ...)
-            r'state_attr\("([^"]+)"',  # state_attr("entity.id", ...)
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, template)
-            for match in matches:
-                # Validate entity ID format
-                if "." in match and len(match.split(".")) == 2:
-                    entities.add(match)
-
-        return entities
+        return set(scan_template(template)[0])
 
     def extract_device_references(self, data: Any) -> Set[str]:
         """Extract device references from configuration data."""
-        devices = set()
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key in ["device_id", "device_ids"]:
-                    if isinstance(value, str):
-                        # Skip blueprint inputs and other HA tags
-                        if not value.startswith("!"):
-                            devices.add(value)
-                    elif isinstance(value, list):
-                        for device in value:
-                            if isinstance(device, str) and not device.startswith("!"):
-                                devices.add(device)
-                else:
-                    devices.update(self.extract_device_references(value))
-
-        elif isinstance(data, list):
-            for item in data:
-                devices.update(self.extract_device_references(item))
-
-        return devices
+        return self.collect_references(data, REF_DEVICE).devices
 
     def extract_area_references(self, data: Any) -> Set[str]:
         """Extract area references from configuration data."""
-        areas = set()
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key in ["area_id", "area_ids"]:
-                    if isinstance(value, str):
-                        # Skip blueprint inputs and other HA tags
-                        if not value.startswith("!"):
-                            areas.add(value)
-                    elif isinstance(value, list):
-                        for area in value:
-                            if isinstance(area, str) and not area.startswith("!"):
-                                areas.add(area)
-                else:
-                    areas.update(self.extract_area_references(value))
-
-        elif isinstance(data, list):
-            for item in data:
-                areas.update(self.extract_area_references(item))
-
-        return areas
+        return self.collect_references(data, REF_AREA).areas
 
     def extract_entity_registry_ids(self, data: Any) -> Set[str]:
         """Extract entity registry UUID references from configuration data."""
-        entity_registry_ids = set()
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                # Look for entity_id fields containing UUIDs (device-based automations)
-                if key == "entity_id" and isinstance(value, str):
-                    if self.is_uuid_format(value):
-                        entity_registry_ids.add(value)
-                else:
-                    entity_registry_ids.update(self.extract_entity_registry_ids(value))
-        elif isinstance(data, list):
-            for item in data:
-                entity_registry_ids.update(self.extract_entity_registry_ids(item))
-
-        return entity_registry_ids
+        return self.collect_references(data, REF_REGISTRY_ID).entity_registry_ids
 
     def get_entity_registry_id_mapping(self) -> Dict[str, str]:
         """Get mapping from entity registry ID to entity_id."""
-        entities = self.load_entity_registry()
-        return {
-            entity_data["id"]: entity_data["entity_id"]
-            for entity_data in entities.values()
-            if "id" in entity_data
-        }
+        return self.get_registry_index().entity_ids_by_registry_id
 
     def load_config_defined_entities(self) -> Set[str]:
         """Load entities defined in configuration.yaml (templates, platforms, etc)."""
         if self._config_entities is not None:
             return self._config_entities
 
-        config_entities = set()
+        config_entities: Set[str] = set()
         config_file = self.config_dir / "configuration.yaml"
 
         if not config_file.exists():
             return config_entities
 
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                data = yaml.load(f, Loader=HAYamlLoader)
+            data = self.load_yaml(config_file)
 
             if not isinstance(data, dict):
                 return config_entities
@@ -410,32 +459,71 @@ class ReferenceValidator:
             # Don't fail validation, just log and continue
             return config_entities
 
-    def validate_file_references(self, file_path: Path) -> bool:
-        """Validate all references in a single file."""
+    def parse_file_references(
+        self, file_path: Path
+    ) -> Tuple[Optional[ExtractedReferences], Optional[str]]:
+        """Parse a file and collect its references.
+
+        Returns the references (None for skipped or empty files) and an error
+        message if the file could not be loaded. Registries are not touched,
+        so this can run in a worker process.
+        """
         if file_path.name == "secrets.yaml":
-            return True  # Skip secrets file
+            return None, None  # Skip secrets file
+
+        if self.cache is not None:
+            cached = self.cache.get_extra(file_path, REFERENCES_CACHE_KEY)
+            if cached is not None:
+                return ExtractedReferences.from_cache(cached), None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = yaml.load(f, Loader=HAYamlLoader)
+            data = self.load_yaml(file_path)
         except Exception as e:
-            self.errors.append(f"{file_path}: Failed to load YAML - {e}")
-            return False
+            return None, f"{file_path}: Failed to load YAML - {e}"
 
         if data is None:
-            return True  # Empty file is valid
+            return None, None  # Empty file is valid
 
-        # Extract references
-        entity_refs = self.extract_entity_references(data)
-        device_refs = self.extract_device_references(data)
-        area_refs = self.extract_area_references(data)
-        entity_registry_ids = self.extract_entity_registry_ids(data)
+        if self.cache is not None:
+            # Collected while parsing, unless the tree was cached without them
+            cached = self.cache.get_extra(file_path, REFERENCES_CACHE_KEY)
+            if cached is not None:
+                return ExtractedReferences.from_cache(cached), None
 
-        # Load registries
-        entities = self.load_entity_registry()
-        devices = self.load_device_registry()
-        areas = self.load_area_registry()
-        entity_id_mapping = self.get_entity_registry_id_mapping()
+        refs = self.collect_references(data)
+        if self.cache is not None:
+            self.cache.set_extra(file_path, REFERENCES_CACHE_KEY, refs.to_cache())
+        return refs, None
+
+    def validate_file_references(self, file_path: Path) -> bool:
+        """Validate all references in a single file."""
+        refs, error = self.parse_file_references(file_path)
+        if error is not None:
+            self.errors.append(error)
+            return False
+
+        if refs is None:
+            return True
+
+        return self.check_file_references(file_path, refs)
+
+    def check_file_references(self, file_path: Path, refs: ExtractedReferences) -> bool:
+        """Check collected references of a file against the registries."""
+        # References are checked in sorted order so output is deterministic
+        entity_refs = sorted(refs.entities)
+        device_refs = sorted(refs.devices)
+        area_refs = sorted(refs.areas)
+        template_area_refs = sorted(refs.template_areas)
+        entity_registry_ids = sorted(refs.entity_registry_ids)
+        self.file_references[file_path] = sorted(
+            refs.entities | refs.entity_registry_ids
+        )
+
+        # Registries are indexed once and shared across files
+        index = self.get_registry_index()
+        entities = index.entities
+        devices = index.devices
+        areas = index.areas
         config_entities = self.load_config_defined_entities()
 
         all_valid = True
@@ -448,38 +536,23 @@ class ReferenceValidator:
 
             # Check entity registry first, then config-defined entities
             if entity_id not in entities and entity_id not in config_entities:
-                # Check if it's a disabled entity
-                disabled_entities = {
-                    e["entity_id"]: e
-                    for e in entities.values()
-                    if e.get("disabled_by") is not None
-                }
-
-                if entity_id in disabled_entities:
-                    self.warnings.append(
-                        f"{file_path}: References disabled entity " f"'{entity_id}'"
-                    )
-                else:
-                    self.errors.append(f"{file_path}: Unknown entity '{entity_id}'")
-                    all_valid = False
+                self.errors.append(f"{file_path}: Unknown entity '{entity_id}'")
+                all_valid = False
 
         # Validate entity registry ID references (UUID format)
         for registry_id in entity_registry_ids:
-            if registry_id not in entity_id_mapping:
+            actual_entity_id = index.resolve_registry_id(registry_id)
+            if actual_entity_id is None:
                 self.errors.append(
                     f"{file_path}: Unknown entity registry ID '{registry_id}'"
                 )
                 all_valid = False
-            else:
-                # Check if the mapped entity is disabled
-                actual_entity_id = entity_id_mapping[registry_id]
-                if actual_entity_id in entities:
-                    entity_data = entities[actual_entity_id]
-                    if entity_data.get("disabled_by") is not None:
-                        self.warnings.append(
-                            f"{file_path}: Entity registry ID '{registry_id}' "
-                            f"references disabled entity '{actual_entity_id}'"
-                        )
+            elif index.is_disabled(actual_entity_id):
+                # The mapped entity exists but is disabled
+                self.warnings.append(
+                    f"{file_path}: Entity registry ID '{registry_id}' "
+                    f"references disabled entity '{actual_entity_id}'"
+                )
 
         # Validate device references
         for device_id in device_refs:
@@ -492,6 +565,13 @@ class ReferenceValidator:
             if area_id not in areas:
                 self.warnings.append(f"{file_path}: Unknown area '{area_id}'")
 
+        # area_entities() accepts an area ID or name
+        for area in template_area_refs:
+            if index.resolve_area(area) is None:
+                self.warnings.append(
+                    f"{file_path}: Unknown area '{area}' in area_entities()"
+                )
+
         return all_valid
 
     def get_yaml_files(self) -> List[Path]:
@@ -501,23 +581,44 @@ class ReferenceValidator:
             yaml_files.extend(self.config_dir.glob(pattern))
 
         # Skip blueprints directory - these are templates with !input tags
-        return yaml_files
+        return sorted(yaml_files)
 
-    def validate_all(self) -> bool:
-        """Validate all references in the config directory."""
+    def validate_all(self, jobs: int = 1, files: Optional[List[Path]] = None) -> bool:
+        """Validate all references in the config directory.
+
+        With jobs > 1 (or 0 for one per CPU), parsing and reference extraction
+        run in a process pool while registry lookups stay in this process.
+        Results are merged in file order, so output matches a serial run.
+        Pass files to only check that subset, e.g. for an incremental run.
+        """
         if not self.config_dir.exists():
             self.errors.append(f"Config directory {self.config_dir} does not exist")
             return False
 
-        yaml_files = self.get_yaml_files()
+        if files is not None:
+            yaml_files = sorted(files)
+        else:
+            yaml_files = self.get_yaml_files()
+            if not yaml_files:
+                self.warnings.append("No YAML files found in config directory")
         if not yaml_files:
-            self.warnings.append("No YAML files found in config directory")
             return True
 
+        if resolve_jobs(jobs) > 1:
+            worker = partial(
+                _parse_file_references_worker, str(self.config_dir), self.cache
+            )
+            parsed = map_in_order(worker, yaml_files, jobs)
+        else:
+            parsed = [self.parse_file_references(path) for path in yaml_files]
+
         all_valid = True
 
-        for file_path in yaml_files:
-            if not self.validate_file_references(file_path):
+        for file_path, (refs, error) in zip(yaml_files, parsed):
+            if error is not None:
+                self.errors.append(error)
+                all_valid = False
+            elif refs is not None and not self.check_file_references(file_path, refs):
                 all_valid = False
 
         return all_valid
@@ -586,12 +687,39 @@ class ReferenceValidator:
             print("❌ Invalid entity/device references found")
 
 
+def _parse_file_references_worker(
+    config_dir: str, cache: Optional[YAMLCache], file_path: Path
+) -> Tuple[Optional[ExtractedReferences], Optional[str]]:
+    """Parse one file and collect its references in a worker process."""
+    validator = ReferenceValidator(config_dir, cache=cache)
+    return validator.parse_file_references(file_path)
+
+
 def main():
     """Run entity and device reference validation from command line."""
-    config_dir = sys.argv[1] if len(sys.argv) > 1 else "config"
-
-    validator = ReferenceValidator(config_dir)
-    is_valid = validator.validate_all()
+    parser = argparse.ArgumentParser(
+        description="Validate entity and device references in HA configuration"
+    )
+    parser.add_argument(
+        "config_dir", nargs="?", default="config", help="Path to HA config directory"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes for parsing (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-parse files instead of using {CACHE_DIR_NAME}/",
+    )
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else YAMLCache.for_config_dir(args.config_dir)
+    validator = ReferenceValidator(args.config_dir, cache=cache)
+    is_valid = validator.validate_all(jobs=args.jobs)
     validator.print_results()
 
     sys.exit(0 if is_valid else 1)
@@ -0,0 +1,197 @@
+"""Lookup index over the Home Assistant entity, device and area registries.
+
+The registries in .storage are loaded once per validation run and turned into
+hash maps, so validators never scan the registries per reference.
+
+Registry files can be tens of MB, mostly deleted_entities and fields nobody
+validates. read_registry memory-maps the file, stops parsing before the
+deleted_* list unless asked for it, and keeps only the requested fields of
+each entry while the JSON is being decoded.
+"""
+
+import json
+import mmap
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# Entry fields kept for validation; everything else is dropped while decoding
+ENTITY_FIELDS = ("entity_id", "id", "disabled_by", "device_id", "area_id")
+DEVICE_FIELDS = ("id", "name", "name_by_user", "disabled_by", "area_id")
+AREA_FIELDS = ("id", "name")
+
+
+class RegistryIndex:
+    """Hash-map lookups over the entity, device and area registries."""
+
+    def __init__(
+        self,
+        entities: Optional[Dict[str, Dict[str, Any]]] = None,
+        devices: Optional[Dict[str, Dict[str, Any]]] = None,
+        areas: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        """Build the lookup maps from already loaded registry entries."""
+        self.entities: Dict[str, Dict[str, Any]] = entities or {}
+        self.devices: Dict[str, Dict[str, Any]] = devices or {}
+        self.areas: Dict[str, Dict[str, Any]] = areas or {}
+
+        # Problems encountered while loading, reported by each validator
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+
+        self.area_ids_by_name: Dict[str, str] = {
+            _normalize_area_name(area["name"]): area_id
+            for area_id, area in self.areas.items()
+            if isinstance(area.get("name"), str)
+        }
+
+        self.entity_ids_by_registry_id: Dict[str, str] = {}
+        self.disabled_entities: Set[str] = set()
+        for entity_id, entity in self.entities.items():
+            if "id" in entity:
+                self.entity_ids_by_registry_id[entity["id"]] = entity_id
+            if entity.get("disabled_by") is not None:
+                self.disabled_entities.add(entity_id)
+
+    @classmethod
+    def load(cls, storage_dir: Path) -> "RegistryIndex":
+        """Load the registries from a .storage directory and index them."""
+        errors: List[str] = []
+        warnings: List[str] = []
+
+        entities = _load_registry(
+            storage_dir / "core.entity_registry",
+            "entity",
+            "entities",
+            "entity_id",
+            ENTITY_FIELDS,
+            errors,
+        )
+        devices = _load_registry(
+            storage_dir / "core.device_registry",
+            "device",
+            "devices",
+            "id",
+            DEVICE_FIELDS,
+            errors,
+        )
+        # A missing area registry is not fatal
+        areas = _load_registry(
+            storage_dir / "core.area_registry",
+            "area",
+            "areas",
+            "id",
+            AREA_FIELDS,
+            warnings,
+        )
+
+        index = cls(entities, devices, areas)
+        index.errors = errors
+        index.warnings = warnings
+        return index
+
+    def is_disabled(self, entity_id: str) -> bool:
+        """Check if an entity exists in the registry but is disabled."""
+        return entity_id in self.disabled_entities
+
+    def resolve_registry_id(self, registry_id: str) -> Optional[str]:
+        """Get the entity_id for an entity registry ID (UUID), if known."""
+        return self.entity_ids_by_registry_id.get(registry_id)
+
+    def resolve_area(self, area: str) -> Optional[str]:
+        """Get the area ID for an area ID or name, as area_entities() does."""
+        if area in self.areas:
+            return area
+        return self.area_ids_by_name.get(_normalize_area_name(area))
+
+
+def _normalize_area_name(name: str) -> str:
+    """Normalize an area name the way Home Assistant compares them."""
+    return "".join(name.casefold().split())
+
+
+def read_registry(
+    registry_file: Path,
+    collection: str,
+    key_field: str,
+    fields: Optional[Iterable[str]] = None,
+    include_deleted: bool = False,
+) -> Dict[str, Any]:
+    """Read the data section of a .storage registry file.
+
+    Entries of the collection (and deleted_<collection>, if included) are
+    identified by their key_field and reduced to the given fields, or kept
+    whole if fields is None. Raises like json.load on unreadable files.
+    """
+    if fields is None:
+        object_hook = None
+    else:
+        keep = tuple(fields)
+
+        def object_hook(obj: Dict[str, Any]) -> Dict[str, Any]:
+            if key_field not in obj:
+                return obj
+            return {field: obj[field] for field in keep if field in obj}
+
+    with open(registry_file, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            return json.loads(f.read(), object_hook=object_hook).get("data", {})
+
+        with mapped:
+            if not include_deleted:
+                data = _read_without_deleted(mapped, collection, object_hook)
+                if data is not None:
+                    return data
+            return json.loads(mapped[:], object_hook=object_hook).get("data", {})
+
+
+def _read_without_deleted(
+    mapped: mmap.mmap, collection: str, object_hook: Any
+) -> Optional[Dict[str, Any]]:
+    """Parse a registry up to its deleted_<collection> key, if it has one.
+
+    Home Assistant writes {"data": {"<collection>": [...], "deleted_...": [...]}},
+    so cutting the document at the deleted key and closing both objects leaves
+    valid JSON. Returns None if the layout is anything else.
+    """
+    # An unescaped quote followed by ':' can only be a key
+    match = re.search(rb'"deleted_' + collection.encode() + rb'"\s*:', mapped)
+    if match is None:
+        return None
+
+    head = mapped[: match.start()].rstrip()
+    if not head.endswith(b","):
+        return None
+
+    try:
+        document = json.loads(head[:-1] + b"}}", object_hook=object_hook)
+    except ValueError:
+        return None
+
+    data = document.get("data") if isinstance(document, dict) else None
+    if not isinstance(data, dict) or not isinstance(data.get(collection), list):
+        return None
+    return data
+
+
+def _load_registry(
+    registry_file: Path,
+    name: str,
+    collection: str,
+    key_field: str,
+    fields: Iterable[str],
+    problems: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    """Load one registry file into a dict keyed by key_field."""
+    if not registry_file.exists():
+        problems.append(f"{name.capitalize()} registry not found: {registry_file}")
+        return {}
+
+    try:
+        data = read_registry(registry_file, collection, key_field, fields)
+        return {item[key_field]: item for item in data.get(collection, [])}
+    except Exception as e:
+        problems.append(f"Failed to load {name} registry: {e}")
+        return {}
@@ -1,25 +1,102 @@
 #!/usr/bin/env python3
 """Test suite runner for Home Assistant configuration validation.
 
-Runs all validators and provides a comprehensive report.
+Runs all validators and provides a comprehensive report. By default the
+validators run in this process, concurrently, on one shared parse of the
+configuration; --isolated runs each one in its own Python subprocess instead.
+With --incremental only files changed since the last successful run, or that
+reference entities changed in the entity registry, are rechecked.
 """
 
+import argparse
+import importlib.util
+import io
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+try:
+    from tools.ha_official_validator import HAOfficialValidator
+    from tools.incremental import MANIFEST_NAME, IncrementalPlan, ValidationManifest
+    from tools.reference_validator import ReferenceValidator
+    from tools.registry_index import RegistryIndex
+    from tools.yaml_cache import CACHE_DIR_NAME, YAMLCache
+    from tools.yaml_loader import HAYamlLoader
+    from tools.yaml_validator import YAMLValidator
+except ImportError:  # Run as a script from inside the tools directory
+    from ha_official_validator import HAOfficialValidator  # type: ignore[no-redef]
+    from incremental import (  # type: ignore[no-redef]
+        MANIFEST_NAME,
+        IncrementalPlan,
+        ValidationManifest,
+    )
+    from reference_validator import ReferenceValidator  # type: ignore[no-redef]
+    from registry_index import RegistryIndex  # type: ignore[no-redef]
+    from yaml_cache import CACHE_DIR_NAME, YAMLCache  # type: ignore[no-redef]
+    from yaml_loader import HAYamlLoader  # type: ignore[no-redef]
+    from yaml_validator import YAMLValidator  # type: ignore[no-redef]
+
+
+class _Validator(Protocol):
+    """A validator run by the test runner."""
+
+    @property
+    def validate_all(self) -> Callable[..., bool]:
+        """Run the checks; only some validators accept files= and jobs=."""
+
+    def print_results(self) -> None:
+        """Print the results of the last validate_all run."""
+
+
+def _timed_validate_all(
+    validator: _Validator, **kwargs: Any
+) -> Tuple[bool, str, float]:
+    """Run a validator's validate_all and time it."""
+    start_time = time.time()
+    try:
+        passed = validator.validate_all(**kwargs)
+        return passed, "", time.time() - start_time
+    except Exception as e:
+        return False, f"Failed to run validator: {e}", time.time() - start_time
 
 
 class ValidationTestRunner:
     """Runs all validation tests and reports results."""
 
-    def __init__(self, config_dir: str = "config"):
+    VALIDATORS = [
+        ("yaml_validator.py", "YAML Syntax Validation"),
+        ("reference_validator.py", "Entity/Device Reference Validation"),
+        (
+            "ha_official_validator.py",
+            "Official Home Assistant Configuration Validation",
+        ),
+    ]
+
+    # Validators that share the parsed-YAML cache in .validator-cache/
+    CACHE_AWARE_VALIDATORS = {"yaml_validator.py", "reference_validator.py"}
+
+    def __init__(
+        self,
+        config_dir: str = "config",
+        use_cache: bool = True,
+        isolated: bool = False,
+        incremental: bool = False,
+    ):
         """Initialize the test runner."""
         self.config_dir = Path(config_dir).resolve()
+        self.use_cache = use_cache
+        self.isolated = isolated
+        self.incremental = incremental
+        self.manifest_file = self.config_dir.parent / CACHE_DIR_NAME / MANIFEST_NAME
+        self.plan: Optional[IncrementalPlan] = None
         self.tools_dir = Path(__file__).parent
         self.venv_dir = self.tools_dir.parent / "venv"
         self.results: Dict[str, Dict[str, Any]] = {}
+        self.stage_timings: Dict[str, float] = {}
 
     def get_python_executable(self) -> str:
         """Get the Python executable from venv if available."""
@@ -38,6 +115,8 @@ class ValidationTestRunner:
 
         python_exe = self.get_python_executable()
         cmd = [python_exe, str(script_path), str(self.config_dir)]
+        if not self.use_cache and script_name in self.CACHE_AWARE_VALIDATORS:
+            cmd.append("--no-cache")
 
         start_time = time.time()
         try:
@@ -67,17 +146,99 @@ class ValidationTestRunner:
             duration = end_time - start_time
             return (False, "", f"Failed to run validator: {e}", duration)
 
+    def run_validators_in_process(self) -> Dict[str, Tuple[bool, str, str, float]]:
+        """Run all validators in this process on one shared config snapshot.
+
+        Registries and YAML files are loaded once up front. The validators then
+        run concurrently in threads and only read from that snapshot; their
+        reports are captured afterwards, one at a time. A successful run is
+        recorded in the manifest used by incremental runs.
+        """
+        start_time = time.time()
+        registry_index = RegistryIndex.load(self.config_dir / ".storage")
+        self.stage_timings["Load registries"] = time.time() - start_time
+
+        yaml_files = YAMLValidator(str(self.config_dir)).get_yaml_files()
+        manifest = ValidationManifest.load(self.manifest_file)
+        if self.incremental:
+            self.plan = manifest.plan(self.config_dir, yaml_files, registry_index)
+        else:
+            self.plan = IncrementalPlan(yaml_files, True, "full run requested")
+        files = self.plan.files
+
+        start_time = time.time()
+        if self.use_cache:
+            snapshot = YAMLCache.for_config_dir(self.config_dir)
+        else:
+            snapshot = YAMLCache(None)
+        config_dir = str(self.config_dir)
+        reference_validator = ReferenceValidator(
+            config_dir, registry_index=registry_index, cache=snapshot
+        )
+        # References are stored with each tree, so every entry is written once
+        extras = reference_validator.cache_extras()
+        for file_path in files:
+            if file_path.name == "secrets.yaml":
+                continue
+            try:
+                snapshot.load(file_path, HAYamlLoader, extras)
+            except Exception:
+                pass  # Reported by the validators themselves
+        self.stage_timings["Parse YAML snapshot"] = time.time() - start_time
+
+        validators: Dict[str, _Validator] = {
+            "yaml_validator.py": YAMLValidator(config_dir, cache=snapshot),
+            "reference_validator.py": reference_validator,
+            "ha_official_validator.py": HAOfficialValidator(config_dir),
+        }
+
+        # The official check always covers the whole configuration, so it only
+        # runs if something changed
+        skipped = set()
+        if not self.plan.full and not files:
+            skipped.add("ha_official_validator.py")
+
+        with ThreadPoolExecutor(max_workers=len(validators)) as pool:
+            futures = {}
+            for script_name, validator in validators.items():
+                if script_name in skipped:
+                    continue
+                if script_name in self.CACHE_AWARE_VALIDATORS:
+                    future = pool.submit(_timed_validate_all, validator, files=files)
+                else:
+                    future = pool.submit(_timed_validate_all, validator)
+                futures[script_name] = future
+
+        outcomes = {}
+        for script_name, validator in validators.items():
+            if script_name in skipped:
+                message = "Skipped: no changes since the last successful validation\n"
+                outcomes[script_name] = (True, message, "", 0.0)
+                continue
+
+            passed, stderr, duration = futures[script_name].result()
+            output = io.StringIO()
+            with redirect_stdout(output):
+                validator.print_results()
+            outcomes[script_name] = (passed, output.getvalue(), stderr, duration)
+
+        if all(outcome[0] for outcome in outcomes.values()):
+            manifest.update(
+                self.config_dir,
+                yaml_files,
+                registry_index,
+                files,
+                reference_validator.file_references,
+            )
+            try:
+                manifest.save(self.manifest_file)
+            except OSError:
+                pass  # Only costs the next incremental run a full check
+
+        return outcomes
+
     def run_all_tests(self) -> bool:
         """Run all validation tests."""
-        validators = [
-            ("yaml_validator.py", "YAML Syntax Validation"),
-            ("reference_validator.py", "Entity/Device Reference Validation"),
-            (
-                "ha_official_validator.py",
-                "Official Home Assistant Configuration Validation",
-            ),
-        ]
-
         all_passed = True
         total_duration = 0.0
 
@@ -85,13 +246,34 @@ class ValidationTestRunner:
         print("=" * 60)
         print()
 
-        for script_name, description in validators:
+        outcomes = {}
+        if not self.isolated:
+            start_time = time.time()
+            outcomes = self.run_validators_in_process()
+            total_duration = time.time() - start_time
+
+        if self.incremental and self.plan is not None:
+            total_files = len(YAMLValidator(str(self.config_dir)).get_yaml_files())
+            if self.plan.full:
+                print(f"Incremental run: checking all files ({self.plan.reason})")
+            else:
+                print(
+                    f"Incremental run: checking {len(self.plan.files)} of "
+                    f"{total_files} files ({self.plan.reason})"
+                )
+            print()
+
+        for script_name, description in self.VALIDATORS:
             print(f"Running {description}...")
 
-            passed, stdout, stderr, duration = self.run_validator(
-                script_name, description
-            )
-            total_duration += duration
+            if self.isolated:
+                passed, stdout, stderr, duration = self.run_validator(
+                    script_name, description
+                )
+                total_duration += duration
+            else:
+                passed, stdout, stderr, duration = outcomes[script_name]
+            self.stage_timings[description] = duration
 
             self.results[script_name] = {
                 "description": description,
@@ -110,10 +292,18 @@ class ValidationTestRunner:
             print()
 
         print(f"Total execution time: {total_duration:.2f}s")
+        self.print_stage_timings()
         print("=" * 60)
 
         return all_passed
 
+    def print_stage_timings(self):
+        """Print how long each stage of the run took."""
+        mode = "subprocesses" if self.isolated else "in-process, concurrent"
+        print(f"Stage timings ({mode}):")
+        for stage, duration in self.stage_timings.items():
+            print(f"  {stage}: {duration:.2f}s")
+
     def print_detailed_results(self):
         """Print detailed results for each validator."""
         for _script_name, result in self.results.items():
@@ -164,11 +354,18 @@ class ValidationTestRunner:
     def check_dependencies(self) -> bool:
         """Check if all required dependencies are available."""
         python_exe = self.get_python_executable()
+        if not self.isolated:
+            python_exe = sys.executable
 
         required_modules = ["yaml", "voluptuous", "jsonschema"]
         missing_modules = []
 
         for module in required_modules:
+            if not self.isolated:
+                if importlib.util.find_spec(module) is None:
+                    missing_modules.append(module)
+                continue
+
             try:
                 result = subprocess.run(
                     [python_exe, "-c", f"import {module}"],
@@ -209,9 +406,37 @@ class ValidationTestRunner:
 
 def main():
     """Run main function for command line usage."""
-    config_dir = sys.argv[1] if len(sys.argv) > 1 else "config"
-
-    runner = ValidationTestRunner(config_dir)
+    parser = argparse.ArgumentParser(
+        description="Run all Home Assistant configuration validators"
+    )
+    parser.add_argument(
+        "config_dir", nargs="?", default="config", help="Path to HA config directory"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse YAML files instead of using .validator-cache/",
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each validator in its own Python subprocess",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only recheck files changed since the last successful validation",
+    )
+    args = parser.parse_args()
+    if args.incremental and args.isolated:
+        parser.error("--incremental cannot be combined with --isolated")
+
+    runner = ValidationTestRunner(
+        args.config_dir,
+        use_cache=not args.no_cache,
+        isolated=args.isolated,
+        incremental=args.incremental,
+    )
     success = runner.run()
 
     sys.exit(0 if success else 1)
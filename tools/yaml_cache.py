@@ -0,0 +1,248 @@
+"""On-disk cache of parsed YAML trees shared by the validators.
+
+Entries live in a .validator-cache/ directory next to the config directory, one
+pickle per source file. An entry is only used while the file's path, size,
+mtime and sha256 all still match, so any edit forces a re-parse. Validators can
+attach extra derived data (such as extracted references) to an entry; extras
+must be built from plain Python types so they unpickle in any process. Extras
+passed to load() are built from the fresh tree and written with it in one go.
+
+The cache directory is scanned once per instance; after that the sizes and use
+order of the entries are tracked in memory, so writes never rescan it.
+
+Without a cache directory the cache is memory-only: a per-run snapshot that
+lets several validators in one process share a single parse of each file.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import yaml
+
+CACHE_DIR_NAME = ".validator-cache"
+
+# Bump when the cached tree or extras change shape
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+Fingerprint = Tuple[int, int, str]
+
+# Builders of derived data stored with a freshly parsed tree, keyed by name
+ExtraBuilders = Dict[str, Callable[[Any], Any]]
+
+
+class YAMLCache:
+    """Parsed-YAML cache keyed by (path, size, mtime, sha256) with an LRU cap."""
+
+    def __init__(self, cache_dir: Optional[Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache; the directory is created on first write.
+
+        Pass cache_dir=None for a memory-only cache that is never persisted.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        # Entries and fingerprints already seen by this process, keyed by path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._fingerprints: Dict[str, Fingerprint] = {}
+
+        # Sizes of the entry files by name, least recently used first, and
+        # their total; None until the cache directory has been scanned
+        self._usage: Optional["OrderedDict[str, int]"] = None
+        self._usage_bytes = 0
+
+    def __reduce__(self):
+        """Pickle as a fresh instance so worker processes get an empty memo."""
+        return (self.__class__, (self.cache_dir, self.max_bytes))
+
+    @classmethod
+    def for_config_dir(cls, config_dir: Path) -> "YAMLCache":
+        """Get the default cache for a config directory."""
+        return cls(Path(config_dir).resolve().parent / CACHE_DIR_NAME)
+
+    def load(
+        self, file_path: Path, loader: Any, extras: Optional[ExtraBuilders] = None
+    ) -> Any:
+        """Parse a YAML file, reusing the cached tree if the file is unchanged.
+
+        On a re-parse each builder in extras is called with the tree and its
+        result is stored as that extra in the same write. Parse errors
+        propagate exactly as from yaml.load and are not cached.
+        """
+        entry = self._get_entry(file_path)
+        if entry is not None:
+            self.hits += 1
+            return entry["data"]
+
+        self.misses += 1
+        fingerprint = self._fingerprint(file_path)
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=loader)
+
+        self._write_entry(
+            file_path,
+            {
+                "version": CACHE_VERSION,
+                "path": _key(file_path),
+                "fingerprint": fingerprint,
+                "data": data,
+                "extras": {name: build(data) for name, build in (extras or {}).items()},
+            },
+        )
+        return data
+
+    def get_extra(self, file_path: Path, name: str) -> Optional[Any]:
+        """Get derived data stored alongside an unchanged file's tree."""
+        entry = self._get_entry(file_path)
+        if entry is None:
+            return None
+        return entry["extras"].get(name)
+
+    def set_extra(self, file_path: Path, name: str, value: Any):
+        """Store derived data alongside a file's cached tree.
+
+        Ignored if the file has no current entry (e.g. it failed to parse).
+        """
+        entry = self._get_entry(file_path)
+        if entry is None:
+            return
+        entry["extras"][name] = value
+        self._write_entry(file_path, entry)
+
+    def _get_entry(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Get the entry for a file if it matches the file on disk."""
+        key = _key(file_path)
+        try:
+            fingerprint = self._fingerprint(file_path)
+        except OSError:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None and entry["fingerprint"] == fingerprint:
+            return entry
+
+        if self.cache_dir is None:
+            return None
+
+        entry_file = self._entry_file(key)
+        try:
+            with open(entry_file, "rb") as f:
+                entry = pickle.load(f)
+        except Exception:
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != CACHE_VERSION
+            or entry.get("path") != key
+            or entry.get("fingerprint") != fingerprint
+        ):
+            return None
+
+        # Mark as recently used for LRU eviction, also by later runs
+        try:
+            os.utime(entry_file)
+        except OSError:
+            pass
+        if self._usage is not None and entry_file.name in self._usage:
+            self._usage.move_to_end(entry_file.name)
+
+        self._entries[key] = entry
+        return entry
+
+    def _write_entry(self, file_path: Path, entry: Dict[str, Any]):
+        """Atomically write an entry, then evict old entries over the cap."""
+        key = _key(file_path)
+        self._entries[key] = entry
+
+        if self.cache_dir is None:
+            return
+
+        usage = self._scan_usage()
+        entry_file = self._entry_file(key)
+        tmp_name = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                size = f.tell()
+            os.replace(tmp_name, entry_file)
+        except Exception:
+            # The cache is an optimization only; never fail validation over it
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            return
+
+        self._usage_bytes += size - usage.pop(entry_file.name, 0)
+        usage[entry_file.name] = size
+        self._evict()
+
+    def _scan_usage(self) -> "OrderedDict[str, int]":
+        """Get the entry file sizes, scanning the cache directory only once."""
+        if self._usage is not None:
+            return self._usage
+
+        assert self.cache_dir is not None
+        entries = []
+        for entry_file in self.cache_dir.glob("*.pickle"):
+            try:
+                stat = entry_file.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, entry_file.name, stat.st_size))
+        entries.sort()
+
+        self._usage = OrderedDict((name, size) for _mtime, name, size in entries)
+        self._usage_bytes = sum(self._usage.values())
+        return self._usage
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits max_bytes."""
+        if self.cache_dir is None or self._usage is None:
+            return
+
+        while self._usage_bytes > self.max_bytes and self._usage:
+            name, size = self._usage.popitem(last=False)
+            try:
+                (self.cache_dir / name).unlink()
+            except OSError:
+                pass
+            self._usage_bytes -= size
+
+    def _fingerprint(self, file_path: Path) -> Fingerprint:
+        """Get the (size, mtime, sha256) fingerprint of a file.
+
+        The content hash is only recomputed when size or mtime changed since
+        this process last hashed the file.
+        """
+        key = _key(file_path)
+        stat = os.stat(file_path)
+        known = self._fingerprints.get(key)
+        if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known
+
+        with open(file_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        fingerprint = (stat.st_size, stat.st_mtime_ns, digest)
+        self._fingerprints[key] = fingerprint
+        return fingerprint
+
+    def _entry_file(self, key: str) -> Path:
+        """Get the pickle file holding the entry for a source path."""
+        assert self.cache_dir is not None
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{name}.pickle"
+
+
+def _key(file_path: Path) -> str:
+    """Get the cache key for a source path."""
+    return str(Path(file_path).resolve())
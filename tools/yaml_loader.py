@@ -0,0 +1,50 @@
+"""Shared YAML loader for Home Assistant configuration files.
+
+HAYamlLoader uses libyaml's CSafeLoader when PyYAML was built with it and
+falls back to the pure-Python SafeLoader otherwise. Home Assistant specific
+tags are not resolved; they load as "!tag value" strings so validators can
+still see where includes, secrets and blueprint inputs are used.
+"""
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _BaseLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _BaseLoader  # type: ignore[assignment]
+
+LIBYAML_AVAILABLE = _BaseLoader is not yaml.SafeLoader
+
+# Tags that Home Assistant resolves itself when loading the configuration
+HA_TAGS = (
+    "!include",
+    "!include_dir_named",
+    "!include_dir_merge_named",
+    "!include_dir_merge_list",
+    "!include_dir_list",
+    "!input",
+    "!secret",
+)
+
+
+class HAYamlLoader(_BaseLoader):  # type: ignore[valid-type,misc]
+    """YAML loader for HA files, backed by libyaml when available."""
+
+    pass
+
+
+class PureHAYamlLoader(yaml.SafeLoader):
+    """Pure-Python YAML loader for HA files with the same tag handling."""
+
+    pass
+
+
+def ha_tag_constructor(loader, node):
+    """Handle an HA tag by keeping it as a '!tag value' string."""
+    value = loader.construct_scalar(node)
+    return f"{node.tag} {value}"
+
+
+for _tag in HA_TAGS:
+    HAYamlLoader.add_constructor(_tag, ha_tag_constructor)
+    PureHAYamlLoader.add_constructor(_tag, ha_tag_constructor)
@@ -1,90 +1,50 @@
 #!/usr/bin/env python3
 """YAML syntax validator for Home Assistant configuration files."""
 
+import argparse
 import sys
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Any, List, Optional, Tuple
 
 import yaml
 
-
-class HAYamlLoader(yaml.SafeLoader):
-    """Custom YAML loader that handles Home Assistant specific tags."""
-
-    pass
-
-
-def include_constructor(loader, node):
-    """Handle !include tag."""
-    filename = loader.construct_scalar(node)
-    return f"!include {filename}"
-
-
-def include_dir_named_constructor(loader, node):
-    """Handle !include_dir_named tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_named {dirname}"
-
-def include_dir_merge_named_constructor(loader, node):
-    """Handle !include_dir_merge_named tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_merge_named {dirname}"
-
-
-def include_dir_merge_list_constructor(loader, node):
-    """Handle !include_dir_merge_list tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_merge_list {dirname}"
-
-
-def include_dir_list_constructor(loader, node):
-    """Handle !include_dir_list tag."""
-    dirname = loader.construct_scalar(node)
-    return f"!include_dir_list {dirname}"
-
-
-def input_constructor(loader, node):
-    """Handle !input tag for blueprints."""
-    input_name = loader.construct_scalar(node)
-    return f"!input {input_name}"
-
-
-def secret_constructor(loader, node):
-    """Handle !secret tag."""
-    secret_name = loader.construct_scalar(node)
-    return f"!secret {secret_name}"
-
-
-# Register custom constructors
-HAYamlLoader.add_constructor("!include", include_constructor)
-HAYamlLoader.add_constructor(
-    "!include_dir_merge_named", include_dir_merge_named_constructor
-)
-HAYamlLoader.add_constructor(
-    "!include_dir_named", include_dir_named_constructor
-)
-HAYamlLoader.add_constructor(
-    "!include_dir_merge_list", include_dir_merge_list_constructor
-)
-HAYamlLoader.add_constructor("!include_dir_list", include_dir_list_constructor)
-HAYamlLoader.add_constructor("!input", input_constructor)
-HAYamlLoader.add_constructor("!secret", secret_constructor)
+try:
+    from tools.parallel import map_in_order, resolve_jobs
+    from tools.yaml_cache import CACHE_DIR_NAME, YAMLCache
+    from tools.yaml_loader import HAYamlLoader
+except ImportError:  # Run as a script from inside the tools directory
+    from parallel import map_in_order, resolve_jobs  # type: ignore[no-redef]
+    from yaml_cache import CACHE_DIR_NAME, YAMLCache  # type: ignore[no-redef]
+    from yaml_loader import HAYamlLoader  # type: ignore[no-redef]
 
 
 class YAMLValidator:
     """Validates YAML syntax and basic structure for Home Assistant files."""
 
-    def __init__(self, config_dir: str = "config"):
-        """Initialize the YAMLValidator."""
+    def __init__(self, config_dir: str = "config", cache: Optional[YAMLCache] = None):
+        """Initialize the YAMLValidator.
+
+        With a cache, each file is parsed at most once and unchanged files are
+        not parsed at all.
+        """
         self.config_dir = Path(config_dir)
+        self.cache = cache
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
+    def load_yaml(self, file_path: Path) -> Any:
+        """Parse a YAML file, through the parse cache when one is configured."""
+        if self.cache is not None:
+            return self.cache.load(file_path, HAYamlLoader)
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=HAYamlLoader)
+
     def validate_yaml_syntax(self, file_path: Path) -> bool:
         """Validate YAML syntax of a single file."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                yaml.load(f, Loader=HAYamlLoader)
+            self.load_yaml(file_path)
             return True
         except yaml.YAMLError as e:
             self.errors.append(f"{file_path}: YAML syntax error - {e}")
@@ -112,8 +72,7 @@ class YAMLValidator:
             return True
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                config = yaml.load(f, Loader=HAYamlLoader)
+            config = self.load_yaml(file_path)
 
             if not isinstance(config, dict):
                 self.errors.append(f"{file_path}: Configuration must be a dictionary")
@@ -140,8 +99,7 @@ class YAMLValidator:
             return True
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                automations = yaml.load(f, Loader=HAYamlLoader)
+            automations = self.load_yaml(file_path)
 
             if automations is None:
                 return True  # Empty file is valid
@@ -194,8 +152,7 @@ class YAMLValidator:
             return True
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                scripts = yaml.load(f, Loader=HAYamlLoader)
+            scripts = self.load_yaml(file_path)
 
             if scripts is None:
                 return True  # Empty file is valid
@@ -239,38 +196,57 @@ class YAMLValidator:
             yaml_files.extend(self.config_dir.glob(pattern))
 
         # Skip blueprints directory - these are templates and don't need validation
-        return yaml_files
+        return sorted(yaml_files)
+
+    def validate_file(self, file_path: Path) -> bool:
+        """Run encoding, syntax and structure checks on a single file."""
+        # Skip secrets.yaml as it may contain sensitive data
+        if file_path.name == "secrets.yaml":
+            return True
+
+        if not self.validate_file_encoding(file_path):
+            return False
+
+        if not self.validate_yaml_syntax(file_path):
+            return False
+
+        # Structure validation for specific files
+        self.validate_configuration_structure(file_path)
+        self.validate_automations_structure(file_path)
+        self.validate_scripts_structure(file_path)
+        return True
+
+    def validate_all(self, jobs: int = 1, files: Optional[List[Path]] = None) -> bool:
+        """Validate all YAML files in the config directory.
 
-    def validate_all(self) -> bool:
-        """Validate all YAML files in the config directory."""
+        With jobs > 1 (or 0 for one per CPU), files are checked in a process
+        pool and the results merged in file order, so output matches a serial
+        run. Pass files to only check that subset, e.g. for an incremental run.
+        """
         if not self.config_dir.exists():
             self.errors.append(f"Config directory {self.config_dir} does not exist")
             return False
 
-        yaml_files = self.get_yaml_files()
+        if files is not None:
+            yaml_files = sorted(files)
+        else:
+            yaml_files = self.get_yaml_files()
+            if not yaml_files:
+                self.warnings.append("No YAML files found in config directory")
         if not yaml_files:
-            self.warnings.append("No YAML files found in config directory")
             return True
 
-        all_valid = True
-
-        for file_path in yaml_files:
-            # Skip secrets.yaml as it may contain sensitive data
-            if file_path.name == "secrets.yaml":
-                continue
-
-            if not self.validate_file_encoding(file_path):
-                all_valid = False
-                continue
+        if resolve_jobs(jobs) <= 1:
+            results = [self.validate_file(file_path) for file_path in yaml_files]
+            return all(results)
 
-            if not self.validate_yaml_syntax(file_path):
+        worker = partial(_validate_file_worker, str(self.config_dir), self.cache)
+        all_valid = True
+        for valid, errors, warnings in map_in_order(worker, yaml_files, jobs):
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
+            if not valid:
                 all_valid = False
-                continue
-
-            # Structure validation for specific files
-            self.validate_configuration_structure(file_path)
-            self.validate_automations_structure(file_path)
-            self.validate_scripts_structure(file_path)
 
         return all_valid
 
@@ -296,12 +272,40 @@ class YAMLValidator:
             print("❌ YAML validation failed")
 
 
+def _validate_file_worker(
+    config_dir: str, cache: Optional[YAMLCache], file_path: Path
+) -> Tuple[bool, List[str], List[str]]:
+    """Validate one file in a worker process and return its messages."""
+    validator = YAMLValidator(config_dir, cache=cache)
+    valid = validator.validate_file(file_path)
+    return valid, validator.errors, validator.warnings
+
+
 def main():
     """Run YAML syntax validation from command line."""
-    config_dir = sys.argv[1] if len(sys.argv) > 1 else "config"
-
-    validator = YAMLValidator(config_dir)
-    is_valid = validator.validate_all()
+    parser = argparse.ArgumentParser(
+        description="Validate YAML syntax of HA configuration files"
+    )
+    parser.add_argument(
+        "config_dir", nargs="?", default="config", help="Path to HA config directory"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-parse files instead of using {CACHE_DIR_NAME}/",
+    )
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else YAMLCache.for_config_dir(args.config_dir)
+    validator = YAMLValidator(args.config_dir, cache=cache)
+    is_valid = validator.validate_all(jobs=args.jobs)
     validator.print_results()
 
     sys.exit(0 if is_valid else 1)